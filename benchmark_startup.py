@@ -0,0 +1,149 @@
+"""
+Startup benchmark for the werewolf package and self-play workers
+
+Measures:
+- import time of `werewolf`, `werewolf.orchestrator` and `run_selfplay`,
+  each in a fresh interpreter (like `python -c "import werewolf"`)
+- worker spawn latency: time until a new ProcessPoolExecutor worker has
+  imported `run_selfplay` (as `run_training` workers do) and returned, for
+  each multiprocessing start method available on this platform
+
+Usage:
+    python benchmark_startup.py
+    python benchmark_startup.py --repeat 10 --json startup.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MODULES = ["werewolf", "werewolf.orchestrator", "run_selfplay"]
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 2),
+        "min_ms": round(min(samples) * 1000, 2),
+        "max_ms": round(max(samples) * 1000, 2),
+    }
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": ROOT}
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def measure_import(module: str, repeat: int) -> Dict[str, Any]:
+    """Wall time of a fresh interpreter importing `module`, minus a bare one"""
+    baseline, samples = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        _run_python("pass")
+        baseline.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        result = _run_python(f"import {module}")
+        samples.append(time.perf_counter() - started)
+        if result.returncode != 0:
+            error = (result.stderr.strip().splitlines() or ["unknown error"])[-1]
+            return {"module": module, "error": error}
+
+    # Names of the third-party packages the import loaded
+    probe = _run_python(
+        f"import sys, {module}; "
+        "print(' '.join(sorted({m.split('.')[0] for m in sys.modules})))"
+    )
+    loaded = set(probe.stdout.split())
+    heavy = ["agentscope", "openai", "numpy", "torch", "transformers"]
+
+    stats = _summarize(samples)
+    stats["interpreter_ms"] = _summarize(baseline)["median_ms"]
+    stats["import_ms"] = round(stats["median_ms"] - stats["interpreter_ms"], 2)
+    stats["heavy_loaded"] = [m for m in heavy if m in loaded]
+    return {"module": module, **stats}
+
+
+def _worker_ready() -> int:
+    import run_selfplay  # noqa: F401  (what a self-play worker imports)
+
+    return os.getpid()
+
+
+def measure_spawn(method: str, repeat: int) -> Dict[str, Any]:
+    """Time from creating a one-worker pool to its first result"""
+    context = multiprocessing.get_context(method)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            try:
+                executor.submit(_worker_ready).result()
+            except Exception as e:
+                return {"start_method": method, "error": f"{type(e).__name__}: {e}"}
+            samples.append(time.perf_counter() - started)
+    return {"start_method": method, **_summarize(samples)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure package startup costs")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Samples per measurement (default: 5)"
+    )
+    parser.add_argument("--json", type=str, default=None, help="Write results here")
+    args = parser.parse_args()
+    repeat = max(1, args.repeat)
+
+    sys.path.insert(0, ROOT)
+    results = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "imports": [measure_import(m, repeat) for m in MODULES],
+        "worker_spawn": [
+            measure_spawn(m, repeat) for m in multiprocessing.get_all_start_methods()
+        ],
+    }
+
+    print(f"{'import':<26} {'median ms':>10} {'min ms':>8} {'max ms':>8}  heavy")
+    for entry in results["imports"]:
+        if "error" in entry:
+            print(f"{entry['module']:<26} FAILED: {entry['error']}")
+            continue
+        print(
+            f"{entry['module']:<26} {entry['import_ms']:>10.1f} "
+            f"{entry['min_ms'] - entry['interpreter_ms']:>8.1f} "
+            f"{entry['max_ms'] - entry['interpreter_ms']:>8.1f}  "
+            f"{', '.join(entry['heavy_loaded']) or '-'}"
+        )
+    print("(interpreter startup subtracted)\n")
+    print(f"{'worker spawn':<26} {'median ms':>10} {'min ms':>8} {'max ms':>8}")
+    for entry in results["worker_spawn"]:
+        if "error" in entry:
+            print(f"{entry['start_method']:<26} FAILED: {entry['error']}")
+            continue
+        print(
+            f"{entry['start_method']:<26} {entry['median_ms']:>10.1f} "
+            f"{entry['min_ms']:>8.1f} {entry['max_ms']:>8.1f}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
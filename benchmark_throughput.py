@@ -0,0 +1,331 @@
+"""
+End-to-end throughput benchmark of self-play games
+
+Runs N games of each game type through `WerewolfGameOrchestrator` (the async
+path used by `run_selfplay.py --scheduler async`) against the deterministic
+in-process `CannedModel`, then parses every transcript with the visualizer's
+`GameLogParser`. Games run one after another in a scratch directory, so the
+numbers measure this code base rather than a model API, and two runs with
+the same seed play the same games.
+
+Reported per game type:
+- games_per_hour:     games / wall time
+- llm_calls_per_game: model calls per game (total and per call site)
+- bytes_per_game:     transcript, event log, metrics and learning output
+- peak_rss_mb:        peak resident set size of the process so far
+- cpu_seconds:        process CPU time split into
+    engine        `WerewolfGame` rules engine
+    orchestrator  the rest of the game loop (agents, prompts, logging)
+    model         producing canned answers (the stand-in for the API)
+    learning      post-game review and strategy update, excluding model
+    parser        `GameLogParser.parse` of the finished transcript
+
+Usage:
+    python benchmark_throughput.py -n 20
+    python benchmark_throughput.py -n 50 -t six nine --json bench.json
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import datetime
+import functools
+import inspect
+import random
+import shutil
+import subprocess
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "visualization"))
+
+from werewolf import model_pool, orchestrator as orchestrator_module
+from werewolf.config import MODEL_CONFIGS
+from werewolf.orchestrator import WerewolfGameOrchestrator
+from werewolf.werewolf_game import WerewolfGame
+from parser import GameLogParser
+from run_selfplay import default_player_names
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+GAME_TYPES = ("six", "nine", "twelve")
+CONFIG_NAME = "benchmark_canned"
+CPU_CATEGORIES = ("engine", "orchestrator", "model", "learning", "parser")
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _dir_bytes(path: str) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            total += os.path.getsize(os.path.join(dirpath, name))
+    return total
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+class _EngineMeter:
+    """Thread CPU time spent in `WerewolfGame` methods (outermost calls only)"""
+
+    def __init__(self):
+        self.cpu_time = 0.0
+        self._local = threading.local()
+        self._originals: Dict[str, Any] = {}
+
+    def _wrap(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if getattr(self._local, "active", False):
+                return func(*args, **kwargs)
+            self._local.active = True
+            started = time.thread_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.cpu_time += time.thread_time() - started
+                self._local.active = False
+
+        return wrapper
+
+    def __enter__(self):
+        for name, attr in list(vars(WerewolfGame).items()):
+            if inspect.isfunction(attr) and not name.startswith("__"):
+                self._originals[name] = attr
+                setattr(WerewolfGame, name, self._wrap(attr))
+        return self
+
+    def __exit__(self, *exc):
+        for name, attr in self._originals.items():
+            setattr(WerewolfGame, name, attr)
+        self._originals.clear()
+
+
+def _canned_models() -> List[Any]:
+    """Pooled benchmark models: the game loop's and the background loop's"""
+    return [
+        model_pool.get_model(CONFIG_NAME, asyncio.get_running_loop()),
+        model_pool.get_model(CONFIG_NAME, model_pool.get_background_loop()),
+    ]
+
+
+async def _run_games(game_type: str, games: int, seed: int) -> Dict[str, Any]:
+    models = _canned_models()
+
+    def model_cpu() -> float:
+        return sum(m.cpu_time for m in models)
+
+    # Learning runs in a worker thread and calls the model on the background
+    # loop, so it is timed with process CPU minus the model's share
+    learning = {"cpu": 0.0}
+    run_learning_pipeline = orchestrator_module.run_learning_pipeline
+
+    @functools.wraps(run_learning_pipeline)
+    def timed_learning(*args, **kwargs):
+        cpu, model = time.process_time(), model_cpu()
+        try:
+            return run_learning_pipeline(*args, **kwargs)
+        finally:
+            learning["cpu"] += time.process_time() - cpu - (model_cpu() - model)
+
+    calls: List[int] = []
+    by_site: Dict[str, int] = {}
+    rounds: List[int] = []
+    winners: Dict[str, int] = {}
+    game_bytes = parser_cpu = 0.0
+    events = 0
+    bytes_before = _dir_bytes(".training")
+
+    orchestrator_module.run_learning_pipeline = timed_learning
+    try:
+        with _EngineMeter() as engine:
+            cpu_started, model_started = time.process_time(), model_cpu()
+            wall_started = time.perf_counter()
+            for i in range(games):
+                random.seed(seed + i)
+                orchestrator = WerewolfGameOrchestrator(
+                    player_names=default_player_names(game_type),
+                    model_config_name=CONFIG_NAME,
+                    game_type=game_type,
+                    verbose=False,
+                )
+                winner = await orchestrator.arun_game()
+                summary = orchestrator.get_game_summary()
+                winners[winner] = winners.get(winner, 0) + 1
+                rounds.append(summary["rounds"])
+                calls.append(summary["model_calls"]["calls"])
+                for site, stats in summary["model_calls"]["by_call_site"].items():
+                    by_site[site] = by_site.get(site, 0) + stats["calls"]
+
+                for path in (
+                    orchestrator.log_file,
+                    orchestrator.events_file,
+                    orchestrator.metrics_file,
+                ):
+                    if path and os.path.exists(path):
+                        game_bytes += os.path.getsize(path)
+
+                # What the visualizer does with each finished game
+                started = time.process_time()
+                parsed = GameLogParser(orchestrator.log_file).parse()
+                parser_cpu += time.process_time() - started
+                events += len(parsed["events"])
+            wall = time.perf_counter() - wall_started
+            cpu_total = time.process_time() - cpu_started
+            model_total = model_cpu() - model_started
+    finally:
+        orchestrator_module.run_learning_pipeline = run_learning_pipeline
+
+    cpu = {
+        "engine": engine.cpu_time,
+        "model": model_total,
+        "learning": learning["cpu"],
+        "parser": parser_cpu,
+    }
+    cpu["orchestrator"] = max(0.0, cpu_total - sum(cpu.values()))
+    cpu = {k: round(cpu[k], 4) for k in CPU_CATEGORIES}
+    cpu["total"] = round(cpu_total, 4)
+    all_bytes = _dir_bytes(".training") - bytes_before
+
+    return {
+        "games": games,
+        "wall_seconds": round(wall, 3),
+        "games_per_hour": round(games / wall * 3600, 1) if wall else None,
+        "rounds_per_game": round(sum(rounds) / games, 2),
+        "winners": winners,
+        "llm_calls_per_game": round(sum(calls) / games, 2),
+        "llm_calls_by_site": {k: round(v / games, 2) for k, v in by_site.items()},
+        "bytes_per_game": {
+            "game_logs": round(game_bytes / games),
+            "total": round(all_bytes / games),
+        },
+        "parsed_events_per_game": round(events / games, 1),
+        "peak_rss_mb": _peak_rss_mb(),
+        "cpu_seconds": cpu,
+        "cpu_ms_per_game": {k: round(v * 1000 / games, 2) for k, v in cpu.items()},
+    }
+
+
+def run_benchmark(
+    game_types: List[str],
+    games: int,
+    seed: int = 0,
+    latency: str = "fixed:0",
+    workdir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run the benchmark and return the JSON-serializable results
+
+    Args:
+        game_types: Game types to run, in order
+        games: Games per game type
+        seed: Seed of the game setup and of the canned answers
+        latency: Simulated model latency (see `mock_server.parse_latency`)
+        workdir: Scratch directory for logs and strategies (default: a
+            temporary directory, removed afterwards)
+    """
+    config = {
+        "config_name": CONFIG_NAME,
+        "model_type": "canned",
+        "seed": seed,
+        "latency": latency,
+    }
+    MODEL_CONFIGS.append(config)
+    model_pool.clear_model_pool()
+    scratch = workdir or tempfile.mkdtemp(prefix="werewolf_bench_")
+    cwd = os.getcwd()
+    os.chdir(scratch)
+    try:
+        os.makedirs(".training", exist_ok=True)
+        results = {}
+        for game_type in game_types:
+            results[game_type] = asyncio.run(_run_games(game_type, games, seed))
+    finally:
+        os.chdir(cwd)
+        MODEL_CONFIGS.remove(config)
+        model_pool.clear_model_pool()
+        if workdir is None:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    return {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "settings": {"games": games, "seed": seed, "latency": latency},
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark self-play game throughput")
+    parser.add_argument(
+        "-n", "--games", type=int, default=20, help="Games per game type (default: 20)"
+    )
+    parser.add_argument(
+        "-t",
+        "--types",
+        nargs="+",
+        default=list(GAME_TYPES),
+        choices=GAME_TYPES,
+        help="Game types to run (default: all)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--latency",
+        type=str,
+        default="fixed:0",
+        help="Simulated model latency, e.g. fixed:0.01 (default: %(default)s)",
+    )
+    parser.add_argument("--json", type=str, default=None, help="Write results here")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.types, max(1, args.games), args.seed, args.latency)
+
+    print(
+        f"{'type':<8} {'games/h':>10} {'calls/game':>11} {'KB/game':>8} "
+        f"{'RSS MB':>7}  cpu ms/game: {' '.join(CPU_CATEGORIES)}"
+    )
+    for game_type, result in report["results"].items():
+        per_game = result["cpu_ms_per_game"]
+        print(
+            f"{game_type:<8} {result['games_per_hour']:>10.0f} "
+            f"{result['llm_calls_per_game']:>11.1f} "
+            f"{result['bytes_per_game']['total'] / 1024:>8.1f} "
+            f"{result['peak_rss_mb'] or 0:>7.1f}  "
+            + " ".join(f"{per_game[c]:.1f}" for c in CPU_CATEGORIES)
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
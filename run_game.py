@@ -15,6 +15,7 @@ Tip: For local models via Ollama, ensure Ollama is running and set --model ollam
 from __future__ import annotations
 
 import argparse
+import random
 import sys
 
 try:
@@ -31,12 +32,14 @@ from werewolf.config import (
     MODEL_CONFIGS,
     DEFAULT_MODEL,
     GAME_CONFIG,
+    RESPONSE_CACHE_CONFIG,
     PLAYER_NAMES_6,
     PLAYER_NAMES_9,
     PLAYER_NAMES_12,
     get_available_model,
 )
 from werewolf.orchestrator import WerewolfGameOrchestrator
+from werewolf.response_cache import configure_response_cache
 
 
 def parse_args() -> argparse.Namespace:
@@ -76,6 +79,23 @@ def parse_args() -> argparse.Namespace:
         default="",
         help="Comma-separated custom player names (overrides presets)",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for role assignment (for reproducible/cached runs)",
+    )
+    parser.add_argument(
+        "--cache",
+        choices=["off", "readwrite", "readonly", "record", "replay"],
+        default=None,
+        help="LLM response cache mode (default: from RESPONSE_CACHE_CONFIG)",
+    )
+    parser.add_argument(
+        "--cache-path",
+        default=RESPONSE_CACHE_CONFIG["path"],
+        help="LLM response cache database file",
+    )
     return parser.parse_args()
 
 
@@ -114,6 +134,20 @@ def main():
 
     ags_init(project="werewolf_game", name=f"game_{args.game_type}")
 
+    if args.cache == "off":
+        configure_response_cache(None)
+    elif args.cache:
+        configure_response_cache(
+            args.cache_path,
+            args.cache,
+            RESPONSE_CACHE_CONFIG.get("max_entries"),
+            RESPONSE_CACHE_CONFIG.get("max_bytes"),
+        )
+        print(f"   LLM response cache: {args.cache} ({args.cache_path})")
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
     players = pick_players(
         args.game_type,
         [p.strip() for p in args.players.split(",") if p.strip()] or None,
@@ -3,26 +3,34 @@ Self-play training script for Werewolf game
 Runs multiple games to iteratively improve agent strategies through learning
 
 Features:
-- Resumable: can be interrupted and resumed from latest strategies
+- Resumable: can be interrupted and resumed from latest strategies; games
+  cut off mid-way continue from their last phase checkpoint
 - Progress tracking: saves metadata about training progress
-- Parallel execution: optional multi-process parallelization
+- Parallel execution: optional multi-process parallelization, or an asyncio
+  scheduler running hundreds of games concurrently in one process
 - Strategy persistence: automatically loads/saves strategies between games
 """
 
 import os
 import sys
 import json
+import asyncio
 import datetime
 import argparse
+import glob
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Callable, Tuple
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from werewolf.orchestrator import WerewolfGameOrchestrator
 from werewolf.config import MODEL_CONFIGS
 
+if TYPE_CHECKING:
+    # Imported when the first game starts: the orchestrator pulls in the
+    # agents and AgentScope, which workers should not pay for at spawn
+    from werewolf.orchestrator import WerewolfGameOrchestrator
+
 
 def ensure_directories():
     """Ensure required directories exist"""
@@ -53,12 +61,196 @@ def save_training_progress(progress: Dict[str, Any]):
         json.dump(progress, f, indent=2, ensure_ascii=False)
 
 
+def _process_alive(pid: int) -> bool:
+    """Whether another process with this pid is still running"""
+    if pid == os.getpid():
+        return False
+    if os.name == "nt":
+        # os.kill would terminate the process on Windows; assume it is gone
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# Suffix of a checkpoint claimed by a resuming process: `<file>.resuming.<pid>`
+CLAIM_SUFFIX = ".resuming."
+
+
+def _claim_checkpoint(path: str) -> Optional[str]:
+    """Take a checkpoint over for this process, or None if another one did
+
+    Renaming is atomic, so of several processes racing for the same file
+    only one succeeds; the others no longer find the source.
+    """
+    claimed = f"{path.split(CLAIM_SUFFIX)[0]}{CLAIM_SUFFIX}{os.getpid()}"
+    try:
+        os.rename(path, claimed)
+    except OSError:
+        return None
+    return claimed
+
+
+def find_interrupted_games(game_type: str, limit: Optional[int] = None) -> List[str]:
+    """Claim the checkpoints of unfinished games whose process is gone
+
+    The orchestrator writes `<log>.checkpoint.json` after every phase and
+    removes it when the game ends, so leftovers belong to interrupted games.
+    Each one is claimed by renaming it to `<file>.resuming.<pid>` before it
+    is returned, so runs started side by side never resume the same game;
+    checkpoints another run claimed first are skipped. Claims of processes
+    that died before writing a newer checkpoint are taken over in turn.
+
+    Args:
+        game_type: Only games of this type are resumed
+        limit: Stop after claiming this many games (None = all of them)
+
+    Returns:
+        Paths of the claimed checkpoint files
+    """
+    pattern = os.path.join(".training", "game_logs", "*.checkpoint.json")
+    paths = glob.glob(pattern) + glob.glob(f"{pattern}{CLAIM_SUFFIX}*")
+    interrupted = []
+    for path in sorted(paths):
+        if limit is not None and len(interrupted) >= limit:
+            break
+        if CLAIM_SUFFIX in path:
+            base, _, pid = path.rpartition(CLAIM_SUFFIX)
+            # Still held by this or another live process
+            if not pid.isdigit() or int(pid) == os.getpid():
+                continue
+            if _process_alive(int(pid)):
+                continue
+            if os.path.exists(base):
+                # Superseded by the newer checkpoint the resumer wrote
+                continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if checkpoint.get("game_type") != game_type:
+            continue
+        if _process_alive(checkpoint.get("pid", -1)):
+            continue
+        claimed = _claim_checkpoint(path)
+        if claimed:
+            interrupted.append(claimed)
+    return interrupted
+
+
+def default_player_names(game_type: str) -> List[str]:
+    """Preset player names for a game type"""
+    if game_type == "six":
+        return ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"]
+    elif game_type == "nine":
+        return [
+            "Alice",
+            "Bob",
+            "Charlie",
+            "David",
+            "Eve",
+            "Frank",
+            "Grace",
+            "Henry",
+            "Ivy",
+        ]
+    else:  # twelve
+        return [
+            "Alice",
+            "Bob",
+            "Charlie",
+            "David",
+            "Eve",
+            "Frank",
+            "Grace",
+            "Henry",
+            "Ivy",
+            "Jack",
+            "Kate",
+            "Leo",
+        ]
+
+
+def _create_orchestrator(
+    game_num: int,
+    model_config_name: str,
+    game_type: str,
+    player_names: List[str],
+    verbose: bool,
+    checkpoint: Optional[str],
+) -> "WerewolfGameOrchestrator":
+    from werewolf.orchestrator import WerewolfGameOrchestrator
+
+    if verbose:
+        print(
+            f"\n[Game {game_num}] (1) Loading strategy prompts from .training/strategies/"
+        )
+
+    if checkpoint:
+        # Continue an interrupted game with the state it was saved with
+        orchestrator = WerewolfGameOrchestrator.resume_from(checkpoint, verbose=verbose)
+    else:
+        # Create orchestrator (will auto-load strategies from .training/strategies/)
+        orchestrator = WerewolfGameOrchestrator(
+            player_names=player_names,
+            model_config_name=model_config_name,
+            game_type=game_type,
+            max_rounds=20,
+            verbose=verbose,
+        )
+
+    if verbose:
+        print(f"[Game {game_num}] (2) Injected prompts into {len(player_names)} agents")
+        print(f"[Game {game_num}] (3) Starting self-play game...")
+    return orchestrator
+
+
+def _game_result(
+    game_num: int, orchestrator: "WerewolfGameOrchestrator", winner: str, verbose: bool
+) -> Dict[str, Any]:
+    summary = orchestrator.get_game_summary()
+
+    if verbose:
+        print(f"[Game {game_num}] (4) Game finished. Winner: {winner}")
+        print(f"[Game {game_num}] (5) LLM reviewing results & optimizing strategies...")
+        print(f"[Game {game_num}] (6) Strategies updated and saved")
+
+    return {
+        "game_num": game_num,
+        "winner": winner,
+        "rounds": summary["rounds"],
+        "log_file": orchestrator.log_file,
+        "success": True,
+    }
+
+
+def _failed_result(game_num: int, error: Exception) -> Dict[str, Any]:
+    print(f"[ERROR] Game {game_num} failed: {error}")
+    import traceback
+
+    traceback.print_exc()
+    return {
+        "game_num": game_num,
+        "winner": None,
+        "rounds": 0,
+        "log_file": None,
+        "success": False,
+        "error": str(error),
+    }
+
+
 def run_single_game(
     game_num: int,
     model_config_name: str,
     game_type: str = "six",
     player_names: Optional[list] = None,
     verbose: bool = False,
+    checkpoint: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Run a single game and return summary
 
@@ -68,94 +260,154 @@ def run_single_game(
         game_type: Game type (six, nine, twelve)
         player_names: List of player names (default: Alice, Bob, Charlie, David, Eve, Frank)
         verbose: Print game progress
+        checkpoint: Checkpoint file of an interrupted game to finish instead
+            of starting a new one
 
     Returns:
         Game summary dict with winner, rounds, etc.
     """
-    if player_names is None:
-        if game_type == "six":
-            player_names = ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"]
-        elif game_type == "nine":
-            player_names = [
-                "Alice",
-                "Bob",
-                "Charlie",
-                "David",
-                "Eve",
-                "Frank",
-                "Grace",
-                "Henry",
-                "Ivy",
-            ]
-        else:  # twelve
-            player_names = [
-                "Alice",
-                "Bob",
-                "Charlie",
-                "David",
-                "Eve",
-                "Frank",
-                "Grace",
-                "Henry",
-                "Ivy",
-                "Jack",
-                "Kate",
-                "Leo",
-            ]
-
+    player_names = player_names or default_player_names(game_type)
     try:
-        if verbose:
-            print(
-                f"\n[Game {game_num}] (1) Loading strategy prompts from .training/strategies/"
-            )
+        orchestrator = _create_orchestrator(
+            game_num, model_config_name, game_type, player_names, verbose, checkpoint
+        )
+        # Run game
+        winner = orchestrator.run_game()
+        return _game_result(game_num, orchestrator, winner, verbose)
+    except Exception as e:
+        return _failed_result(game_num, e)
 
-        # Create orchestrator (will auto-load strategies from .training/strategies/)
-        orchestrator = WerewolfGameOrchestrator(
-            player_names=player_names,
-            model_config_name=model_config_name,
-            game_type=game_type,
-            max_rounds=20,
-            verbose=verbose,
+
+async def arun_single_game(
+    game_num: int,
+    model_config_name: str,
+    game_type: str = "six",
+    player_names: Optional[list] = None,
+    verbose: bool = False,
+    checkpoint: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Async counterpart of `run_single_game` (see `arun_game`)"""
+    player_names = player_names or default_player_names(game_type)
+    try:
+        # Loading strategies and checkpoints reads files; keep it off the loop
+        orchestrator = await asyncio.to_thread(
+            _create_orchestrator,
+            game_num,
+            model_config_name,
+            game_type,
+            player_names,
+            verbose,
+            checkpoint,
         )
+        winner = await orchestrator.arun_game()
+        return _game_result(game_num, orchestrator, winner, verbose)
+    except Exception as e:
+        return _failed_result(game_num, e)
 
-        if verbose:
-            print(
-                f"[Game {game_num}] (2) Injected prompts into {len(player_names)} agents"
-            )
-            print(f"[Game {game_num}] (3) Starting self-play game...")
 
-        # Run game
-        winner = orchestrator.run_game()
-        summary = orchestrator.get_game_summary()
+async def arun_games(
+    games: List[Tuple[int, Optional[str]]],
+    model_config_name: str,
+    game_type: str = "six",
+    verbose: bool = False,
+    concurrency: int = 200,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Run games concurrently on the current event loop
 
-        if verbose:
-            print(f"[Game {game_num}] (4) Game finished. Winner: {winner}")
-            print(
-                f"[Game {game_num}] (5) LLM reviewing results & optimizing strategies..."
+    Games are almost entirely waits on the model API, so one process can
+    keep hundreds in flight. All of them share the process-wide model pool,
+    i.e. one HTTP client per model config. `concurrency` workers take games
+    from the list one at a time, so at most that many games (and their
+    coroutines) exist at once; the next one starts as soon as one finishes.
+
+    Args:
+        games: (game number, checkpoint file or None) of each game
+        model_config_name: Model configuration to use
+        game_type: Game type (six, nine, twelve)
+        verbose: Print game progress
+        concurrency: Maximum number of games in flight
+        on_result: Called with each result as soon as its game finishes
+
+    Returns:
+        Results in completion order
+    """
+    pending = iter(games)
+    results = []
+
+    async def worker():
+        for game_num, checkpoint in pending:
+            result = await arun_single_game(
+                game_num, model_config_name, game_type, None, verbose, checkpoint
             )
-            print(f"[Game {game_num}] (6) Strategies updated and saved")
+            if on_result:
+                on_result(result)
+            results.append(result)
+
+    workers = min(max(1, concurrency), len(games))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return results
+
+
+def run_async_shard(
+    games: List[Tuple[int, Optional[str]]],
+    model_config_name: str,
+    game_type: str,
+    verbose: bool,
+    concurrency: int,
+) -> List[Dict[str, Any]]:
+    """Run a share of the games on a fresh event loop (one shard process)"""
+    return asyncio.run(
+        arun_games(games, model_config_name, game_type, verbose, concurrency)
+    )
 
-        return {
-            "game_num": game_num,
+
+def _record_result(
+    progress: Dict[str, Any],
+    stats: Dict[str, int],
+    result: Dict[str, Any],
+    current_game: int,
+):
+    """Add a finished game to the statistics and progress history"""
+    if not result["success"]:
+        stats["errors"] += 1
+        return
+    winner = result["winner"]
+    rounds = result["rounds"]
+
+    # Update stats
+    if winner == "werewolves":
+        stats["werewolf_wins"] += 1
+    elif winner == "villagers":
+        stats["villager_wins"] += 1
+    else:
+        stats["draws"] += 1
+    stats["total_rounds"] += rounds
+
+    # Save to progress
+    progress["games_history"].append(
+        {
+            "game_num": current_game,
             "winner": winner,
-            "rounds": summary["rounds"],
-            "log_file": orchestrator.log_file,
-            "success": True,
+            "rounds": rounds,
+            "log_file": result["log_file"],
+            "timestamp": datetime.datetime.now().isoformat(),
         }
+    )
 
-    except Exception as e:
-        print(f"[ERROR] Game {game_num} failed: {e}")
-        import traceback
-
-        traceback.print_exc()
-        return {
-            "game_num": game_num,
-            "winner": None,
-            "rounds": 0,
-            "log_file": None,
-            "success": False,
-            "error": str(e),
-        }
+
+def _print_result_line(
+    stats: Dict[str, int], result: Dict[str, Any], current_game: int, last_game: int
+):
+    """One-line result of a game finishing out of order (parallel modes)"""
+    if result["success"]:
+        print(
+            f"[{current_game}/{last_game}] "
+            f"Winner: {result['winner']:12s} | Rounds: {result['rounds']:2d} | "
+            f"W:{stats['werewolf_wins']} V:{stats['villager_wins']} D:{stats['draws']}"
+        )
+    else:
+        print(f"[{current_game}/{last_game}] FAILED")
 
 
 def run_training(
@@ -165,6 +417,9 @@ def run_training(
     parallel: int = 1,
     verbose: bool = False,
     resume: bool = True,
+    scheduler: str = "process",
+    concurrency: int = 200,
+    shards: int = 1,
 ):
     """Run self-play training with strategy prompt iteration loop
 
@@ -180,9 +435,17 @@ def run_training(
         num_games: Number of games to run
         model_config_name: Model configuration to use
         game_type: Game type (six, nine, twelve)
-        parallel: Number of parallel workers (1 = sequential)
+        parallel: Number of parallel workers (1 = sequential); process
+            scheduler only
         verbose: Print detailed game progress
-        resume: Continue from previous training progress
+        resume: Continue from previous training progress and finish
+            interrupted games (counted towards `num_games`) before new ones
+        scheduler: "process" (one worker process per game in flight) or
+            "async" (games run concurrently on an event loop, see
+            `arun_games`)
+        concurrency: Maximum games in flight in async mode (over all shards)
+        shards: Number of processes the async scheduler splits games across;
+            results of a shard are reported when the whole shard finishes
     """
     ensure_directories()
 
@@ -200,6 +463,10 @@ def run_training(
 
     start_game = progress["total_games"]
 
+    # Checkpoint to resume for each scheduled game (None = new game)
+    interrupted = find_interrupted_games(game_type, num_games) if resume else []
+    checkpoints = interrupted + [None] * (num_games - len(interrupted))
+
     # Find model display name
     model_display = model_config_name
     for config in MODEL_CONFIGS:
@@ -226,8 +493,13 @@ def run_training(
     print(f"Total games to run: {num_games}")
     print(f"Starting from game: {start_game + 1}")
     print(f"Strategy iterations completed: {progress.get('strategy_iterations', 0)}")
-    print(f"Parallel workers: {parallel}")
+    if scheduler == "async":
+        print(f"Async scheduler: {concurrency} games in flight, {shards} shard(s)")
+    else:
+        print(f"Parallel workers: {parallel}")
     print(f"Resume mode: {resume}")
+    if interrupted:
+        print(f"Interrupted games to resume: {len(interrupted)}")
     print(f"\nTraining Loop:")
     print(f"  1)  Load Strategy Prompts (.training/strategies/)")
     print(f"  2)  Inject Prompts -> Agents")
@@ -247,7 +519,57 @@ def run_training(
     }
 
     try:
-        if parallel > 1:
+        if scheduler == "async":
+            print(
+                f"Running {num_games} games on the async scheduler "
+                f"({concurrency} in flight)...\n"
+            )
+            games = [(start_game + i + 1, checkpoints[i]) for i in range(num_games)]
+            completed = 0
+
+            def report(result: Dict[str, Any]):
+                nonlocal completed
+                completed += 1
+                _record_result(progress, stats, result, result["game_num"])
+                _print_result_line(
+                    stats, result, result["game_num"], start_game + num_games
+                )
+
+                # Update progress periodically
+                progress["total_games"] = start_game + completed
+                if completed % max(1, num_games // 10) == 0:
+                    save_training_progress(progress)
+
+            if shards > 1:
+                per_shard = max(1, -(-concurrency // shards))
+                with ProcessPoolExecutor(max_workers=shards) as executor:
+                    futures = [
+                        executor.submit(
+                            run_async_shard,
+                            games[shard::shards],
+                            model_config_name,
+                            game_type,
+                            verbose,
+                            per_shard,
+                        )
+                        for shard in range(shards)
+                    ]
+                    for future in as_completed(futures):
+                        for result in future.result():
+                            report(result)
+            else:
+                asyncio.run(
+                    arun_games(
+                        games,
+                        model_config_name,
+                        game_type,
+                        verbose,
+                        concurrency,
+                        on_result=report,
+                    )
+                )
+
+        elif parallel > 1:
             # Parallel execution
             print(f"Running {num_games} games in parallel with {parallel} workers...\n")
 
@@ -261,6 +583,7 @@ def run_training(
                         game_type,
                         None,
                         verbose,
+                        checkpoints[i],
                     ): i
                     for i in range(num_games)
                 }
@@ -271,38 +594,10 @@ def run_training(
                     game_idx = futures[future]
                     current_game = start_game + game_idx + 1
 
-                    if result["success"]:
-                        winner = result["winner"]
-                        rounds = result["rounds"]
-
-                        # Update stats
-                        if winner == "werewolves":
-                            stats["werewolf_wins"] += 1
-                        elif winner == "villagers":
-                            stats["villager_wins"] += 1
-                        else:
-                            stats["draws"] += 1
-                        stats["total_rounds"] += rounds
-
-                        # Save to progress
-                        progress["games_history"].append(
-                            {
-                                "game_num": current_game,
-                                "winner": winner,
-                                "rounds": rounds,
-                                "log_file": result["log_file"],
-                                "timestamp": datetime.datetime.now().isoformat(),
-                            }
-                        )
-
-                        print(
-                            f"[{current_game}/{start_game + num_games}] "
-                            f"Winner: {winner:12s} | Rounds: {rounds:2d} | "
-                            f"W:{stats['werewolf_wins']} V:{stats['villager_wins']} D:{stats['draws']}"
-                        )
-                    else:
-                        stats["errors"] += 1
-                        print(f"[{current_game}/{start_game + num_games}] FAILED")
+                    _record_result(progress, stats, result, current_game)
+                    _print_result_line(
+                        stats, result, current_game, start_game + num_games
+                    )
 
                     # Update progress periodically
                     progress["total_games"] = current_game
@@ -318,39 +613,20 @@ def run_training(
                 print(f"\n[Game {current_game}/{start_game + num_games}]")
 
                 result = run_single_game(
-                    current_game, model_config_name, game_type, None, verbose
+                    current_game,
+                    model_config_name,
+                    game_type,
+                    None,
+                    verbose,
+                    checkpoints[i],
                 )
 
+                _record_result(progress, stats, result, current_game)
                 if result["success"]:
-                    winner = result["winner"]
-                    rounds = result["rounds"]
-
-                    # Update stats
-                    if winner == "werewolves":
-                        stats["werewolf_wins"] += 1
-                    elif winner == "villagers":
-                        stats["villager_wins"] += 1
-                    else:
-                        stats["draws"] += 1
-                    stats["total_rounds"] += rounds
-
-                    # Save to progress
-                    progress["games_history"].append(
-                        {
-                            "game_num": current_game,
-                            "winner": winner,
-                            "rounds": rounds,
-                            "log_file": result["log_file"],
-                            "timestamp": datetime.datetime.now().isoformat(),
-                        }
-                    )
-
                     print(
-                        f"Winner: {winner} | Rounds: {rounds} | "
+                        f"Winner: {result['winner']} | Rounds: {result['rounds']} | "
                         f"Cumulative - W:{stats['werewolf_wins']} V:{stats['villager_wins']} D:{stats['draws']}"
                     )
-                else:
-                    stats["errors"] += 1
 
                 # Update progress after each game
                 progress["total_games"] = current_game
@@ -433,6 +709,27 @@ def main():
         default=1,
         help="Number of parallel workers (default: 1, max: 22)",
     )
+    parser.add_argument(
+        "--scheduler",
+        type=str,
+        default="process",
+        choices=["process", "async"],
+        help="process: one worker process per game in flight (default); "
+        "async: run many games concurrently on an event loop",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=200,
+        help="Games in flight with --scheduler async (default: 200)",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Processes to split async games across (default: 1)",
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Print detailed game progress"
     )
@@ -461,6 +758,9 @@ def main():
         parallel=parallel,
         verbose=args.verbose,
         resume=not args.no_resume,
+        scheduler=args.scheduler,
+        concurrency=max(1, args.concurrency),
+        shards=max(1, min(22, args.shards)),
     )
 
 
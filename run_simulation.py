@@ -0,0 +1,85 @@
+"""
+Headless rule-balance simulation for the Werewolf game (no LLM calls).
+
+Plays many games with scripted policies straight against the rules engine
+and reports win rates per game type.
+
+Usage:
+  python run_simulation.py -n 10000 --policy seer_trusting
+  python run_simulation.py -n 5000 -t six nine --policy random --seed 42
+  python run_simulation.py -n 1000000 --batch   # vectorized random policy (numpy)
+"""
+
+import argparse
+import json
+
+from werewolf.simulator import POLICIES, simulate
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run headless Werewolf simulations with scripted policies"
+    )
+    parser.add_argument(
+        "-n",
+        "--num-games",
+        type=int,
+        default=10000,
+        help="Games per game type (default: 10000)",
+    )
+    parser.add_argument(
+        "-t",
+        "--types",
+        nargs="+",
+        default=["six", "nine", "twelve"],
+        choices=["six", "nine", "twelve"],
+        help="Game types to simulate (default: all)",
+    )
+    parser.add_argument(
+        "--policy",
+        default="random",
+        choices=sorted(POLICIES),
+        help="Scripted policy (default: random)",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument(
+        "--max-rounds", type=int, default=20, help="Max day/night rounds per game"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Use the vectorized NumPy engine (random policy only)",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print results as JSON lines"
+    )
+    args = parser.parse_args()
+    if args.batch and args.policy != "random":
+        parser.error("--batch only supports --policy random")
+
+    for game_type in args.types:
+        if args.batch:
+            from werewolf.batch_game import simulate_batch
+
+            result = simulate_batch(
+                game_type, args.num_games, args.seed, args.max_rounds
+            ).to_dict()
+        else:
+            result = simulate(
+                game_type, args.num_games, args.policy, args.seed, args.max_rounds
+            ).to_dict()
+        if args.json:
+            print(json.dumps(result))
+            continue
+        print(
+            f"{game_type:7s} {args.policy:14s} games={result['games']:<7d} "
+            f"werewolves={result['werewolf_win_rate']:.3f} "
+            f"villagers={result['villager_win_rate']:.3f} "
+            f"draws={result['draw_rate']:.3f} "
+            f"avg_rounds={result['avg_rounds']:.2f} "
+            f"({result['games_per_second']:.0f} games/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -588,5 +588,53 @@ class TestStrategyRules(unittest.TestCase):
         self.assertIn("Watch voting patterns", prompt)
 
 
+class TestAsyncAgentAPI(unittest.TestCase):
+    """Test async counterparts of agent actions"""
+
+    @patch("werewolf.agents._run_model_async")
+    @patch("werewolf.agents.AgentBase.__init__")
+    def test_async_vote_matches_sync_prompt(self, mock_init, mock_model_async):
+        """Test that avote sends the same prompt as vote and parses the result"""
+        import asyncio
+
+        mock_init.return_value = None
+        mock_response = Mock()
+        mock_response.content = "VOTE: Bob"
+        mock_model_async.return_value = mock_response
+
+        agent = VillagerAgent(
+            name="TestVillager", role=Role.VILLAGER, model_config_name="test_model"
+        )
+        agent.model = Mock()
+
+        vote = asyncio.run(agent.avote("Game context", ["Alice", "Bob"]))
+
+        self.assertEqual(vote, "Bob")
+        prompt = mock_model_async.call_args[0][1][0].content
+        self.assertEqual(prompt, agent._vote_prompt("Game context", ["Alice", "Bob"]))
+
+    @patch("werewolf.agents._run_model_async")
+    @patch("werewolf.agents.AgentBase.__init__")
+    def test_async_witch_save_updates_potions(self, mock_init, mock_model_async):
+        """Test that anight_action_save consumes the antidote like the sync path"""
+        import asyncio
+
+        mock_init.return_value = None
+        mock_response = Mock()
+        mock_response.content = "YES"
+        mock_model_async.return_value = mock_response
+
+        agent = WitchAgent(
+            name="TestWitch", role=Role.WITCH, model_config_name="test_model"
+        )
+        agent.model = Mock()
+
+        saved = asyncio.run(agent.anight_action_save("Alice", "Game context"))
+
+        self.assertTrue(saved)
+        self.assertTrue(agent.antidote_used)
+        self.assertEqual(agent.saved_player, "Alice")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,131 @@
+"""
+Unit tests for the visualizer's view endpoints (needs Flask)
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "visualization")
+)
+
+try:
+    import flask
+except ImportError:  # pragma: no cover
+    flask = None
+
+if flask is not None:
+    import app as viewer
+    from game_cache import ParsedGameCache
+    from sessions import SessionStore
+    from state_manager import GameStateManager
+
+SEP = "=" * 60
+
+GAME = f"""Game Type: six
+Players: Alice, Bob, Carol
+{SEP}
+ROUND 1
+{SEP}
+
+[NIGHT PHASE]
+
+[MORNING]
+  [DEAD] Bob died during the night (werewolf_kill)
+
+[VOTING]
+  Alice votes for: Carol
+  Bob votes for: Carol
+
+[ELIMINATED] Carol was eliminated by vote!
+   Role: werewolf
+"""
+
+GAME_OVER = f"""
+{SEP}
+GAME OVER
+{SEP}
+[WINNER] VILLAGERS
+Rounds played: 1
+"""
+
+
+@unittest.skipUnless(flask is not None, "flask not installed")
+class TestViewEndpoints(unittest.TestCase):
+    """Test the view cookie round trip and the stateless state endpoint"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        for name, text in (("game.txt", GAME + GAME_OVER), ("partial.txt", GAME)):
+            with open(os.path.join(self.temp_dir, name), "w", encoding="utf-8") as f:
+                f.write(text)
+
+        for name, value in (
+            ("get_game_logs_directory", lambda: Path(self.temp_dir)),
+            ("game_cache", ParsedGameCache()),
+            ("sessions", SessionStore()),
+        ):
+            patcher = patch.object(viewer, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = viewer.app.test_client()
+
+    def _view_cookie(self, response) -> str:
+        cookies = response.headers.getlist("Set-Cookie")
+        return next(c for c in cookies if c.startswith(viewer.VIEW_COOKIE + "="))
+
+    def test_cookie_round_trip(self):
+        """Test that the cookie restores a session another worker started"""
+        response = self.client.get("/api/load/game.txt")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(":0:game.txt", self._view_cookie(response))
+
+        response = self.client.get("/api/next")
+        self.assertEqual(response.get_json()["event_index"], 1)
+        self.assertIn(":1:game.txt", self._view_cookie(response))
+
+        # A worker that never saw this browser rebuilds the session
+        with patch.object(viewer, "sessions", SessionStore()):
+            response = self.client.get("/api/next")
+        self.assertEqual(response.get_json()["event_index"], 2)
+        self.assertIn(":2:game.txt", self._view_cookie(response))
+
+    def test_incomplete_game_cookie_is_rejected(self):
+        """Test that a cookie cannot open a game api/load would refuse"""
+        self.assertEqual(self.client.get("/api/load/partial.txt").status_code, 400)
+
+        client = viewer.app.test_client(use_cookies=False)
+        cookie = f"{viewer.VIEW_COOKIE}=someone:0:partial.txt"
+        response = client.get("/api/next", headers={"Cookie": cookie})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(viewer.sessions), 0)
+
+    def test_stateless_state_reuses_snapshots(self):
+        """Test /api/state?game=&event= without rebuilding the snapshots"""
+        build = GameStateManager._build_snapshots
+        with patch.object(
+            GameStateManager, "_build_snapshots", autospec=True, side_effect=build
+        ) as spy:
+            first = self.client.get("/api/state?game=game.txt&event=2").get_json()
+            last = self.client.get("/api/state?game=game.txt&event=7").get_json()
+
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(first["event_index"], 2)
+        self.assertEqual(first["player_states"]["Bob"]["status"], "dead")
+        self.assertEqual(last["player_states"]["Carol"]["status"], "dead")
+        self.assertEqual(last["player_states"]["Carol"]["role"], "werewolf")
+
+        bad = self.client.get("/api/state?game=game.txt&event=99")
+        self.assertEqual(bad.status_code, 400)
+        missing = self.client.get("/api/state?game=../secret.txt")
+        self.assertEqual(missing.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
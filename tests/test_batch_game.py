@@ -0,0 +1,155 @@
+"""
+Unit tests for the vectorized batch engine
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from werewolf.werewolf_game import Role
+
+
+@unittest.skipUnless(np is not None, "numpy not installed")
+class TestBatchWerewolfGame(unittest.TestCase):
+    """Test batch rules against the scalar engine's rules"""
+
+    def _game(self, roles):
+        from werewolf.batch_game import BatchWerewolfGame, ROLE_CODES
+
+        game = BatchWerewolfGame(1, "six", np.random.default_rng(0))
+        game.roles[:] = [[ROLE_CODES[r] for r in roles]]
+        game._is_wolf = game.has_role(Role.WEREWOLF)
+        game._is_villager = game.has_role(Role.VILLAGER)
+        game._is_god = (
+            game.has_role(Role.SEER)
+            | game.has_role(Role.WITCH)
+            | game.has_role(Role.HUNTER)
+            | game.has_role(Role.GUARDIAN)
+        )
+        return game
+
+    def test_role_assignment_matches_preset(self):
+        """Test that every game gets a permutation of the preset"""
+        from werewolf.batch_game import BatchWerewolfGame, ROLE_CODES
+
+        game = BatchWerewolfGame(500, "nine", np.random.default_rng(1))
+        counts = (game.roles == ROLE_CODES[Role.WEREWOLF]).sum(axis=1)
+        self.assertTrue((counts == 3).all())
+        self.assertTrue((game.roles == ROLE_CODES[Role.HUNTER]).sum(axis=1).all())
+        # Shuffled independently per game
+        self.assertGreater(len({tuple(r) for r in game.roles}), 1)
+
+    def test_role_counts_match_scalar_engine(self):
+        """Test that both engines deal the same roles for short tables"""
+        import random
+
+        from werewolf.batch_game import BatchWerewolfGame, ROLE_CODES
+        from werewolf.werewolf_game import WerewolfGame
+
+        random.seed(2)
+        names = [f"P{i}" for i in range(7)]
+        scalar = [WerewolfGame(names, "nine").state.roles for _ in range(4000)]
+        batch = BatchWerewolfGame(4000, "nine", np.random.default_rng(2), 7)
+        for role in Role:
+            scalar_mean = np.mean([list(r.values()).count(role) for r in scalar])
+            batch_mean = (batch.roles == ROLE_CODES[role]).sum(axis=1).mean()
+            self.assertAlmostEqual(batch_mean, scalar_mean, delta=0.05, msg=role)
+
+    def test_save_and_poison_in_one_night(self):
+        """Test that a save is kept and the poison unused when both are asked"""
+        game = self._game(
+            [Role.WEREWOLF, Role.WEREWOLF, Role.VILLAGER, Role.VILLAGER,
+             Role.SEER, Role.WITCH]
+        )
+        wolves = np.array([[2, 2, -1, -1, -1, -1]])
+        death, poisoned = game.execute_night_phase(
+            wolves, saves=np.array([True]), poison_targets=np.array([0])
+        )
+        self.assertEqual((death[0], poisoned[0]), (-1, -1))
+        self.assertTrue(game.alive.all())
+        self.assertTrue(game.antidote_used[0])
+        self.assertFalse(game.poison_used[0])
+
+    def test_day_vote_tie_eliminates_nobody(self):
+        """Test that a tied day vote eliminates nobody"""
+        game = self._game(
+            [Role.WEREWOLF, Role.WEREWOLF, Role.VILLAGER, Role.VILLAGER,
+             Role.SEER, Role.WITCH]
+        )
+        eliminated = game.execute_day_phase(np.array([[2, 2, 0, 0, -1, -1]]))
+        self.assertEqual(eliminated[0], -1)
+        self.assertTrue(game.alive.all())
+
+        eliminated = game.execute_day_phase(np.array([[2, 2, 0, 0, 2, -1]]))
+        self.assertEqual(eliminated[0], 2)
+        self.assertEqual(game.death_records(0), {2: "voted_out"})
+
+    def test_guarded_and_saved_victim_dies(self):
+        """Test the guardian + antidote rule"""
+        game = self._game(
+            [Role.WEREWOLF, Role.WEREWOLF, Role.VILLAGER, Role.GUARDIAN,
+             Role.SEER, Role.WITCH]
+        )
+        wolves = np.array([[3, 3, -1, -1, -1, -1]])
+        death, _ = game.execute_night_phase(
+            wolves, guard_targets=np.array([3]), saves=np.array([True])
+        )
+        self.assertEqual(death[0], 3)
+        self.assertTrue(game.antidote_used[0])
+
+    def test_guarded_victim_survives(self):
+        """Test that a guarded victim survives and repeat guarding fails"""
+        game = self._game(
+            [Role.WEREWOLF, Role.WEREWOLF, Role.VILLAGER, Role.GUARDIAN,
+             Role.SEER, Role.WITCH]
+        )
+        wolves = np.array([[2, 2, -1, -1, -1, -1]])
+        death, _ = game.execute_night_phase(wolves, guard_targets=np.array([2]))
+        self.assertEqual(death[0], -1)
+
+        death, _ = game.execute_night_phase(wolves, guard_targets=np.array([2]))
+        self.assertEqual(death[0], 2)
+
+    def test_check_game_end(self):
+        """Test villager and werewolf victory conditions"""
+        game = self._game(
+            [Role.WEREWOLF, Role.WEREWOLF, Role.VILLAGER, Role.VILLAGER,
+             Role.SEER, Role.WITCH]
+        )
+        ended, _ = game.check_game_end()
+        self.assertFalse(ended[0])
+
+        game.alive[0, [0, 1]] = False
+        ended, winner = game.check_game_end()
+        self.assertTrue(ended[0])
+        self.assertEqual(winner[0], 2)
+
+        game.alive[0] = [True, True, False, False, True, False]
+        ended, winner = game.check_game_end()
+        self.assertEqual(winner[0], 1)
+
+    def test_win_rates_match_scalar_simulator(self):
+        """Test that the batch random policy matches the scalar random policy"""
+        from werewolf.batch_game import simulate_batch
+        from werewolf.simulator import simulate
+
+        for game_type in ["six", "twelve"]:
+            batch = simulate_batch(game_type, 20000, seed=5)
+            scalar = simulate(game_type, 3000, "random", seed=5)
+            self.assertAlmostEqual(
+                batch.werewolf_wins / batch.games,
+                scalar.werewolf_wins / scalar.games,
+                delta=0.03,
+            )
+            self.assertAlmostEqual(
+                batch.total_rounds / batch.games,
+                scalar.total_rounds / scalar.games,
+                delta=0.15,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
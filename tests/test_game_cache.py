@@ -0,0 +1,137 @@
+"""
+Unit tests for the visualizer's bounded parsed game cache
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "visualization")
+)
+
+from game_cache import ParsedGameCache
+
+SEP = "=" * 60
+
+
+def transcript(winner: str) -> str:
+    return f"""Game Type: six
+Players: Alice, Bob
+{SEP}
+ROUND 1
+{SEP}
+
+{SEP}
+GAME OVER
+{SEP}
+[WINNER] {winner}
+Rounds played: 1
+"""
+
+
+class TestParsedGameCache(unittest.TestCase):
+    """Test LRU eviction, invalidation and counters"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name: str, text: str, mtime: float = 1000) -> str:
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_hits_and_invalidation(self):
+        """Test that a rewritten log is parsed again"""
+        cache = ParsedGameCache()
+        path = self._write("a.txt", transcript("VILLAGERS"))
+
+        first = cache.get(path)
+        self.assertIs(cache.get(path), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # Touched only: same size, new mtime
+        os.utime(path, (2000, 2000))
+        self.assertIsNot(cache.get(path), first)
+
+        # Rewritten in place with the same mtime, but a new size
+        self._write("a.txt", transcript("WEREWOLVES"), mtime=2000)
+        parsed = cache.get(path)
+        self.assertEqual(parsed["game_info"]["winner"], "WEREWOLVES")
+        self.assertEqual((cache.misses, cache.invalidations), (3, 2))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.total_bytes, os.path.getsize(path))
+
+    def test_max_entries(self):
+        """Test that the least recently used game is evicted"""
+        cache = ParsedGameCache(max_entries=2)
+        a, b, c = (
+            self._write(f"{name}.txt", transcript("VILLAGERS")) for name in "abc"
+        )
+        cache.get(a)
+        cache.get(b)
+        cache.get(a)
+        cache.get(c)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        cache.get(a)
+        self.assertEqual(cache.hits, 2)
+        cache.get(b)
+        self.assertEqual(cache.misses, 4)
+
+    def test_max_bytes(self):
+        """Test eviction by total log size"""
+        size = len(transcript("VILLAGERS").encode("utf-8"))
+        cache = ParsedGameCache(max_entries=None, max_bytes=size * 2)
+        for name in "abc":
+            cache.get(self._write(f"{name}.txt", transcript("VILLAGERS")))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.total_bytes, size * 2)
+
+        # A single game larger than the limit is still kept
+        cache = ParsedGameCache(max_bytes=1)
+        cache.get(self._write("d.txt", transcript("VILLAGERS")))
+        self.assertEqual(len(cache), 1)
+
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.0)
+
+    def test_derived_values(self):
+        """Test that derived values are built once per parse of the log"""
+        cache = ParsedGameCache()
+        path = self._write("a.txt", transcript("VILLAGERS"))
+        builds = []
+
+        def build(parsed):
+            builds.append(parsed)
+            return parsed["game_info"]["winner"]
+
+        first = cache.get_derived(path, "winner", build)
+        self.assertIs(cache.get_derived(path, "winner", build)[0], first[0])
+        self.assertEqual((first[1], len(builds)), ("VILLAGERS", 1))
+
+        # A new parse drops the old value
+        self._write("a.txt", transcript("WEREWOLVES"), mtime=2000)
+        parsed, winner = cache.get_derived(path, "winner", build)
+        self.assertEqual((winner, len(builds)), ("WEREWOLVES", 2))
+        self.assertIs(builds[-1], parsed)
+
+    def test_missing_file(self):
+        """Test that a missing log raises instead of being cached"""
+        cache = ParsedGameCache()
+        with self.assertRaises(OSError):
+            cache.get(os.path.join(self.temp_dir, "missing.txt"))
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
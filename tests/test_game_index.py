@@ -0,0 +1,145 @@
+"""
+Unit tests for the visualizer's persistent game index
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "visualization")
+)
+
+from game_index import GameIndex
+
+SEP = "=" * 60
+
+COMPLETED = f"""Game Type: nine
+Players: Alice, Bob, Charlie
+{SEP}
+ROUND 1
+{SEP}
+
+[NIGHT PHASE]
+
+{SEP}
+ROUND 2
+{SEP}
+
+{SEP}
+GAME OVER
+{SEP}
+[WINNER] VILLAGERS
+Rounds played: 2
+"""
+
+IN_PROGRESS = f"""Game Type: six
+Players: Alice, Bob
+{SEP}
+ROUND 1
+{SEP}
+"""
+
+
+class TestGameIndex(unittest.TestCase):
+    """Test incremental indexing of a logs directory"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.logs_dir = os.path.join(self.temp_dir, "game_logs")
+        os.makedirs(self.logs_dir)
+        self.db_path = os.path.join(self.temp_dir, "cache", "index.sqlite")
+        self.index = GameIndex(self.db_path)
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name: str, text: str, mtime: float = None):
+        path = os.path.join(self.logs_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def test_summaries(self):
+        """Test the indexed fields and the completed-only listing"""
+        self._write("a.txt", COMPLETED, mtime=1000)
+        self._write("b.txt", IN_PROGRESS, mtime=2000)
+        self._write("notes.md", "not a log")
+
+        counts = self.index.refresh(self.logs_dir)
+        self.assertEqual(counts["added"], 2)
+
+        games = self.index.games(self.logs_dir)
+        self.assertEqual([g["filename"] for g in games], ["b.txt", "a.txt"])
+        self.assertEqual(games[1]["game_type"], "nine")
+        self.assertEqual(games[1]["player_count"], 3)
+        self.assertEqual(games[1]["rounds"], 2)
+        self.assertEqual(games[1]["winner"], "VILLAGERS")
+        self.assertEqual(games[1]["modified"], 1000)
+        self.assertTrue(games[1]["completed"])
+        self.assertFalse(games[0]["completed"])
+
+        completed = self.index.games(self.logs_dir, completed_only=True)
+        self.assertEqual([g["filename"] for g in completed], ["a.txt"])
+
+    def test_incremental_refresh(self):
+        """Test that only new or changed files are parsed again"""
+        self._write("a.txt", COMPLETED)
+        path = self._write("b.txt", IN_PROGRESS)
+        self.index.refresh(self.logs_dir)
+        self.assertEqual(self.index.parsed, 2)
+
+        counts = self.index.refresh(self.logs_dir)
+        self.assertEqual(counts["unchanged"], 2)
+        self.assertEqual(self.index.parsed, 2)
+
+        # The game in progress finishes and another one is deleted
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(f"\n{SEP}\nGAME OVER\n{SEP}\n[WINNER] WEREWOLVES\n")
+        os.remove(os.path.join(self.logs_dir, "a.txt"))
+        counts = self.index.refresh(self.logs_dir)
+        self.assertEqual((counts["updated"], counts["removed"]), (1, 1))
+        self.assertEqual(self.index.parsed, 3)
+
+        games = self.index.games(self.logs_dir, completed_only=True)
+        self.assertEqual(
+            [(g["filename"], g["winner"]) for g in games], [("b.txt", "WEREWOLVES")]
+        )
+
+    def test_persistent_and_shared(self):
+        """Test that a second index on the same file reuses and sees updates"""
+        self._write("a.txt", COMPLETED)
+        self.index.refresh(self.logs_dir)
+        self.assertEqual(len(self.index.games(self.logs_dir)), 1)
+
+        other = GameIndex(self.db_path)
+        try:
+            self._write("b.txt", IN_PROGRESS)
+            counts = other.refresh(self.logs_dir)
+            self.assertEqual((counts["added"], counts["unchanged"]), (1, 1))
+        finally:
+            other.close()
+
+        # The cached listing notices the other connection's commit
+        self.assertEqual(len(self.index.games(self.logs_dir)), 2)
+
+    def test_refresh_interval(self):
+        """Test that refreshes within the interval are skipped"""
+        index = GameIndex(self.db_path, refresh_interval=60)
+        try:
+            self.assertIsNotNone(index.refresh(self.logs_dir))
+            self._write("a.txt", COMPLETED)
+            self.assertIsNone(index.refresh(self.logs_dir))
+            self.assertEqual(index.games(self.logs_dir), [])
+            self.assertEqual(index.refresh(self.logs_dir, force=True)["added"], 1)
+        finally:
+            index.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
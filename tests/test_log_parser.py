@@ -0,0 +1,249 @@
+"""
+Unit tests for the visualizer's streaming game log parser
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "visualization")
+)
+
+from parser import GameLogParser
+
+SEP = "=" * 60
+
+TRANSCRIPT = f"""{"=" * 80}
+WEREWOLF GAME - COMPLETE TRANSCRIPT
+{"=" * 80}
+Game Type: six
+Players: Alice, Bob, Charlie, David, Eve, Frank
+{"=" * 80}
+Created 6 agents
+Werewolf team: Alice, David
+
+Player Roles:
+  Alice: werewolf
+  Bob: villager
+  Charlie: witch
+  David: werewolf
+  Eve: hunter
+  Frank: seer
+{SEP}
+WEREWOLF GAME STARTING
+{SEP}
+
+{SEP}
+ROUND 1
+{SEP}
+
+[NIGHT PHASE]
+
+[GUARDIAN] Protecting...
+
+[WEREWOLVES] Choosing target...
+  Alice targets: Eve
+  David targets: Eve
+
+[SEER] Checking...
+  Frank checks: Alice
+
+[WITCH] Deciding...
+  Charlie does not save Eve
+  Charlie poisons Bob
+
+[SEER] Learning...
+  Frank learned: Alice is werewolf
+
+[MORNING] Announcement:
+  [DEAD] Eve died during the night (werewolf_kill)
+
+[LAST WORDS] Eve's final statement:
+  Eve: Avenge me.
+
+[HUNTER SKILL] Eve activates hunter ability!
+  Eve shoots David!
+  David (werewolf) is killed!
+  [DEAD] Bob died during the night (witch_poison)
+
+[LAST WORDS] Bob's final statement:
+  Bob: So long.
+
+[DAY PHASE]
+
+[DISCUSSION] Day 1
+Alive players: Alice, Charlie, Frank
+
+--- Discussion Round 1 ---
+Alice: I am a villager.
+Still, keep an eye on Frank.
+Charlie: Frank, what did you see?
+Frank: Alice is a werewolf.
+
+[VOTING] Voting Phase
+  Alice votes for: Frank
+  Charlie votes for: Alice
+  Frank votes for: Alice
+
+[ELIMINATED] Alice was eliminated by vote!
+   Role: werewolf
+
+[LAST WORDS] Alice's final statement:
+  Alice: Well played.
+
+{SEP}
+GAME OVER
+{SEP}
+[WINNER] VILLAGERS
+Rounds played: 1
+
+[FINAL ROLES]
+  [ALIVE] Charlie: witch
+  [DEAD] Alice: werewolf
+
+[LEARNING] Reviews and lessons saved to: reviews
+"""
+
+
+class TestGameLogParser(unittest.TestCase):
+    """Test events, players and game info parsed from a transcript"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "game.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, text: str):
+        with open(self.path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+
+    def test_events_in_log_order(self):
+        """Test every event kind, numbered in the order of the log"""
+        self._write(TRANSCRIPT)
+        events = GameLogParser(self.path).parse()["events"]
+
+        self.assertEqual(
+            [(e.phase, e.event_type) for e in events],
+            [
+                ("night", "phase_start"),
+                ("night", "guardian_action"),
+                ("night", "werewolf_target"),
+                ("night", "seer_check"),
+                ("night", "witch_save"),
+                ("night", "witch_poison"),
+                ("night", "seer_result"),
+                ("morning", "death_announcement"),
+                ("morning", "last_words"),
+                ("morning", "hunter_skill"),
+                ("morning", "death_announcement"),
+                ("morning", "last_words"),
+                ("day", "phase_start"),
+                ("day", "alive_players"),
+                ("day", "discussion"),
+                ("day", "discussion"),
+                ("day", "discussion"),
+                ("voting", "phase_start"),
+                ("voting", "vote"),
+                ("voting", "vote"),
+                ("voting", "vote"),
+                ("voting", "vote_summary"),
+                ("voting", "elimination"),
+                ("voting", "last_words"),
+            ],
+        )
+        self.assertEqual([e.timestamp for e in events], list(range(len(events))))
+        self.assertTrue(all(e.round_num == 1 for e in events))
+
+        by_type = {}
+        for event in events:
+            by_type.setdefault(event.event_type, []).append(event.data)
+        self.assertEqual(by_type["guardian_action"], [{"action": "no_protection"}])
+        self.assertEqual(
+            by_type["werewolf_target"], [{"targets": {"Alice": "Eve", "David": "Eve"}}]
+        )
+        self.assertEqual(
+            by_type["witch_poison"],
+            [{"witch": "Charlie", "used": True, "poison_target": "Bob"}],
+        )
+        self.assertEqual(
+            by_type["hunter_skill"],
+            [{"hunter": "Eve", "target": "David", "target_role": "werewolf"}],
+        )
+        # Statements may continue over several lines
+        self.assertEqual(
+            by_type["discussion"][0],
+            {
+                "speaker": "Alice",
+                "statement": "I am a villager.\nStill, keep an eye on Frank.",
+            },
+        )
+        self.assertEqual(
+            by_type["vote_summary"],
+            [{"votes": {"Frank": ["Alice"], "Alice": ["Charlie", "Frank"]}}],
+        )
+
+    def test_players_and_game_info(self):
+        """Test roles, deaths and the game over section"""
+        self._write(TRANSCRIPT)
+        result = GameLogParser(self.path).parse()
+
+        players = result["players"]
+        self.assertEqual(players["Bob"].role, "villager")
+        self.assertEqual(players["Bob"].death_reason, "witch_poison")
+        self.assertEqual(players["David"].death_reason, "hunter_shot")
+        self.assertEqual(players["Alice"].death_reason, "eliminated")
+        self.assertEqual(players["Charlie"].status, "alive")
+
+        info = result["game_info"]
+        self.assertEqual(info["game_type"], "six")
+        self.assertEqual(info["werewolf_team"], ["Alice", "David"])
+        self.assertTrue(info["game_completed"])
+        self.assertEqual(info["winner"], "VILLAGERS")
+        self.assertEqual(info["rounds_played"], 1)
+        self.assertEqual(info["final_roles"], {"Charlie": "witch", "Alice": "werewolf"})
+
+    def test_growing_log(self):
+        """Test that a log parsed while it is written yields the same events"""
+        expected = self._parse_whole(TRANSCRIPT)
+
+        vote = "Frank votes for: Alice\n"
+        last_vote = TRANSCRIPT.index(vote) + len(vote)
+        self._write(TRANSCRIPT[:last_vote])
+        parser = GameLogParser(self.path)
+        events = list(parser.iter_events(final=False))
+        # The vote summary waits for the line after the last vote
+        self.assertEqual(events[-1].event_type, "vote")
+
+        data = TRANSCRIPT[last_vote:].encode("utf-8")
+        for start in range(0, len(data), 37):
+            with open(self.path, "ab") as f:
+                f.write(data[start : start + 37])
+            events.extend(parser.iter_events(final=False))
+        events.extend(parser.iter_events())
+
+        self.assertEqual(events, expected)
+
+    def test_incomplete_game(self):
+        """Test a log cut off mid-day, with Windows line endings"""
+        cut = TRANSCRIPT[: TRANSCRIPT.index("[ELIMINATED]")]
+        self._write(cut.replace("\n", "\r\n"))
+        result = GameLogParser(self.path).parse()
+
+        self.assertFalse(result["game_info"]["game_completed"])
+        self.assertEqual(result["events"][-1].event_type, "vote_summary")
+        self.assertEqual(result["events"], self._parse_whole(cut))
+
+    def _parse_whole(self, text: str):
+        path = os.path.join(self.temp_dir, "whole.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return GameLogParser(path).parse()["events"]
+
+
+if __name__ == "__main__":
+    unittest.main()
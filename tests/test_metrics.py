@@ -0,0 +1,136 @@
+"""
+Unit tests for model call instrumentation
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from werewolf.agents import _run_model_async
+from werewolf.metrics import ModelCallMetrics, aggregate, extract_usage, read_metrics
+
+
+class TestModelCallMetrics(unittest.TestCase):
+    """Test recording and aggregation of model calls"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "game.metrics.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_extract_usage_formats(self):
+        """Test that AgentScope and OpenAI style usage are both read"""
+        agentscope = SimpleNamespace(
+            usage=SimpleNamespace(input_tokens=12, output_tokens=3)
+        )
+        openai = SimpleNamespace(usage={"prompt_tokens": 7, "completion_tokens": 2})
+
+        self.assertEqual(extract_usage(agentscope), (12, 3))
+        self.assertEqual(extract_usage(openai), (7, 2))
+        self.assertEqual(extract_usage("cached text"), (None, None))
+
+    def test_aggregate_percentiles(self):
+        """Test nearest-rank latency percentiles and token totals"""
+        metrics = ModelCallMetrics()
+        for i in range(1, 21):
+            metrics.record("vote", "m", wall_time=i, prompt_tokens=10)
+        summary = aggregate(metrics.records)
+
+        self.assertEqual(summary["calls"], 20)
+        self.assertEqual(summary["latency_p50"], 10)
+        self.assertEqual(summary["latency_p95"], 19)
+        self.assertEqual(summary["latency_max"], 20)
+        self.assertEqual(summary["prompt_tokens"], 200)
+        self.assertEqual(summary["completion_tokens"], 0)
+
+    def test_summary_groups_and_jsonl(self):
+        """Test per call site/role/phase groups and the JSONL file"""
+        metrics = ModelCallMetrics(self.path, flush_interval=None)
+        metrics.set_position(1, "night")
+        metrics.record("night_action", "m", 0.5, agent="Bob", role="werewolf")
+        metrics.set_position(1, "day")
+        metrics.record("vote", "m", 0.2, agent="Bob", role="werewolf")
+        metrics.record("vote", "m", 0.1, agent="Eve", role="witch", retries=2)
+        metrics.close()
+
+        summary = metrics.summary()
+        self.assertEqual(summary["calls"], 3)
+        self.assertEqual(summary["retries"], 2)
+        self.assertEqual(summary["by_call_site"]["vote"]["calls"], 2)
+        self.assertEqual(summary["by_role"]["werewolf"]["calls"], 2)
+        self.assertEqual(summary["by_phase"]["night"]["calls"], 1)
+
+        records = read_metrics(self.path)
+        self.assertEqual([r["seq"] for r in records], [0, 1, 2])
+        self.assertEqual(records[0]["phase"], "night")
+        self.assertEqual(records, metrics.records)
+
+        resumed = ModelCallMetrics(self.path, append=True)
+        self.assertEqual(len(resumed.records), 3)
+        self.assertEqual(resumed.record("vote", "m", 0.1)["seq"], 3)
+
+
+class TestModelCallInstrumentation(unittest.TestCase):
+    """Test that _run_model_async records each call"""
+
+    def test_records_retries_and_tokens(self):
+        """Test that a call that recovers after a network error is recorded once"""
+        attempts = []
+
+        async def flaky_model(messages):
+            attempts.append(messages)
+            if len(attempts) == 1:
+                raise RuntimeError("peer closed connection")
+            return SimpleNamespace(
+                content="ok", usage=SimpleNamespace(input_tokens=5, output_tokens=1)
+            )
+
+        async def no_sleep(seconds):
+            return None
+
+        metrics = ModelCallMetrics()
+        with patch("werewolf.agents.asyncio.sleep", no_sleep):
+            asyncio.run(
+                _run_model_async(
+                    flaky_model,
+                    [{"role": "user", "content": "hi"}],
+                    metrics=metrics,
+                    call_site="discuss",
+                    agent="Alice",
+                    role="seer",
+                )
+            )
+
+        self.assertEqual(len(metrics.records), 1)
+        record = metrics.records[0]
+        self.assertEqual(record["call_site"], "discuss")
+        self.assertEqual(record["agent"], "Alice")
+        self.assertEqual(record["retries"], 1)
+        self.assertEqual(record["prompt_tokens"], 5)
+        self.assertEqual(record["completion_tokens"], 1)
+        self.assertIsNone(record["error"])
+
+    def test_records_final_failure(self):
+        """Test that a failing call is recorded with its error"""
+
+        async def broken_model(messages):
+            raise ValueError("bad request")
+
+        metrics = ModelCallMetrics()
+        with self.assertRaises(ValueError):
+            asyncio.run(
+                _run_model_async(broken_model, [], metrics=metrics, call_site="vote")
+            )
+
+        self.assertEqual(metrics.records[0]["error"], "bad request")
+        self.assertEqual(metrics.summary()["errors"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+Unit tests for the mock model server
+"""
+
+import http.client
+import json
+import random
+import unittest
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+from werewolf.agents import SeerAgent, VillagerAgent, WerewolfAgent, WitchAgent
+from werewolf.mock_server import CannedResponder, MockModelServer, parse_latency
+from werewolf.werewolf_game import Role
+
+PLAYERS = ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"]
+CONTEXT = f"Round: 1\nPhase: day\nDay: 1\n\nAlive Players (6):\n{', '.join(PLAYERS)}"
+
+
+def _post(url, body, timeout=5):
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(body).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    return urllib.request.urlopen(request, timeout=timeout)
+
+
+class TestCannedResponder(unittest.TestCase):
+    """Test answers to the prompts the agents actually build"""
+
+    @patch("werewolf.agents.AgentBase.__init__", return_value=None)
+    def setUp(self, mock_init):
+        self.responder = CannedResponder(seed=1)
+        self.villager = VillagerAgent("Alice", Role.VILLAGER, "mock_openai")
+        self.wolf = WerewolfAgent("Bob", Role.WEREWOLF, "mock_openai")
+        self.seer = SeerAgent("Charlie", Role.SEER, "mock_openai")
+        self.witch = WitchAgent("Eve", Role.WITCH, "mock_openai")
+
+    def answer(self, prompt):
+        return self.responder.respond([{"role": "user", "content": prompt}])
+
+    def test_votes_and_targets_use_valid_names(self):
+        """Test that choices name a listed player in the parsed format"""
+        vote = self.answer(self.villager._vote_prompt(CONTEXT, PLAYERS))
+        self.assertTrue(vote.startswith("VOTE: "))
+        self.assertIn(self.villager._parse_vote(vote, PLAYERS), PLAYERS)
+
+        targets = ["Alice", "David"]
+        kill = self.answer(self.wolf._night_action_prompt(CONTEXT, targets, ["Bob"]))
+        self.assertIn(kill, targets)
+
+        check = self.answer(self.seer._night_action_prompt(CONTEXT, ["Eve", "Frank"]))
+        self.assertIn(check, ["Eve", "Frank"])
+
+    def test_witch_answers(self):
+        """Test YES/NO for the antidote and POISON/PASS for the poison"""
+        save = self.answer(self.witch._save_prompt("Bob", CONTEXT))
+        self.assertIn(save, ["YES", "NO"])
+        self.assertEqual(
+            self.responder.kind(self.witch._poison_prompt(CONTEXT, PLAYERS)),
+            "witch_poison",
+        )
+        self.responder.poison_rate = 1.0
+        poison = self.answer(self.witch._poison_prompt(CONTEXT, ["Frank"]))
+        self.assertEqual(poison, "POISON: Frank")
+
+    def test_discussion_is_deterministic_and_names_players(self):
+        """Test that the same prompt gets the same statement"""
+        prompt = self.villager._discuss_prompt(CONTEXT, [])
+        statement = self.answer(prompt)
+        self.assertEqual(statement, self.answer(prompt))
+        self.assertTrue(any(name in statement for name in PLAYERS))
+        self.assertEqual(self.responder.kind(prompt), "discuss")
+
+    def test_review_json(self):
+        """Test that the review answer parses and covers every player"""
+        prompt = (
+            "You are a Werewolf-game analyst. Read the full game transcript\n"
+            "Players and roles: Alice(villager), Bob(werewolf)\n"
+        )
+        data = json.loads(self.answer(prompt))
+        self.assertEqual(set(data["per_player"]), {"Alice", "Bob"})
+        self.assertEqual(set(data["lessons"]), {"Villager", "Werewolf"})
+
+
+class TestParseLatency(unittest.TestCase):
+    """Test latency specs"""
+
+    def test_distributions(self):
+        rng = random.Random(0)
+        self.assertEqual(parse_latency("fixed:0.25")(rng), 0.25)
+        self.assertTrue(0.1 <= parse_latency("uniform:0.1,0.2")(rng) <= 0.2)
+        self.assertGreater(parse_latency("lognormal:0.8,0.5")(rng), 0)
+        with self.assertRaises(ValueError):
+            parse_latency("gamma:1")
+        with self.assertRaises(ValueError):
+            parse_latency("uniform:1")
+
+
+class TestMockModelServer(unittest.TestCase):
+    """Test the HTTP protocols and fault injection"""
+
+    def setUp(self):
+        self.server = MockModelServer(port=0).start()
+        self.addCleanup(self.server.stop)
+        prompt = "Alive players: Bob, Eve\nVOTE: [player_name]"
+        self.vote = {
+            "model": "mock",
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def test_openai_plain_and_stream(self):
+        """Test chat completions with and without SSE streaming"""
+        url = self.server.url + "/v1/chat/completions"
+        with _post(url, self.vote) as response:
+            body = json.load(response)
+        text = body["choices"][0]["message"]["content"]
+        self.assertRegex(text, r"^VOTE: (Bob|Eve)")
+        self.assertGreater(body["usage"]["prompt_tokens"], 0)
+
+        streamed = {
+            **self.vote,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+        with _post(url, streamed) as response:
+            events = [
+                line[len("data: ") :]
+                for line in response.read().decode().splitlines()
+                if line.startswith("data: ")
+            ]
+        self.assertEqual(events[-1], "[DONE]")
+        chunks = [json.loads(e) for e in events[:-1]]
+        content = "".join(
+            c["choices"][0]["delta"].get("content", "") for c in chunks if c["choices"]
+        )
+        self.assertEqual(content, text)
+        self.assertIn("usage", chunks[-1])
+
+    def test_ollama_stream(self):
+        """Test /api/chat NDJSON streaming (Ollama's default)"""
+        with _post(self.server.url + "/api/chat", self.vote) as response:
+            lines = [json.loads(line) for line in response.read().splitlines()]
+        self.assertTrue(lines[-1]["done"])
+        content = "".join(line["message"]["content"] for line in lines)
+        self.assertRegex(content, r"^VOTE: (Bob|Eve)")
+        self.assertEqual(self.server.snapshot()["by_kind"], {"vote": 1})
+
+    def test_injected_faults(self):
+        """Test cut-off bodies and 429 responses"""
+        self.server.disconnect_rate = 1.0
+        with self.assertRaises(http.client.IncompleteRead):
+            with _post(self.server.url + "/v1/chat/completions", self.vote) as r:
+                r.read()
+
+        self.server.disconnect_rate = 0.0
+        self.server.rate_limit_rate = 1.0
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            _post(self.server.url + "/v1/chat/completions", self.vote)
+        self.assertEqual(ctx.exception.code, 429)
+        self.assertIn("Rate limit", ctx.exception.read().decode())
+
+        stats = self.server.snapshot()
+        self.assertEqual((stats["disconnects"], stats["rate_limited"]), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Unit tests for the process-wide model client pool
+"""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from werewolf import model_pool
+from werewolf.agents import VillagerAgent, _run_model_sync
+from werewolf.werewolf_game import Role
+
+
+class TestModelPool(unittest.TestCase):
+    """Test model reuse across agents and event loops"""
+
+    def setUp(self):
+        model_pool.clear_model_pool()
+        self.builds = []
+
+        self.calls = []
+
+        def fake_build(config_name):
+            model = self.calls.append
+            self.builds.append((config_name, model))
+            return model
+
+        patcher = patch("werewolf.model_pool.build_model", side_effect=fake_build)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(model_pool.clear_model_pool)
+
+    def test_same_config_reuses_model(self):
+        """Test that repeated lookups on one loop build a single model"""
+        first = model_pool.get_model("test_model")
+        second = model_pool.get_model("test_model")
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.builds), 1)
+
+    def test_different_configs_get_different_models(self):
+        """Test that each config name gets its own model"""
+        first = model_pool.get_model("model_a")
+        second = model_pool.get_model("model_b")
+
+        self.assertIsNot(first, second)
+
+    def test_each_event_loop_gets_its_own_model(self):
+        """Test that clients are not shared across event loops"""
+
+        async def lookup():
+            return model_pool.get_model("test_model")
+
+        on_other_loop = asyncio.run(lookup())
+        on_background_loop = model_pool.get_model("test_model")
+
+        self.assertIsNot(on_other_loop, on_background_loop)
+
+    def test_failed_build_is_retried(self):
+        """Test that the stub for a failed build is not pooled"""
+        with patch(
+            "werewolf.model_pool.build_model", return_value=model_pool._null_model
+        ):
+            self.assertIs(model_pool.get_model("test_model"), model_pool._null_model)
+
+        model = model_pool.get_model("test_model")
+
+        self.assertIsNot(model, model_pool._null_model)
+        self.assertIs(model_pool.get_model("test_model"), model)
+        self.assertEqual(len(self.builds), 1)
+
+    @patch("werewolf.agents.AgentBase.__init__")
+    def test_agents_share_pooled_model(self, mock_init):
+        """Test that agents built from one config resolve to the same model"""
+        mock_init.return_value = None
+
+        alice = VillagerAgent("Alice", Role.VILLAGER, "test_model")
+        bob = VillagerAgent("Bob", Role.VILLAGER, "test_model")
+
+        alice.model(["hello"])
+        bob.model(["hello"])
+
+        self.assertEqual(len(self.builds), 1)
+        self.assertEqual(self.calls, [["hello"], ["hello"]])
+
+
+class TestRunModelSync(unittest.TestCase):
+    """Test the synchronous model call wrapper"""
+
+    def test_runs_inside_existing_event_loop(self):
+        """Test that _run_model_sync works when a loop is already running"""
+
+        async def fake_model(messages):
+            return messages[0]["content"]
+
+        async def caller():
+            return _run_model_sync(fake_model, [{"role": "user", "content": "hi"}])
+
+        self.assertEqual(asyncio.run(caller()), "hi")
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test that importing the package stays light"""
+
+    def setUp(self):
+        # An importable stand-in for AgentScope, so the checks below show it
+        # is deferred rather than merely missing
+        self.temp_dir = tempfile.mkdtemp()
+        package = os.path.join(self.temp_dir, "agentscope")
+        os.makedirs(package)
+        for module, source in (
+            ("__init__", ""),
+            ("agent", "class AgentBase:\n    pass\n"),
+            ("message", "class Msg:\n    pass\n"),
+            ("model", ""),
+        ):
+            with open(os.path.join(package, f"{module}.py"), "w") as f:
+                f.write(source)
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def _run(self, code: str):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join([self.temp_dir, root])}
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=root,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_package_import_defers_agents(self):
+        """Test that agents load on first attribute access, not on import"""
+        self._run(
+            "import sys, werewolf\n"
+            "assert 'werewolf.agents' not in sys.modules\n"
+            "assert 'werewolf.model_pool' not in sys.modules\n"
+            "assert 'agentscope' not in sys.modules\n"
+            "assert werewolf.VillagerAgent.__module__ == 'werewolf.agents'\n"
+            "assert 'agentscope.agent' in sys.modules\n"
+            "assert 'agentscope.model' not in sys.modules\n"
+        )
+
+    def test_selfplay_import_defers_agentscope(self):
+        """Test that self-play workers import AgentScope only to play a game"""
+        self._run(
+            "import sys, run_selfplay\n"
+            "assert 'agentscope' not in sys.modules\n"
+            "assert 'werewolf.orchestrator' not in sys.modules\n"
+            "import werewolf.orchestrator\n"
+            "assert 'agentscope.agent' in sys.modules\n"
+        )
+
+    def test_unknown_attribute_raises(self):
+        """Test that the lazy lookup does not hide missing names"""
+        import werewolf
+
+        with self.assertRaises(AttributeError):
+            werewolf.NoSuchAgent
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,12 +4,13 @@ Unit tests for WerewolfGameOrchestrator
 Tests game flow, night phase execution, logging, and learning pipeline
 """
 
+import asyncio
 import sys
 import unittest
 import os
 import tempfile
 import shutil
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import AsyncMock, Mock, patch, MagicMock, call
 
 # Mock agentscope before importing orchestrator
 sys.modules["agentscope"] = MagicMock()
@@ -208,6 +209,8 @@ class TestOrchestratorLogging(unittest.TestCase):
             # Write a test message
             test_message = "TEST MESSAGE FOR LOGGING"
             orchestrator._log(test_message)
+            # Transcript writes are buffered until a flush trigger
+            orchestrator.transcript.flush()
 
             # Check message is in file
             with open(log_file, "r", encoding="utf-8") as f:
@@ -352,6 +355,22 @@ class TestOrchestratorNightPhase(unittest.TestCase):
                 agent.role = role
                 agent.is_alive = True
                 agent.known_roles = {}
+                # The game loop awaits the async actions; forward them to the
+                # sync mocks the tests configure
+                for action in (
+                    "night_action",
+                    "night_action_save",
+                    "night_action_poison",
+                    "discuss",
+                    "vote",
+                    "last_words",
+                    "shoot_target",
+                ):
+                    setattr(
+                        agent,
+                        f"a{action}",
+                        AsyncMock(side_effect=getattr(agent, action)),
+                    )
                 return agent
 
             mock_create_agent.side_effect = create_mock_agent
@@ -391,7 +410,7 @@ class TestOrchestratorNightPhase(unittest.TestCase):
                 original_log(msg)
 
             orchestrator._log = track_log
-            orchestrator._run_night_phase()
+            asyncio.run(orchestrator._arun_night_phase())
 
             # Check order
             self.assertEqual(log_order.index("guardian"), 0)
@@ -417,7 +436,7 @@ class TestOrchestratorNightPhase(unittest.TestCase):
             original_log = orchestrator._log
             orchestrator._log = lambda msg: logged_messages.append(msg)
 
-            orchestrator._run_night_phase()
+            asyncio.run(orchestrator._arun_night_phase())
 
             # Find seer log
             seer_logs = [msg for msg in logged_messages if "David learned" in msg]
@@ -430,6 +449,375 @@ class TestOrchestratorNightPhase(unittest.TestCase):
         finally:
             shutil.rmtree(temp_dir)
 
+    def test_witch_uses_one_potion_per_night(self):
+        """Test that a witch who saves is not asked to poison the same night"""
+        orchestrator, mock_game, temp_dir = self._create_mock_orchestrator()
+
+        try:
+            orchestrator.agents["Bob"].night_action.return_value = "Frank"
+            orchestrator.agents["Charlie"].night_action.return_value = "Frank"
+            witch = orchestrator.agents["Eve"]
+            witch.antidote_used = False
+            witch.poison_used = False
+            witch.night_action_save.return_value = True
+            witch.night_action_poison.return_value = "Bob"
+
+            asyncio.run(orchestrator._arun_night_phase())
+
+            actions = mock_game.execute_night_phase.call_args[0][0]
+            self.assertEqual(actions["Eve"], "save")
+            witch.anight_action_poison.assert_not_called()
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_night_actions_collected_concurrently(self):
+        """Test that guardian, werewolf and seer choices all reach the game engine"""
+        orchestrator, mock_game, temp_dir = self._create_mock_orchestrator()
+
+        try:
+            orchestrator.agents["Alice"].night_action.return_value = "David"
+            orchestrator.agents["Bob"].night_action.return_value = "Frank"
+            orchestrator.agents["Charlie"].night_action.return_value = "Frank"
+            orchestrator.agents["David"].night_action.return_value = "Bob"
+            witch = orchestrator.agents["Eve"]
+            witch.antidote_used = True
+            witch.poison_used = True
+
+            for max_concurrency in (1, 8):
+                orchestrator.max_concurrency = max_concurrency
+                asyncio.run(orchestrator._arun_night_phase())
+
+                actions = mock_game.execute_night_phase.call_args[0][0]
+                self.assertEqual(
+                    actions,
+                    {
+                        "Alice": "David",
+                        "Bob": "Frank",
+                        "Charlie": "Frank",
+                        "David": "Bob",
+                    },
+                )
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+class TestOrchestratorVoting(unittest.TestCase):
+    """Test day-phase voting"""
+
+    _create_mock_orchestrator = TestOrchestratorNightPhase._create_mock_orchestrator
+
+    def test_concurrent_votes_gathered_in_seating_order(self):
+        """Test that concurrent voting keeps a deterministic vote order"""
+        orchestrator, mock_game, temp_dir = self._create_mock_orchestrator()
+
+        try:
+            mock_game.state.day_count = 0
+            mock_game.execute_day_phase.return_value = {"eliminated": ""}
+            for name, agent in orchestrator.agents.items():
+                agent.discuss.return_value = "statement"
+                agent.vote.return_value = "Bob" if name != "Bob" else "Alice"
+
+            for concurrent_voting in (True, False):
+                orchestrator.concurrent_voting = concurrent_voting
+                asyncio.run(orchestrator._arun_day_phase())
+
+                votes = mock_game.execute_day_phase.call_args[0][0]
+                self.assertEqual(
+                    list(votes.keys()),
+                    ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"],
+                )
+                self.assertEqual(votes["Bob"], "Alice")
+                self.assertEqual(votes["Frank"], "Bob")
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+class TestOrchestratorAsync(unittest.TestCase):
+    """Test the native asyncio game loop"""
+
+    @patch("werewolf.orchestrator.run_learning_pipeline")
+    def test_arun_game_completes_on_one_loop(self, mock_learning):
+        """Test that arun_game plays a full game with async agent calls"""
+        import asyncio
+        from types import SimpleNamespace
+
+        mock_learning.return_value = "reviews"
+        calls = []
+
+        async def fake_model(messages):
+            calls.append(messages)
+            await asyncio.sleep(0)
+            return SimpleNamespace(content="VOTE: nobody. YES")
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            orchestrator = WerewolfGameOrchestrator(
+                ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"],
+                "test_model",
+                game_type="six",
+                verbose=False,
+                log_file=os.path.join(temp_dir, "test_game.txt"),
+            )
+            for agent in orchestrator.agents.values():
+                agent.model = fake_model
+
+            winner = asyncio.run(orchestrator.arun_game())
+
+            self.assertIn(winner, ["werewolves", "villagers", "draw"])
+            self.assertGreater(len(calls), 0)
+
+            model_calls = orchestrator.get_game_summary()["model_calls"]
+            self.assertEqual(model_calls["calls"], len(calls))
+            self.assertIn("vote", model_calls["by_call_site"])
+            self.assertIn("night_action", model_calls["by_call_site"])
+            self.assertTrue(os.path.exists(orchestrator.metrics_file))
+
+            profile = orchestrator.get_game_summary()["profile"]
+            self.assertIn("round_1", profile["rounds"])
+            self.assertIn("night/witch", profile["by_subphase"])
+            self.assertIn("day/voting", profile["by_subphase"])
+            self.assertIn("learning", profile["by_subphase"])
+        finally:
+            shutil.rmtree(temp_dir)
+
+    @patch("werewolf.orchestrator.run_learning_pipeline")
+    def test_run_game_runs_the_async_loop(self, mock_learning):
+        """Test that the blocking entry point plays the game through arun_game"""
+        from types import SimpleNamespace
+
+        mock_learning.return_value = "reviews"
+
+        async def fake_model(messages):
+            return SimpleNamespace(content="I agree. VOTE: Alice. YES")
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            orchestrator = WerewolfGameOrchestrator(
+                ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"],
+                "test_model",
+                game_type="six",
+                verbose=False,
+                log_file=os.path.join(temp_dir, "test_game.txt"),
+            )
+            for agent in orchestrator.agents.values():
+                agent.model = fake_model
+
+            with patch.object(
+                orchestrator, "arun_game", wraps=orchestrator.arun_game
+            ) as arun_game:
+                winner = orchestrator.run_game()
+
+            arun_game.assert_called_once()
+            self.assertIn(winner, ["werewolves", "villagers", "draw"])
+            model_calls = orchestrator.get_game_summary()["model_calls"]
+            self.assertGreater(model_calls["calls"], 0)
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+class TestOrchestratorEvents(unittest.TestCase):
+    """Test the JSONL event stream"""
+
+    @patch("werewolf.orchestrator.run_learning_pipeline")
+    def test_events_cover_the_game(self, mock_learning):
+        """Test that a full game produces a consistent event stream"""
+        import asyncio
+        from types import SimpleNamespace
+
+        from werewolf.events import EVENT_TYPES, read_events
+
+        mock_learning.return_value = "reviews"
+
+        async def fake_model(messages):
+            return SimpleNamespace(content="I agree. VOTE: Alice. YES")
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            orchestrator = WerewolfGameOrchestrator(
+                ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"],
+                "test_model",
+                game_type="six",
+                verbose=False,
+                log_file=os.path.join(temp_dir, "test_game.txt"),
+            )
+            for agent in orchestrator.agents.values():
+                agent.model = fake_model
+
+            winner = asyncio.run(orchestrator.arun_game())
+            events = list(read_events(orchestrator.events_file))
+
+            self.assertEqual(
+                orchestrator.events_file,
+                os.path.join(temp_dir, "test_game.events.jsonl"),
+            )
+            self.assertEqual([e["seq"] for e in events], list(range(len(events))))
+            self.assertTrue(all(e["type"] in EVENT_TYPES for e in events))
+            self.assertTrue(all("round" in e and "phase" in e for e in events))
+
+            self.assertEqual(events[0]["type"], "game_start")
+            self.assertEqual(
+                events[0]["roles"], orchestrator.get_game_summary()["roles"]
+            )
+            self.assertEqual(events[-1]["type"], "game_end")
+            self.assertEqual(events[-1]["winner"], winner)
+
+            phases = [e for e in events if e["type"] == "phase_start"]
+            self.assertEqual(phases[0]["phase"], "night")
+            self.assertEqual(phases[0]["round"], 1)
+
+            deaths = {e["player"] for e in events if e["type"] == "death"}
+            survivors = set(orchestrator.game.state.alive_players)
+            self.assertEqual(deaths, set(orchestrator.game.player_names) - survivors)
+
+            for vote in (e for e in events if e["type"] == "vote"):
+                self.assertEqual(vote["phase"], "day")
+        finally:
+            shutil.rmtree(temp_dir)
+
+    @patch("werewolf.orchestrator.WerewolfGame")
+    @patch("werewolf.orchestrator.create_agent")
+    def test_events_can_be_disabled(self, mock_create_agent, mock_game):
+        """Test that write_events=False writes no event file"""
+        mock_game.return_value.player_names = ["Alice"]
+        mock_game.return_value.state.roles = {"Alice": Role.VILLAGER}
+        mock_create_agent.return_value = Mock()
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            orchestrator = WerewolfGameOrchestrator(
+                ["Alice"],
+                "test_model",
+                verbose=False,
+                log_file=os.path.join(temp_dir, "test_game.txt"),
+                write_events=False,
+                write_metrics=False,
+            )
+            self.assertIsNone(orchestrator.events_file)
+            self.assertEqual(os.listdir(temp_dir), ["test_game.txt"])
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+
+class TestLearningExecutor(unittest.TestCase):
+    """Test that end-of-game learning stays out of the default executor"""
+
+    def test_learning_runs_on_its_own_executor(self):
+        """Test that _alog_game_end uses the learning pool"""
+        import threading
+
+        orchestrator = WerewolfGameOrchestrator.__new__(WerewolfGameOrchestrator)
+        threads = []
+        orchestrator._log_game_end = lambda winner: threads.append(
+            (threading.current_thread().name, winner)
+        )
+
+        asyncio.run(orchestrator._alog_game_end("villagers"))
+
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0][0].startswith("werewolf-learning"))
+        self.assertEqual(threads[0][1], "villagers")
+
+
+class TestOrchestratorCheckpoint(unittest.TestCase):
+    """Test phase checkpoints and resuming interrupted games"""
+
+    @patch("werewolf.orchestrator.run_learning_pipeline")
+    def test_resume_after_interruption(self, mock_learning):
+        """Test that a game interrupted mid-day resumes from the night checkpoint"""
+        import asyncio
+        import json
+        import random
+        from types import SimpleNamespace
+
+        from werewolf.events import read_events
+
+        mock_learning.return_value = "reviews"
+
+        async def fake_model(messages):
+            return SimpleNamespace(content="I agree. VOTE: Alice. YES")
+
+        random.seed(3)
+        temp_dir = tempfile.mkdtemp()
+        try:
+            orchestrator = WerewolfGameOrchestrator(
+                ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"],
+                "test_model",
+                game_type="six",
+                verbose=False,
+                log_file=os.path.join(temp_dir, "test_game.txt"),
+            )
+            for agent in orchestrator.agents.values():
+                agent.model = fake_model
+
+            # Crash at the start of the first day
+            with patch.object(
+                orchestrator, "_arun_day_phase", side_effect=RuntimeError("crash")
+            ):
+                with self.assertRaises(RuntimeError):
+                    asyncio.run(orchestrator.arun_game())
+
+            checkpoint_file = orchestrator.checkpoint_file
+            self.assertTrue(os.path.exists(checkpoint_file))
+            with open(checkpoint_file, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            self.assertEqual(checkpoint["current_round"], 1)
+            self.assertEqual(checkpoint["completed_phase"], "night")
+
+            # Claimed by a resuming run, as run_selfplay does
+            claimed = checkpoint_file + ".resuming.1"
+            os.rename(checkpoint_file, claimed)
+            resumed = WerewolfGameOrchestrator.resume_from(claimed, verbose=False)
+            self.assertEqual(resumed.game.to_dict(), orchestrator.game.to_dict())
+            for name, agent in orchestrator.agents.items():
+                self.assertEqual(resumed.agents[name].get_state(), agent.get_state())
+                resumed.agents[name].model = fake_model
+
+            winner = asyncio.run(resumed.arun_game())
+
+            self.assertIn(winner, ["werewolves", "villagers", "draw"])
+            self.assertFalse(os.path.exists(checkpoint_file))
+            self.assertFalse(os.path.exists(claimed))
+            events = list(read_events(resumed.events_file))
+            self.assertEqual([e["seq"] for e in events], list(range(len(events))))
+            # The interrupted day phase_start was dropped, then replayed once
+            phases = [
+                (e["round"], e["phase"])
+                for e in events
+                if e["type"] == "phase_start"
+            ]
+            self.assertEqual(phases[:2], [(1, "night"), (1, "day")])
+            self.assertEqual(len(phases), len(set(phases)))
+            with open(resumed.log_file, "r", encoding="utf-8") as f:
+                transcript = f.read()
+            self.assertEqual(transcript.count("ROUND 1\n"), 1)
+            self.assertIn("[RESUMED]", transcript)
+        finally:
+            shutil.rmtree(temp_dir)
+
+    @patch("werewolf.orchestrator.WerewolfGame")
+    @patch("werewolf.orchestrator.create_agent")
+    def test_checkpoint_can_be_disabled(self, mock_create_agent, mock_game):
+        """Test that checkpoint=False never writes a checkpoint"""
+        mock_game.return_value.player_names = ["Alice"]
+        mock_game.return_value.state.roles = {"Alice": Role.VILLAGER}
+        mock_game.return_value.check_game_end.return_value = (False, None)
+        mock_create_agent.return_value = Mock()
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            orchestrator = WerewolfGameOrchestrator(
+                ["Alice"],
+                "test_model",
+                verbose=False,
+                log_file=os.path.join(temp_dir, "test_game.txt"),
+                checkpoint=False,
+            )
+            orchestrator.profiler.begin("night")
+            self.assertEqual(orchestrator._end_phase("night"), "")
+            self.assertFalse(os.path.exists(orchestrator.checkpoint_file))
+        finally:
+            shutil.rmtree(temp_dir)
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for the phase timing profiler
+"""
+
+import time
+import unittest
+
+from werewolf.metrics import ModelCallMetrics
+from werewolf.profiling import PhaseProfiler, _union_length
+
+
+class TestPhaseProfiler(unittest.TestCase):
+    """Test section nesting and the time split"""
+
+    def test_union_does_not_double_count_concurrent_calls(self):
+        """Test that overlapping call intervals count once"""
+        intervals = [(0.0, 2.0), (1.0, 3.0), (5.0, 6.0)]
+        self.assertAlmostEqual(_union_length(intervals, 0.0), 4.0)
+        self.assertAlmostEqual(_union_length(intervals, 1.5), 2.5)
+
+    def test_sections_split_time(self):
+        """Test that llm, io and engine time add up to the section wall time"""
+        metrics = ModelCallMetrics()
+        profiler = PhaseProfiler(metrics)
+        profiler.set_round(1)
+
+        with profiler.section("night"):
+            with profiler.section("witch"):
+                time.sleep(0.01)
+                # Last 5ms of the sleep were the model call, 2ms were logging
+                metrics.record("witch_save", "m", 0.005)
+                profiler.add("io", 0.002)
+
+        summary = profiler.summary()
+        witch = summary["sections"]["round_1/night/witch"]
+        night = summary["sections"]["round_1/night"]
+
+        self.assertAlmostEqual(witch["llm"], 0.005, places=5)
+        self.assertEqual(witch["io"], 0.002)
+        # Parents include their children
+        self.assertGreaterEqual(night["wall"], witch["wall"])
+        self.assertEqual(night["io"], 0.002)
+        self.assertAlmostEqual(
+            witch["llm"] + witch["io"] + witch["context"] + witch["engine"],
+            witch["wall"],
+            places=5,
+        )
+        self.assertEqual(summary["rounds"]["round_1"]["wall"], night["wall"])
+        self.assertIn("night/witch", summary["by_subphase"])
+
+    def test_repeated_sections_aggregate(self):
+        """Test that a sub-phase seen in several rounds is summed"""
+        profiler = PhaseProfiler()
+        for round_num in (1, 2):
+            profiler.set_round(round_num)
+            with profiler.section("day"):
+                with profiler.section("voting"):
+                    pass
+        profiler.set_round(None)
+        with profiler.section("learning"):
+            pass
+
+        summary = profiler.summary()
+        self.assertEqual(summary["by_subphase"]["day/voting"]["count"], 2)
+        self.assertEqual(set(summary["rounds"]), {"round_1", "round_2"})
+        self.assertEqual(summary["count"], 3)
+
+        folded = [line.rsplit(" ", 1)[0] for line in profiler.folded()]
+        self.assertLess(folded.index("round_1;day"), folded.index("round_2;day"))
+        chart = profiler.format_flame()
+        self.assertIn("round_2", chart)
+        self.assertIn("    voting", chart)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+Unit tests for the cross-process rate limiter
+"""
+
+import asyncio
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from werewolf import rate_limiter
+from werewolf.agents import _run_model_async
+from werewolf.rate_limiter import RateLimiter, estimate_tokens
+
+
+def _reserve_many(path, limits, count, queue):
+    limiter = RateLimiter(path, headroom=1.0)
+    queue.put([limiter.reserve("shared", limits, 0) for _ in range(count)])
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test token bucket accounting"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "limits.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_requests_are_spaced_at_the_limit(self):
+        """Test that reservations past the burst wait cost / rate apart"""
+        limiter = RateLimiter(self.path, headroom=1.0, burst_seconds=1.0)
+        limits = {"requests_per_minute": 60}
+
+        with patch("werewolf.rate_limiter.time.time", return_value=1000.0):
+            waits = [limiter.reserve("m", limits, 0) for _ in range(4)]
+
+        # One request of burst, then one per second
+        self.assertEqual(waits, [0.0, 1.0, 2.0, 3.0])
+        self.assertEqual(limiter.waits, 3)
+        limiter.close()
+
+    def test_bucket_refills_and_headroom(self):
+        """Test refill over time and that headroom lowers the rate"""
+        limiter = RateLimiter(self.path, headroom=0.5)
+        limits = {"requests_per_minute": 120}  # 1/s after headroom
+
+        with patch("werewolf.rate_limiter.time.time", return_value=1000.0):
+            limiter.reserve("m", limits, 0)
+            self.assertEqual(limiter.reserve("m", limits, 0), 1.0)
+        with patch("werewolf.rate_limiter.time.time", return_value=1002.0):
+            self.assertEqual(limiter.reserve("m", limits, 0), 0.0)
+        limiter.close()
+
+    def test_token_settle_refunds_estimate(self):
+        """Test that settling reported usage corrects the token bucket"""
+        limiter = RateLimiter(self.path, headroom=1.0)
+        limits = {"tokens_per_minute": 6000}  # 100 tokens/s, capacity 100
+
+        with patch("werewolf.rate_limiter.time.time", return_value=1000.0):
+            self.assertEqual(limiter.reserve("m", limits, 300), 2.0)
+            limiter.settle("m", limits, -200)
+            self.assertEqual(limiter.reserve("m", limits, 100), 1.0)
+        limiter.close()
+
+    def test_unlimited_config_never_touches_disk(self):
+        """Test that configs without limits cost nothing"""
+        limiter = RateLimiter(self.path)
+        self.assertEqual(limiter.reserve("m", {}, 1000), 0.0)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_buckets_are_shared_across_processes(self):
+        """Test that two processes draw from the same bucket"""
+        limits = {"requests_per_minute": 6}  # one per 10s, far beyond the test
+        queue = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(
+                target=_reserve_many, args=(self.path, limits, 3, queue)
+            )
+            for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        waits = queue.get(timeout=30) + queue.get(timeout=30)
+        for worker in workers:
+            worker.join()
+
+        # Six reservations in total: one free, the rest queued 10s apart
+        self.assertEqual(sum(1 for w in waits if w == 0.0), 1)
+        self.assertGreater(max(waits), 45)
+
+    def test_estimate_tokens(self):
+        """Test that the estimate covers the prompt and the completion budget"""
+        messages = [{"role": "user", "content": "x" * 400}]
+        self.assertEqual(estimate_tokens(messages, 100), 201)
+
+
+class TestRateLimitedModelCalls(unittest.TestCase):
+    """Test that _run_model_async goes through the limiter"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.limiter = rate_limiter.configure_rate_limiter(
+            os.path.join(self.temp_dir, "limits.sqlite"), headroom=1.0
+        )
+
+    def tearDown(self):
+        rate_limiter.configure_rate_limiter(None)
+        shutil.rmtree(self.temp_dir)
+
+    def test_limited_config_reserves_and_settles(self):
+        """Test that a call reserves its estimate and settles reported usage"""
+        async def model(messages):
+            return SimpleNamespace(
+                content="ok", usage=SimpleNamespace(input_tokens=10, output_tokens=5)
+            )
+
+        settings = {
+            "config_name": "limited",
+            "limits": {"requests_per_minute": 600, "tokens_per_minute": 60000},
+            "max_tokens": 50,
+        }
+        messages = [{"role": "user", "content": "hi"}]
+        with patch(
+            "werewolf.agents.model_rate_limits", return_value=settings
+        ), patch.object(self.limiter, "settle", wraps=self.limiter.settle) as settle:
+            asyncio.run(_run_model_async(model, messages))
+
+        estimate = estimate_tokens(messages, 50)
+        settle.assert_called_once_with("limited", settings["limits"], 15 - estimate)
+
+    def test_failed_attempt_refunds_estimate(self):
+        """Test that an attempt that raises gives its reserved tokens back"""
+        async def model(messages):
+            raise RuntimeError("bad request")
+
+        settings = {
+            "config_name": "limited",
+            "limits": {"tokens_per_minute": 60000},
+            "max_tokens": 50,
+        }
+        messages = [{"role": "user", "content": "hi"}]
+        with patch(
+            "werewolf.agents.model_rate_limits", return_value=settings
+        ), patch.object(self.limiter, "settle", wraps=self.limiter.settle) as settle:
+            with self.assertRaises(RuntimeError):
+                asyncio.run(_run_model_async(model, messages))
+
+        estimate = estimate_tokens(messages, 50)
+        settle.assert_called_once_with("limited", settings["limits"], -estimate)
+
+    def test_bucket_updates_run_off_the_loop(self):
+        """Test that SQLite updates do not block the event loop thread"""
+        threads = []
+
+        def update(*args):
+            threads.append(threading.get_ident())
+            return 0.0
+
+        async def acquire_and_settle():
+            limits = {"tokens_per_minute": 60000}
+            with patch.object(self.limiter, "_update", side_effect=update):
+                await self.limiter.aacquire("m", limits, 10)
+                await self.limiter.asettle("m", limits, -5)
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(acquire_and_settle())
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(loop_thread, threads)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+"""
+Unit tests for the persistent LLM response cache
+"""
+
+import asyncio
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from werewolf import response_cache
+from werewolf.agents import (
+    _extract_text_content,
+    _run_model_async,
+    _to_message_dicts,
+)
+from werewolf.rate_limiter import estimate_tokens
+from werewolf.response_cache import (
+    ResponseCache,
+    ResponseCacheMiss,
+    parse_cache_mode,
+)
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test storage, modes and eviction"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "responses.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        """Test that stored text is replayed as a response"""
+        cache = ResponseCache(self.path)
+        cache.put("key", "hello")
+
+        response = cache.get("key")
+
+        self.assertEqual(_extract_text_content(response), "hello")
+        self.assertEqual(cache.hits, 1)
+        cache.close()
+
+    def test_key_depends_on_messages(self):
+        """Test that different prompts produce different keys"""
+        model = lambda messages: None
+        first = ResponseCache.make_key(model, [{"role": "user", "content": "a"}])
+        second = ResponseCache.make_key(model, [{"role": "user", "content": "b"}])
+
+        self.assertNotEqual(first, second)
+
+    def test_lru_eviction_by_entries(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = ResponseCache(self.path, max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")  # a is now more recent than b
+        cache.put("c", "3")
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        cache.close()
+
+    def test_eviction_by_bytes(self):
+        """Test that total stored size stays under max_bytes"""
+        cache = ResponseCache(self.path, max_entries=None, max_bytes=10)
+        cache.put("a", "x" * 6)
+        cache.put("b", "y" * 6)
+
+        self.assertEqual(len(cache), 1)
+        self.assertIsNotNone(cache.get("b"))
+        cache.close()
+
+    def test_readonly_does_not_write(self):
+        """Test that readonly mode never stores responses"""
+        cache = ResponseCache(self.path, mode="readonly")
+        cache.put("a", "1")
+
+        self.assertEqual(len(cache), 0)
+        cache.close()
+
+    def test_evicts_in_batches(self):
+        """Test that a full cache evicts one batch, then stores without evicting"""
+        cache = ResponseCache(self.path, max_entries=200)
+        for i in range(201):
+            cache.put(str(i), "x")
+
+        self.assertEqual(len(cache), 198)
+        self.assertIsNone(cache.get("2"))
+        self.assertIsNotNone(cache.get("3"))
+        cache.put("new", "x")
+        self.assertEqual(len(cache), 199)
+        cache.close()
+
+    def test_totals_follow_replacements(self):
+        """Test that the running totals match the stored rows"""
+        cache = ResponseCache(self.path, max_entries=None)
+        cache.put("a", "xx")
+        cache.put("a", "xxxx")
+        cache.put("b", "x")
+        cache.close()
+
+        conn = sqlite3.connect(self.path)
+        totals = conn.execute("SELECT entries, bytes FROM totals").fetchone()
+        rows = conn.execute("SELECT COUNT(*), SUM(size) FROM responses").fetchone()
+        conn.close()
+        self.assertEqual(totals, (2, 5))
+        self.assertEqual(totals, rows)
+
+    def test_counts_existing_cache(self):
+        """Test that a cache written before the totals existed is counted"""
+        conn = sqlite3.connect(self.path)
+        with conn:
+            conn.execute(
+                "CREATE TABLE responses (key TEXT PRIMARY KEY, response TEXT "
+                "NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute("INSERT INTO responses VALUES ('a', 'xyz', 3, 1.0)")
+        conn.close()
+
+        cache = ResponseCache(self.path, max_entries=None, max_bytes=4)
+        self.assertEqual(len(cache), 1)
+        cache.put("b", "xy")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 1)
+        cache.close()
+
+    def test_reconnects_after_fork(self):
+        """Test that a child process does not reuse the parent's connection"""
+        cache = ResponseCache(self.path)
+        cache.put("a", "1")
+        parent_conn = cache._conn
+
+        with patch("werewolf.response_cache.os.getpid", return_value=-1):
+            self.assertIsNotNone(cache.get("a"))
+            self.assertIsNot(cache._conn, parent_conn)
+        parent_conn.close()
+        cache.close()
+
+    def test_parse_cache_mode(self):
+        """Test the WEREWOLF_RESPONSE_CACHE values"""
+        for value in (None, "", "0", "off", "False", "no"):
+            self.assertIsNone(parse_cache_mode(value))
+        for value in ("1", "on", "true", "readwrite"):
+            self.assertEqual(parse_cache_mode(value), "readwrite")
+        self.assertEqual(parse_cache_mode(" Replay "), "replay")
+        with self.assertRaisesRegex(ValueError, "readonly"):
+            parse_cache_mode("read-only")
+
+
+class TestCachedModelCalls(unittest.TestCase):
+    """Test the cache hook in _run_model_async"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "responses.sqlite")
+        self.calls = 0
+
+    def tearDown(self):
+        response_cache.configure_response_cache(None)
+        shutil.rmtree(self.temp_dir)
+
+    async def _model(self, messages):
+        self.calls += 1
+        return response_cache.CachedResponse("fresh")
+
+    def test_second_call_served_from_cache(self):
+        """Test that an identical prompt only reaches the model once"""
+        response_cache.configure_response_cache(self.path)
+        messages = [{"role": "user", "content": "prompt"}]
+
+        asyncio.run(_run_model_async(self._model, messages))
+        response = asyncio.run(_run_model_async(self._model, messages))
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(_extract_text_content(response), "fresh")
+
+    def test_plain_message_objects_hit(self):
+        """Test that message objects without to_dict get a stable key"""
+
+        class PlainMsg:
+            def __init__(self, content):
+                self.role = "user"
+                self.content = content
+
+        response_cache.configure_response_cache(self.path)
+
+        asyncio.run(_run_model_async(self._model, [PlainMsg("prompt")]))
+        asyncio.run(_run_model_async(self._model, [PlainMsg("prompt")]))
+
+        self.assertEqual(self.calls, 1)
+        messages = _to_message_dicts([PlainMsg("abcd")])
+        self.assertEqual(messages, [{"role": "user", "content": "abcd"}])
+        self.assertEqual(estimate_tokens(messages, 10), 12)
+
+    def test_cache_io_runs_off_the_loop(self):
+        """Test that cache lookups and stores do not block the event loop"""
+        cache = response_cache.configure_response_cache(self.path)
+        threads = []
+
+        def spy(method):
+            def wrapper(*args):
+                threads.append(threading.get_ident())
+                return method(*args)
+
+            return wrapper
+
+        async def call():
+            threads.append(threading.get_ident())
+            return await _run_model_async(
+                self._model, [{"role": "user", "content": "prompt"}]
+            )
+
+        with patch.object(cache, "get", spy(cache.get)), patch.object(
+            cache, "put", spy(cache.put)
+        ):
+            asyncio.run(call())
+
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threads[0], threads[1:])
+
+    def test_replay_miss_raises(self):
+        """Test that replay mode refuses to call the model on a miss"""
+        response_cache.configure_response_cache(self.path, mode="replay")
+
+        with self.assertRaises(ResponseCacheMiss):
+            asyncio.run(
+                _run_model_async(self._model, [{"role": "user", "content": "new"}])
+            )
+        self.assertEqual(self.calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
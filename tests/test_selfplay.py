@@ -0,0 +1,188 @@
+"""
+Unit tests for the self-play game schedulers
+"""
+
+import os
+import sys
+import json
+import shutil
+import asyncio
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Mock agentscope before importing the orchestrator
+sys.modules["agentscope"] = MagicMock()
+sys.modules["agentscope.message"] = MagicMock()
+
+import run_selfplay
+from werewolf import orchestrator
+
+
+class TestAsyncScheduler(unittest.TestCase):
+    """Test the asyncio game scheduler"""
+
+    def test_concurrency_cap_and_completion_order(self):
+        """Test that no more than `concurrency` games run at once"""
+        in_flight = 0
+        peak = 0
+
+        async def fake_game(game_num, model, game_type, names, verbose, checkpoint):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later games finish first
+            await asyncio.sleep(0.001 * (20 - game_num))
+            in_flight -= 1
+            return {"game_num": game_num, "checkpoint": checkpoint, "success": True}
+
+        seen = []
+        games = [(n, "ckpt.json" if n == 1 else None) for n in range(1, 21)]
+        with patch.object(run_selfplay, "arun_single_game", fake_game):
+            results = asyncio.run(
+                run_selfplay.arun_games(
+                    games, "m", concurrency=5, on_result=lambda r: seen.append(r)
+                )
+            )
+
+        self.assertEqual(peak, 5)
+        self.assertEqual(results, seen)
+        self.assertEqual(sorted(r["game_num"] for r in results), list(range(1, 21)))
+        self.assertEqual(
+            [r["checkpoint"] for r in results if r["game_num"] == 1], ["ckpt.json"]
+        )
+
+    def test_games_are_created_lazily(self):
+        """Test that a long game list never has more than `concurrency` games"""
+        created = finished = peak = 0
+
+        def fake_game(game_num, model, game_type, names, verbose, checkpoint):
+            nonlocal created, peak
+            created += 1
+            peak = max(peak, created - finished)
+
+            async def game():
+                nonlocal finished
+                await asyncio.sleep(0)
+                finished += 1
+                return {"game_num": game_num, "success": True}
+
+            return game()
+
+        games = [(n, None) for n in range(1, 1001)]
+        with patch.object(run_selfplay, "arun_single_game", fake_game):
+            results = asyncio.run(run_selfplay.arun_games(games, "m", concurrency=5))
+
+        self.assertEqual(len(results), 1000)
+        self.assertEqual(peak, 5)
+
+    def test_orchestrator_is_built_off_the_loop(self):
+        """Test that orchestrator construction runs in a worker thread"""
+        threads = []
+
+        def fake_create(*args):
+            threads.append(threading.get_ident())
+            raise RuntimeError("stop")
+
+        async def run():
+            threads.append(threading.get_ident())
+            return await run_selfplay.arun_single_game(1, "m")
+
+        with patch.object(run_selfplay, "_create_orchestrator", fake_create):
+            result = asyncio.run(run())
+
+        self.assertFalse(result["success"])
+        self.assertNotEqual(threads[0], threads[1])
+
+    def test_failed_game_is_reported(self):
+        """Test that a game raising an error becomes a failed result"""
+        with patch.object(
+            orchestrator, "WerewolfGameOrchestrator", side_effect=RuntimeError("boom")
+        ):
+            results = asyncio.run(run_selfplay.arun_games([(7, None)], "m"))
+
+        self.assertFalse(results[0]["success"])
+        self.assertEqual(results[0]["game_num"], 7)
+        self.assertEqual(results[0]["error"], "boom")
+
+    def test_record_result_updates_stats(self):
+        """Test the shared statistics bookkeeping"""
+        progress = {"games_history": []}
+        stats = dict.fromkeys(
+            ["werewolf_wins", "villager_wins", "draws", "errors", "total_rounds"], 0
+        )
+        ok = {"success": True, "winner": "villagers", "rounds": 3, "log_file": "a"}
+        run_selfplay._record_result(progress, stats, ok, 4)
+        run_selfplay._record_result(progress, stats, {"success": False}, 5)
+
+        self.assertEqual(stats["villager_wins"], 1)
+        self.assertEqual(stats["total_rounds"], 3)
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(progress["games_history"][0]["game_num"], 4)
+
+
+class TestFindInterruptedGames(unittest.TestCase):
+    """Test that interrupted games are claimed before they are resumed"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.logs = os.path.join(self.temp_dir, ".training", "game_logs")
+        os.makedirs(self.logs)
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        self.addCleanup(os.chdir, cwd)
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def _write(self, name: str, pid: int, game_type: str = "six") -> str:
+        path = os.path.join(self.logs, name)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"game_type": game_type, "pid": pid}, f)
+        return path
+
+    def test_claims_each_checkpoint_once(self):
+        """Test that a claimed checkpoint is not handed out again"""
+        with patch.object(
+            run_selfplay, "_process_alive", side_effect=lambda pid: pid == 2
+        ):
+            self._write("a.checkpoint.json", 1)
+            self._write("b.checkpoint.json", 2)  # Game still running
+            self._write("c.checkpoint.json", 1, game_type="nine")
+            self._write("d.checkpoint.json.resuming.2", 1)  # Claimed by 2
+            self._write("e.checkpoint.json.resuming.3", 1)  # Claimer died
+            self._write("f.checkpoint.json", 2)
+            self._write("f.checkpoint.json.resuming.3", 1)  # Superseded
+
+            claimed = run_selfplay.find_interrupted_games("six")
+            again = run_selfplay.find_interrupted_games("six")
+
+        suffix = f".resuming.{os.getpid()}"
+        self.assertEqual(
+            [os.path.basename(path) for path in claimed],
+            [f"a.checkpoint.json{suffix}", f"e.checkpoint.json{suffix}"],
+        )
+        self.assertEqual(again, [])
+        self.assertFalse(os.path.exists(os.path.join(self.logs, "a.checkpoint.json")))
+
+    def test_lost_race_is_skipped(self):
+        """Test that a checkpoint renamed away by another run is skipped"""
+        self._write("a.checkpoint.json", 1)
+        self._write("b.checkpoint.json", 1)
+        rename = os.rename
+
+        def racing_rename(src, dst):
+            if os.path.basename(src) == "a.checkpoint.json":
+                raise FileNotFoundError(src)
+            rename(src, dst)
+
+        with patch.object(
+            run_selfplay.os, "rename", side_effect=racing_rename
+        ), patch.object(run_selfplay, "_process_alive", return_value=False):
+            claimed = run_selfplay.find_interrupted_games("six", limit=1)
+
+        self.assertEqual(len(claimed), 1)
+        self.assertIn("b.checkpoint.json.resuming.", claimed[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
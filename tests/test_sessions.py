@@ -0,0 +1,99 @@
+"""
+Unit tests for the visualizer's per-viewer game sessions
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "visualization")
+)
+
+from parser import GameEvent, Player
+from sessions import SessionStore, new_session_id
+from state_manager import GameStateManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_manager():
+    events = [
+        GameEvent(1, "morning", "death_announcement", {"player": "Bob"}, 0),
+        GameEvent(1, "voting", "elimination", {"player": "Alice", "role": "wolf"}, 1),
+    ]
+    players = {name: Player(name=name) for name in ("Alice", "Bob")}
+    return GameStateManager({"game_info": {}, "players": players, "events": events})
+
+
+class TestSessionStore(unittest.TestCase):
+    """Test session isolation, idle expiry and the caps"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_sessions_are_independent(self):
+        """Test that two viewers keep their own position"""
+        store = SessionStore(clock=self.clock)
+        first, second = new_session_id(), new_session_id()
+        self.assertNotEqual(first, second)
+        store.put(first, "a.txt", make_manager(), 100)
+        store.put(second, "b.txt", make_manager(), 100)
+
+        store.get(first).manager.next_event()
+        self.assertEqual(store.get(first).manager.current_event_index, 1)
+        self.assertEqual(store.get(second).manager.current_event_index, 0)
+        self.assertEqual(store.get(second).filename, "b.txt")
+        self.assertIsNone(store.get("unknown"))
+
+        # Loading another game replaces the session
+        store.put(first, "c.txt", make_manager(), 50)
+        self.assertEqual(store.get(first).filename, "c.txt")
+        self.assertEqual((len(store), store.total_bytes), (2, 150))
+
+    def test_idle_expiry(self):
+        """Test that sessions unused for idle_timeout are dropped"""
+        store = SessionStore(idle_timeout=60, clock=self.clock)
+        store.put("a", "a.txt", make_manager(), 100)
+        store.put("b", "b.txt", make_manager(), 100)
+
+        self.clock.now = 40
+        self.assertIsNotNone(store.get("b"))
+        self.clock.now = 70
+        self.assertIsNone(store.get("a"))
+        self.assertIsNotNone(store.get("b"))
+
+        stats = store.stats()
+        self.assertEqual((stats["sessions"], stats["expired"]), (1, 1))
+        self.assertEqual(stats["bytes"], 100)
+
+    def test_caps(self):
+        """Test LRU eviction by session count and by log size"""
+        store = SessionStore(max_sessions=2, clock=self.clock)
+        for session_id in "abc":
+            store.put(session_id, "x.txt", make_manager(), 100)
+            if session_id == "b":
+                store.get("a")
+        self.assertIsNone(store.get("b"))
+        self.assertIsNotNone(store.get("a"))
+        self.assertEqual(store.evictions, 1)
+
+        store = SessionStore(max_bytes=250, clock=self.clock)
+        for session_id in "abc":
+            store.put(session_id, "x.txt", make_manager(), 100)
+        self.assertEqual((len(store), store.total_bytes), (2, 200))
+
+        # A single game larger than the limit is still kept
+        store.put("d", "big.txt", make_manager(), 1000)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.get("d").filename, "big.txt")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for the headless simulator
+"""
+
+import random
+import unittest
+
+from werewolf.simulator import POLICIES, HeadlessSimulator, HeuristicPolicy, simulate
+from werewolf.werewolf_game import Role, WerewolfGame
+
+
+class TestHeadlessSimulator(unittest.TestCase):
+    """Test scripted-policy simulation"""
+
+    def test_every_game_has_an_outcome(self):
+        """Test that each simulated game ends in a win or a draw"""
+        for game_type in ["six", "nine", "twelve"]:
+            for policy in POLICIES:
+                result = simulate(game_type, 50, policy, seed=7)
+                self.assertEqual(result.games, 50)
+                self.assertEqual(
+                    result.werewolf_wins + result.villager_wins + result.draws, 50
+                )
+
+    def test_seeded_runs_are_reproducible(self):
+        """Test that the same seed gives the same win counts"""
+        first = simulate("nine", 200, "heuristic", seed=3)
+        second = simulate("nine", 200, "heuristic", seed=3)
+
+        self.assertEqual(first.werewolf_wins, second.werewolf_wins)
+        self.assertEqual(first.total_rounds, second.total_rounds)
+
+    def test_global_random_state_untouched(self):
+        """Test that simulate() leaves the random module's state alone"""
+        state = random.getstate()
+        simulate("six", 20, "random", seed=3)
+        self.assertEqual(random.getstate(), state)
+
+    def test_seer_trusting_helps_villagers(self):
+        """Test that public seer information improves the good side's win rate"""
+        random_result = simulate("six", 2000, "random", seed=1)
+        trusting_result = simulate("six", 2000, "seer_trusting", seed=1)
+
+        self.assertGreater(
+            trusting_result.villager_wins, random_result.villager_wins
+        )
+
+    def test_witch_uses_one_potion_per_night(self):
+        """Test that a save is not overwritten by a poison the same night"""
+
+        class EagerWitch(HeuristicPolicy):
+            def witch_saves(self, game, witch, victim):
+                return True
+
+            def witch_poison(self, game, witch):
+                return game.state.alive_with_role(Role.WEREWOLF)[0]
+
+        names = ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"]
+        game = WerewolfGame(names, game_type="six")
+        simulator = HeadlessSimulator(EagerWitch(random.Random(0)))
+        simulator.policy.start_game(game)
+        potions = {"antidote_used": False, "poison_used": False}
+
+        simulator._night(game, potions)
+
+        self.assertEqual(potions, {"antidote_used": True, "poison_used": False})
+        self.assertEqual(len(game.state.alive_players), len(names))
+
+    def test_unknown_policy_rejected(self):
+        """Test that an unknown policy name raises ValueError"""
+        with self.assertRaises(ValueError):
+            simulate("six", 1, "nonexistent")
+
+
+if __name__ == "__main__":
+    unittest.main()
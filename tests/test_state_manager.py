@@ -0,0 +1,116 @@
+"""
+Unit tests for the visualizer's game state manager
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "visualization")
+)
+
+from parser import GameEvent, Player
+from state_manager import GameStateManager
+
+NAMES = ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"]
+ROLES = ["werewolf", "villager", "witch", "werewolf", "hunter", "seer"]
+
+
+def make_game():
+    """Three rounds with a death and an elimination each, padded with talk"""
+    events = []
+
+    def add(round_num, phase, event_type, data):
+        events.append(
+            GameEvent(round_num, phase, event_type, data, timestamp=len(events))
+        )
+
+    for round_num in range(1, 4):
+        add(round_num, "night", "phase_start", {"phase": "night"})
+        add(
+            round_num,
+            "morning",
+            "death_announcement",
+            {"player": NAMES[round_num], "reason": "werewolf_kill"},
+        )
+        for name in NAMES:
+            add(round_num, "day", "discussion", {"speaker": name, "statement": "Hi"})
+        add(
+            round_num,
+            "voting",
+            "elimination",
+            {"player": NAMES[round_num + 2], "role": "suspect"},
+        )
+
+    players = {name: Player(name=name, role=role) for name, role in zip(NAMES, ROLES)}
+    return {"game_info": {"game_type": "six"}, "players": players, "events": events}
+
+
+class TestGameStateManager(unittest.TestCase):
+    """Test that seeking matches stepping through every event"""
+
+    def setUp(self):
+        self.data = make_game()
+        # Player states after 0..n events, stepping forward from the start
+        stepper = GameStateManager(self.data)
+        self.expected = [self._copy(stepper.current_player_states)]
+        for _ in self.data["events"]:
+            stepper.next_event()
+            self.expected.append(self._copy(stepper.current_player_states))
+
+    @staticmethod
+    def _copy(states):
+        return {name: dict(state) for name, state in states.items()}
+
+    def test_random_seeks(self):
+        """Test jumps and step-backs for several snapshot intervals"""
+        total = len(self.data["events"])
+        rng = random.Random(7)
+        for interval in (1, 4, 7, total, 100):
+            manager = GameStateManager(self.data, snapshot_interval=interval)
+            for _ in range(60):
+                index = rng.randint(0, total)
+                state = manager.jump_to_event(index)
+                self.assertEqual(state["event_index"], index)
+                self.assertEqual(state["player_states"], self.expected[index])
+
+            manager.jump_to_event(total)
+            for index in range(total - 1, -1, -1):
+                state = manager.prev_event()
+                self.assertEqual(state["player_states"], self.expected[index])
+
+    def test_shared_snapshots(self):
+        """Test that managers built from another's snapshots seek the same"""
+        first = GameStateManager(self.data, snapshot_interval=4)
+        second = GameStateManager(self.data, 4, snapshots=first.snapshots)
+        self.assertIs(second.snapshots, first.snapshots)
+
+        total = len(self.data["events"])
+        first.jump_to_event(total)
+        for index in (total, 5, 0, 13):
+            state = second.jump_to_event(index)
+            self.assertEqual(state["player_states"], self.expected[index])
+
+    def test_jump_to_round(self):
+        """Test jumping to the first event of a round"""
+        manager = GameStateManager(self.data, snapshot_interval=4)
+        state = manager.jump_to_round(2)
+        self.assertEqual(state["event_index"], 9)
+        self.assertEqual(state["current_event"].round_num, 2)
+        self.assertEqual(manager.get_dead_players(), ["Bob", "David"])
+
+        # Unknown rounds leave the position unchanged
+        self.assertEqual(manager.jump_to_round(9)["event_index"], 9)
+
+    def test_snapshots_leave_start_state(self):
+        """Test that building snapshots does not advance the game"""
+        manager = GameStateManager(self.data, snapshot_interval=2)
+        self.assertEqual(manager.current_player_states, self.expected[0])
+        self.assertEqual(len(manager.get_alive_players()), len(NAMES))
+        self.assertEqual(manager.reset()["player_states"], self.expected[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+"""
+Smoke test of the end-to-end throughput benchmark
+"""
+
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+# Mock agentscope before importing the orchestrator
+sys.modules["agentscope"] = MagicMock()
+sys.modules["agentscope.message"] = MagicMock()
+
+import benchmark_throughput
+from werewolf.config import MODEL_CONFIGS
+
+
+class TestThroughputBenchmark(unittest.TestCase):
+    """Test that the benchmark plays games and reports every figure"""
+
+    def test_report(self):
+        """Test one six-player game with the canned model"""
+        report = benchmark_throughput.run_benchmark(["six"], games=1, seed=3)
+
+        result = report["results"]["six"]
+        self.assertEqual(result["games"], 1)
+        self.assertGreater(result["games_per_hour"], 0)
+        self.assertGreater(result["llm_calls_per_game"], 0)
+        self.assertGreater(result["llm_calls_by_site"]["vote"], 0)
+        self.assertGreater(result["bytes_per_game"]["game_logs"], 0)
+        self.assertGreater(result["parsed_events_per_game"], 0)
+        self.assertEqual(
+            set(result["cpu_seconds"]),
+            set(benchmark_throughput.CPU_CATEGORIES) | {"total"},
+        )
+        self.assertGreater(result["cpu_seconds"]["engine"], 0)
+        # The temporary model config is removed again
+        self.assertNotIn(
+            benchmark_throughput.CONFIG_NAME,
+            [c["config_name"] for c in MODEL_CONFIGS],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit tests for the buffered transcript writer
+"""
+
+import gc
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from werewolf.transcript import TranscriptWriter
+
+
+class TestTranscriptWriter(unittest.TestCase):
+    """Test flush policies of TranscriptWriter"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "game.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _read(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def test_flush_by_line_count(self):
+        """Test that lines are written in batches of flush_lines"""
+        writer = TranscriptWriter(self.path, flush_lines=3, flush_interval=None)
+        writer.write_header(["HEADER", ""])
+
+        writer.write("one")
+        writer.write("two")
+        self.assertEqual(self._read(), "HEADER\n")
+
+        writer.write("three")
+        self.assertEqual(self._read(), "HEADER\none\ntwo\nthree\n")
+        self.assertEqual(writer.flushes, 1)
+
+    def test_flush_by_time(self):
+        """Test that a line arriving after flush_interval triggers a flush"""
+        writer = TranscriptWriter(self.path, flush_lines=100, flush_interval=5.0)
+        writer.write_header([""])
+
+        with patch("werewolf.transcript.time.monotonic") as clock:
+            clock.return_value = writer._last_flush + 1
+            writer.write("early")
+            self.assertEqual(self._read(), "")
+
+            clock.return_value = writer._last_flush + 6
+            writer.write("late")
+        self.assertEqual(self._read(), "early\nlate\n")
+
+    def test_phase_boundary(self):
+        """Test flush at phase boundaries, and that it can be disabled"""
+        writer = TranscriptWriter(self.path, flush_lines=100, flush_interval=None)
+        writer.write_header([""])
+        writer.write("night")
+        writer.phase_boundary()
+        self.assertEqual(self._read(), "night\n")
+
+        quiet = TranscriptWriter(
+            self.path, flush_lines=100, flush_interval=None, flush_on_phase=False
+        )
+        quiet.write("day")
+        quiet.phase_boundary()
+        self.assertEqual(self._read(), "night\n")
+        quiet.close()
+        self.assertEqual(self._read(), "night\nday\n")
+
+    def test_writes_after_close_go_straight_to_file(self):
+        """Test that a closed writer no longer buffers"""
+        writer = TranscriptWriter(self.path, flush_lines=100, flush_interval=None)
+        writer.write_header([""])
+        writer.close()
+        writer.write("late")
+        self.assertEqual(self._read(), "late\n")
+
+    def test_unclosed_writer_flushes_when_collected(self):
+        """Test the last-resort flush of a dropped writer"""
+        writer = TranscriptWriter(self.path, flush_lines=100, flush_interval=None)
+        writer.write_header([""])
+        writer.write("pending")
+        del writer
+        gc.collect()
+        self.assertEqual(self._read(), "pending\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 Unit tests for WerewolfGame class
 """
 
+import pickle
 import unittest
 from unittest.mock import patch
 from werewolf import WerewolfGame
@@ -549,6 +550,215 @@ class TestGameState(unittest.TestCase):
         self.assertIn(target, game.state.death_records)
         self.assertEqual(game.state.death_records[target], "voted_out")
 
+    def test_alive_mask_follows_alive_players(self):
+        """Test that list edits and the bitmask stay in sync"""
+        players = ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"]
+        game = WerewolfGame(players, game_type="six")
+
+        game.state.alive_players.remove("Bob")
+        self.assertFalse(game.state.is_alive("Bob"))
+        self.assertEqual(game.state.count_alive(), 5)
+
+        game.state.alive_players = ["Alice", "Eve"]
+        self.assertEqual(game.state.alive_mask, 0b10001)
+        self.assertTrue(game.state.kill("Eve"))
+        self.assertFalse(game.state.kill("Eve"))
+        self.assertEqual(game.state.alive_players, ["Alice"])
+
+    def test_role_masks_follow_roles(self):
+        """Test that in-place role edits and the masks stay in sync"""
+        players = ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"]
+        game = WerewolfGame(players, game_type="six")
+        state = game.state
+        clone = state.copy()
+
+        for player in players:
+            state.roles[player] = Role.VILLAGER
+        self.assertEqual(state.alive_with_role(Role.WEREWOLF), [])
+        self.assertEqual(state.werewolves_alive, 0)
+        self.assertEqual(game.check_game_end(), (True, "villagers"))
+
+        state.roles.update(Alice=Role.WEREWOLF)
+        self.assertEqual(state.alive_with_role(Role.WEREWOLF), ["Alice"])
+        self.assertEqual(state.civilians_alive, 5)
+        # The clone keeps its own roles
+        self.assertEqual(clone.werewolves_alive, 2)
+        self.assertEqual(len(clone.alive_with_role(Role.WEREWOLF)), 2)
+        self.assertIs(type(pickle.loads(pickle.dumps(state)).roles), type(state.roles))
+
+    def test_team_counts(self):
+        """Test popcount team counts against the role assignment"""
+        players = [f"Player{i}" for i in range(12)]
+        game = WerewolfGame(players, game_type="twelve")
+
+        self.assertEqual(game.state.count_alive(Role.WEREWOLF), 4)
+        self.assertEqual(
+            game.state.count_alive(Role.SEER, Role.WITCH, Role.HUNTER, Role.GUARDIAN),
+            4,
+        )
+        wolf = game.state.alive_with_role(Role.WEREWOLF)[0]
+        game.state.kill(wolf)
+        self.assertEqual(game.state.count_alive(Role.WEREWOLF), 3)
+        self.assertNotIn(wolf, game.state.alive_with_role(Role.WEREWOLF))
+
+    def test_team_counters_track_every_removal(self):
+        """Test that live team counters match a full recount after each death"""
+        players = [f"Player{i}" for i in range(12)]
+        game = WerewolfGame(players, game_type="twelve")
+        state = game.state
+
+        def assert_counts():
+            alive_roles = [state.roles[p] for p in state.alive_players]
+            self.assertEqual(state.werewolves_alive, alive_roles.count(Role.WEREWOLF))
+            self.assertEqual(state.civilians_alive, alive_roles.count(Role.VILLAGER))
+            self.assertEqual(
+                state.gods_alive,
+                len(alive_roles)
+                - alive_roles.count(Role.WEREWOLF)
+                - alive_roles.count(Role.VILLAGER),
+            )
+
+        wolves = state.alive_with_role(Role.WEREWOLF)
+        villager = state.alive_with_role(Role.VILLAGER)[0]
+        game.execute_night_phase({w: villager for w in wolves})
+        assert_counts()
+
+        seer = state.alive_with_role(Role.SEER)[0]
+        game.execute_day_phase({p: seer for p in state.alive_players})
+        assert_counts()
+
+        hunter = state.alive_with_role(Role.HUNTER)[0]
+        self.assertTrue(game.execute_hunter_shot(hunter, wolves[0]))
+        self.assertFalse(game.execute_hunter_shot(hunter, wolves[0]))
+        self.assertEqual(state.death_records[wolves[0]], "hunter_shot")
+        assert_counts()
+
+        state.alive_players.remove(wolves[1])
+        assert_counts()
+        state.alive_players = list(players)
+        assert_counts()
+
+    def test_copy_is_independent(self):
+        """Test that state copies do not share mutable state"""
+        import copy
+        import pickle
+
+        players = ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"]
+        game = WerewolfGame(players, game_type="six")
+
+        clone = game.state.copy()
+        clone.kill("Alice")
+        clone.game_log.append("extra")
+        self.assertTrue(game.state.is_alive("Alice"))
+        self.assertNotIn("extra", game.state.game_log)
+
+        for restored in (
+            copy.deepcopy(game.state),
+            pickle.loads(pickle.dumps(game.state)),
+        ):
+            self.assertEqual(restored, game.state)
+            restored.alive_players.remove("Bob")
+            self.assertFalse(restored.is_alive("Bob"))
+            self.assertTrue(game.state.is_alive("Bob"))
+
+    def test_to_dict_uses_plain_lists(self):
+        """Test that to_dict output is JSON-compatible plain data"""
+        import json
+
+        players = ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"]
+        game = WerewolfGame(players, game_type="six")
+        game.state.alive_players.remove("Alice")
+
+        state_dict = game.to_dict()
+        self.assertIs(type(state_dict["alive"]), list)
+        self.assertEqual(state_dict["alive"], players[1:])
+        self.assertEqual(json.loads(json.dumps(state_dict)), state_dict)
+
+
+class TestSnapshotFork(unittest.TestCase):
+    """Test snapshot/restore and fork for lookahead"""
+
+    def setUp(self):
+        self.players = ["Alice", "Bob", "Charlie", "David", "Eve", "Frank"]
+        self.game = WerewolfGame(self.players, game_type="six")
+        self.witch = self.game.state.alive_with_role(Role.WITCH)[0]
+
+    def test_fork_is_independent(self):
+        """Test that playing a fork leaves the original untouched"""
+        target = [p for p in self.players if p != self.witch][0]
+        before = self.game.to_dict()
+
+        fork = self.game.fork()
+        fork.execute_night_phase({self.witch: f"poison:{target}"})
+
+        self.assertFalse(fork.state.is_alive(target))
+        self.assertTrue(fork.state.witch_poison_used)
+        self.assertEqual(self.game.to_dict(), before)
+        self.assertFalse(self.game.state.witch_poison_used)
+        self.assertEqual(
+            fork.state.game_log[: len(before["game_log"])], before["game_log"]
+        )
+
+    def test_fork_keeps_roles(self):
+        """Test that forking does not reshuffle roles"""
+        with patch("random.shuffle") as shuffle:
+            fork = self.game.fork()
+        shuffle.assert_not_called()
+        self.assertEqual(fork.state.roles, self.game.state.roles)
+
+    def test_restore_snapshot_repeatedly(self):
+        """Test that a snapshot can be restored more than once"""
+        snapshot = self.game.snapshot()
+
+        for target in [p for p in self.players if p != self.witch][:2]:
+            self.game.execute_night_phase({self.witch: f"poison:{target}"})
+            self.assertFalse(self.game.state.is_alive(target))
+            self.game.restore(snapshot)
+            self.assertTrue(self.game.state.is_alive(target))
+            self.assertFalse(self.game.state.witch_poison_used)
+            self.assertEqual(len(self.game.state.game_log), 1)
+
+    def test_logs_are_shared_not_copied(self):
+        """Test that forked logs diverge without copying the shared prefix"""
+        from werewolf.persistent_log import PersistentLog
+
+        log = PersistentLog(["a", "b"])
+        fork = log.fork()
+        fork.append("c")
+        log.append("d")
+
+        self.assertEqual(list(log), ["a", "b", "d"])
+        self.assertEqual(list(fork), ["a", "b", "c"])
+        self.assertEqual(fork[-1], "c")
+        self.assertEqual(len(fork), 3)
+
+    def test_state_exports_plain_lists(self):
+        """Test that pickled and dumped state carries lists, not logs"""
+        import json
+
+        state = self.game.state.__getstate__()
+        self.assertIs(type(state["game_log"]), list)
+        self.assertIs(type(state["history"]), list)
+        json.dumps(self.game.to_dict())
+
+    def test_checkpoint_round_trip(self):
+        """Test that a game survives a JSON checkpoint round trip"""
+        import json
+
+        target = [p for p in self.players if p != self.witch][0]
+        self.game.execute_night_phase({self.witch: f"poison:{target}"})
+
+        data = json.loads(json.dumps(self.game.to_checkpoint()))
+        restored = WerewolfGame.from_checkpoint(data)
+
+        self.assertEqual(restored.to_dict(), self.game.to_dict())
+        self.assertEqual(restored.state.roles, self.game.state.roles)
+        self.assertEqual(restored.state.death_records, {target: "witch_poison"})
+        self.assertFalse(restored.state.is_alive(target))
+        self.assertEqual(
+            restored.state.werewolves_alive, self.game.state.werewolves_alive
+        )
+
 
 class TestHunterRole(unittest.TestCase):
     """Test Hunter role functionality"""
@@ -1,17 +1,35 @@
 from flask import Flask, render_template, jsonify, request, send_from_directory
 import os
 import json
-import re
 from pathlib import Path
-from parser import GameLogParser
 from state_manager import GameStateManager
+from game_index import GameIndex
+from game_cache import ParsedGameCache
+from sessions import SessionStore, new_session_id
 
 app = Flask(__name__)
 
-# Store current game state manager
-current_game = None
-current_game_filename = None
-game_data_cache = {}
+# One game viewer per browser session, dropped after 30 idle minutes or
+# LRU beyond the caps
+sessions = SessionStore(
+    max_sessions=int(os.getenv("WEREWOLF_SESSIONS_MAX", "200")),
+    max_bytes=int(os.getenv("WEREWOLF_SESSIONS_BYTES", str(512 * 1024 * 1024))),
+    idle_timeout=float(os.getenv("WEREWOLF_SESSION_IDLE_SECONDS", "1800")),
+)
+
+# Cookie "<session id>:<event index>:<log filename>"; it carries the whole
+# position, so any worker process can restore a session it has not seen
+VIEW_COOKIE = "werewolf_view"
+
+# Parsed games, revalidated against file mtime/size and evicted LRU
+game_cache = ParsedGameCache(
+    max_entries=int(os.getenv("WEREWOLF_GAME_CACHE_ENTRIES", "32")),
+    max_bytes=int(os.getenv("WEREWOLF_GAME_CACHE_BYTES", str(256 * 1024 * 1024))),
+)
+
+# Persistent index behind the game lists, updated from file mtime/size
+# (rescanned at most every 2 seconds)
+game_index = GameIndex(refresh_interval=2.0)
 
 
 def get_training_directory():
@@ -55,33 +73,17 @@ def get_available_logs():
     if not logs_dir.exists():
         return []
 
-    log_files = []
-    for file_path in logs_dir.glob("*.txt"):
-        # Quick check if game completed normally by looking for GAME OVER marker
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                if (
-                    "============================================================\nGAME OVER\n============================================================"
-                    in content
-                ):
-                    log_files.append(
-                        {
-                            "filename": file_path.name,
-                            "path": str(file_path),
-                            "size": file_path.stat().st_size,
-                            "modified": file_path.stat().st_mtime,
-                        }
-                    )
-        except Exception as e:
-            # Skip files that can't be read
-            print(f"Warning: Could not read {file_path.name}: {e}")
-            continue
-
-    # Sort by modification time (newest first)
-    log_files.sort(key=lambda x: x["modified"], reverse=True)
-
-    return log_files
+    game_index.refresh(logs_dir)
+    # Indexed games are sorted by modification time (newest first)
+    return [
+        {
+            "filename": game["filename"],
+            "path": game["path"],
+            "size": game["size"],
+            "modified": game["modified"],
+        }
+        for game in game_index.games(logs_dir, completed_only=True)
+    ]
 
 
 # Reviews helper functions
@@ -355,39 +357,124 @@ def api_logs():
     return jsonify(logs)
 
 
-@app.route("/api/load/<filename>")
-def api_load_log(filename):
-    """Load a specific log file"""
-    global current_game, current_game_filename
+def resolve_log_path(filename):
+    """Path of a log in the game logs directory, or None for any other name"""
+    if not filename or Path(filename).name != filename:
+        return None
+    return get_game_logs_directory() / filename
 
-    logs_dir = get_game_logs_directory()
-    log_path = logs_dir / filename
 
-    if not log_path.exists():
-        return jsonify({"error": "Log file not found"}), 404
+def read_view_cookie():
+    """(session id, event index, filename) from the view cookie, or None"""
+    parts = request.cookies.get(VIEW_COOKIE, "").split(":", 2)
+    if len(parts) != 3 or not parts[0] or not parts[1].isdigit():
+        return None
+    return parts[0], int(parts[1]), parts[2]
 
-    # Check cache
-    if filename in game_data_cache:
-        parsed_data = game_data_cache[filename]
-    else:
-        # Parse the log file
+
+def load_game(log_path):
+    """Parsed game at `log_path` and a new state manager positioned at 0
+
+    The manager's snapshots are built once per parse and cached with the
+    game, so creating a manager costs no replay of the events.
+
+    Raises:
+        Exception: If the log cannot be read or parsed
+    """
+    parsed_data, snapshots = game_cache.get_derived(
+        log_path, "snapshots", lambda parsed: GameStateManager(parsed).snapshots
+    )
+    return parsed_data, GameStateManager(parsed_data, snapshots=snapshots)
+
+
+def get_session():
+    """The caller's game session and event index, or (None, 0) without one"""
+    view = read_view_cookie()
+    if view is None:
+        return None, 0
+    session_id, event_index, filename = view
+
+    session = sessions.get(session_id)
+    if session is None or session.filename != filename:
+        # Expired, evicted or started by another worker
+        log_path = resolve_log_path(filename)
+        if log_path is None:
+            return None, 0
         try:
-            parser = GameLogParser(str(log_path))
-            parsed_data = parser.parse()
+            parsed_data, manager = load_game(log_path)
+        except Exception:
+            return None, 0
+        # Same rule as api_load_log: only completed games can be viewed
+        if not parsed_data["game_info"].get("game_completed", False):
+            return None, 0
+        session = sessions.put(session_id, filename, manager, log_path.stat().st_size)
+    return session, event_index
 
-            # Check if game completed normally
-            if not parsed_data["game_info"].get("game_completed", False):
-                return jsonify({"error": "This game did not complete normally"}), 400
 
-            game_data_cache[filename] = parsed_data
-        except Exception as e:
-            return jsonify({"error": f"Failed to parse log file: {str(e)}"}), 500
+def state_to_json(state):
+    """Convert the current event of a state to a dict for jsonify"""
+    if state["current_event"]:
+        event = state["current_event"]
+        state["current_event"] = {
+            "round_num": event.round_num,
+            "phase": event.phase,
+            "event_type": event.event_type,
+            "data": event.data,
+            "timestamp": event.timestamp,
+        }
+    return state
 
-    # Create state manager and store filename
-    current_game = GameStateManager(parsed_data)
-    current_game_filename = filename
 
-    return jsonify(
+def navigate(action):
+    """Apply `action` to the caller's game and return the resulting state"""
+    session, event_index = get_session()
+    if session is None:
+        return jsonify({"error": "No game loaded"}), 400
+
+    with session.lock:
+        game = session.manager
+        if game.current_event_index != event_index:
+            # Moved by a request another worker served
+            game.jump_to_event(event_index)
+        response = jsonify(state_to_json(action(game)))
+        event_index = game.current_event_index
+
+    response.set_cookie(
+        VIEW_COOKIE,
+        f"{session.session_id}:{event_index}:{session.filename}",
+        httponly=True,
+        samesite="Lax",
+    )
+    return response
+
+
+@app.route("/api/load/<filename>")
+def api_load_log(filename):
+    """Load a specific log file"""
+    log_path = resolve_log_path(filename)
+
+    if log_path is None or not log_path.exists():
+        return jsonify({"error": "Log file not found"}), 404
+
+    try:
+        parsed_data, manager = load_game(log_path)
+    except Exception as e:
+        return jsonify({"error": f"Failed to parse log file: {str(e)}"}), 500
+
+    # Check if game completed normally
+    if not parsed_data["game_info"].get("game_completed", False):
+        return jsonify({"error": "This game did not complete normally"}), 400
+
+    # Use the state manager for this browser's session
+    view = read_view_cookie()
+    session = sessions.put(
+        view[0] if view else new_session_id(),
+        filename,
+        manager,
+        log_path.stat().st_size,
+    )
+
+    response = jsonify(
         {
             "success": True,
             "game_info": parsed_data["game_info"],
@@ -404,126 +491,70 @@ def api_load_log(filename):
             "total_events": len(parsed_data["events"]),
         }
     )
+    response.set_cookie(
+        VIEW_COOKIE, f"{session.session_id}:0:{filename}", httponly=True, samesite="Lax"
+    )
+    return response
 
 
 @app.route("/api/state")
 def api_get_state():
-    """Get current game state"""
-    global current_game
+    """Get current game state; ?game=<file>&event=<n> needs no session"""
+    filename = request.args.get("game")
+    if filename is None:
+        return navigate(lambda game: game.get_current_state())
 
-    if current_game is None:
-        return jsonify({"error": "No game loaded"}), 400
+    # Stateless: the state of any game after n events
 
-    state = current_game.get_current_state()
+    log_path = resolve_log_path(filename)
+    if log_path is None or not log_path.exists():
+        return jsonify({"error": "Log file not found"}), 404
+    try:
+        parsed_data, game = load_game(log_path)
+    except Exception as e:
+        return jsonify({"error": f"Failed to parse log file: {str(e)}"}), 500
 
-    # Convert event to dict if it exists
-    if state["current_event"]:
-        event = state["current_event"]
-        state["current_event"] = {
-            "round_num": event.round_num,
-            "phase": event.phase,
-            "event_type": event.event_type,
-            "data": event.data,
-            "timestamp": event.timestamp,
-        }
+    event_index = request.args.get("event", 0, type=int)
+    if not 0 <= event_index <= len(parsed_data["events"]):
+        return jsonify({"error": "Event index out of range"}), 400
 
-    return jsonify(state)
+    return jsonify(state_to_json(game.jump_to_event(event_index)))
 
 
 @app.route("/api/next")
 def api_next_event():
     """Move to next event"""
-    global current_game
-
-    if current_game is None:
-        return jsonify({"error": "No game loaded"}), 400
-
-    state = current_game.next_event()
-
-    # Convert event to dict
-    if state["current_event"]:
-        event = state["current_event"]
-        state["current_event"] = {
-            "round_num": event.round_num,
-            "phase": event.phase,
-            "event_type": event.event_type,
-            "data": event.data,
-            "timestamp": event.timestamp,
-        }
-
-    return jsonify(state)
+    return navigate(lambda game: game.next_event())
 
 
 @app.route("/api/prev")
 def api_prev_event():
     """Move to previous event"""
-    global current_game
-
-    if current_game is None:
-        return jsonify({"error": "No game loaded"}), 400
-
-    state = current_game.prev_event()
-
-    # Convert event to dict
-    if state["current_event"]:
-        event = state["current_event"]
-        state["current_event"] = {
-            "round_num": event.round_num,
-            "phase": event.phase,
-            "event_type": event.event_type,
-            "data": event.data,
-            "timestamp": event.timestamp,
-        }
-
-    return jsonify(state)
+    return navigate(lambda game: game.prev_event())
 
 
 @app.route("/api/jump/<int:event_index>")
 def api_jump_to_event(event_index):
     """Jump to specific event"""
-    global current_game
-
-    if current_game is None:
-        return jsonify({"error": "No game loaded"}), 400
-
-    state = current_game.jump_to_event(event_index)
-
-    # Convert event to dict
-    if state["current_event"]:
-        event = state["current_event"]
-        state["current_event"] = {
-            "round_num": event.round_num,
-            "phase": event.phase,
-            "event_type": event.event_type,
-            "data": event.data,
-            "timestamp": event.timestamp,
-        }
-
-    return jsonify(state)
+    return navigate(lambda game: game.jump_to_event(event_index))
 
 
 @app.route("/api/reset")
 def api_reset():
     """Reset to beginning"""
-    global current_game
+    return navigate(lambda game: game.reset())
 
-    if current_game is None:
-        return jsonify({"error": "No game loaded"}), 400
 
-    state = current_game.reset()
-
-    # Convert event to dict
-    if state["current_event"]:
-        event = state["current_event"]
-        state["current_event"] = {
-            "round_num": event.round_num,
-            "phase": event.phase,
-            "event_type": event.event_type,
-            "data": event.data,
-            "timestamp": event.timestamp,
+@app.route("/api/cache/stats")
+def api_cache_stats():
+    """Counters of the parsed game cache, the game index and the sessions"""
+    return jsonify(
+        {
+            "games": game_cache.stats(),
+            "index": {"files_parsed": game_index.parsed},
+            "sessions": sessions.stats(),
         }
-
-    return jsonify(state)
+    )
 
 
 def generate_game_reviews_and_lessons(overview):
@@ -781,10 +812,12 @@ def calculate_survival_rounds(player_data):
 @app.route("/api/overview")
 def api_game_overview():
     """Get comprehensive game overview for quick analysis"""
-    global current_game, current_game_filename
-
-    if current_game is None:
+    session, _ = get_session()
+    if session is None:
         return jsonify({"error": "No game loaded"}), 400
+    # Only the parsed game is read, which no request modifies
+    current_game = session.manager
+    current_game_filename = session.filename
 
     # Get the current log file content
     raw_log_content = ""
@@ -1074,43 +1107,21 @@ def api_games():
         except Exception as e:
             print(f"Error reading manifest: {e}")
 
-    # 回退到文件系统扫描
-    for file_path in logs_dir.glob("*.txt"):
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-                # 提取基本信息
-                game_type_match = re.search(r"Game Type: (\w+)", content)
-                game_type = game_type_match.group(1) if game_type_match else "unknown"
-
-                players_match = re.search(r"Players: (.+)", content)
-                players = players_match.group(1).split(", ") if players_match else []
-
-                winner_match = re.search(
-                    r"(WEREWOLVES WIN|VILLAGERS WIN|DRAW)", content
-                )
-                winner = winner_match.group(1) if winner_match else "unknown"
-
-                rounds = len(re.findall(r"ROUND \d+", content))
-
-                games.append(
-                    {
-                        "id": file_path.stem,
-                        "filename": file_path.name,
-                        "game_type": game_type,
-                        "player_count": len(players),
-                        "rounds": rounds,
-                        "winner": winner,
-                        "timestamp": file_path.stat().st_mtime,
-                    }
-                )
-        except Exception as e:
-            print(f"Error processing {file_path}: {e}")
-            continue
+    # 回退到游戏索引（仅重新解析新增或修改过的文件）
+    game_index.refresh(logs_dir)
+    for game in game_index.games(logs_dir):
+        games.append(
+            {
+                "id": Path(game["filename"]).stem,
+                "filename": game["filename"],
+                "game_type": game["game_type"],
+                "player_count": game["player_count"],
+                "rounds": game["rounds"],
+                "winner": game["winner"],
+                "timestamp": game["modified"],
+            }
+        )
 
-    # 按时间排序
-    games.sort(key=lambda x: x["timestamp"], reverse=True)
     return jsonify(games)
 
 
@@ -1131,16 +1142,8 @@ def api_game_data(game_id):
         return jsonify({"error": "Game not found"}), 404
 
     try:
-        # 检查缓存
-        if filename in game_data_cache:
-            parsed_data = game_data_cache[filename]
-        else:
-            parser = GameLogParser(str(log_path))
-            parsed_data = parser.parse()
-            game_data_cache[filename] = parsed_data
-
         # 创建临时状态管理器来获取完整数据
-        temp_game = GameStateManager(parsed_data)
+        parsed_data, temp_game = load_game(log_path)
 
         # 构建完整的游戏数据
         game_data = {
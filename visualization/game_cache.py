@@ -0,0 +1,134 @@
+"""
+Bounded cache of parsed games for the visualizer
+
+Entries are keyed by log path and validated against the file's mtime and
+size on every lookup, so a rewritten or still-growing log is parsed again
+instead of served stale. The least recently used games are evicted once
+the cache holds more than `max_entries` games or more than `max_bytes` of
+transcripts (the log size stands in for the size of the parsed game).
+Values derived from a game (see `get_derived`) live and die with its entry.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from parser import GameLogParser
+
+
+class ParsedGameCache:
+    """LRU cache of `GameLogParser.parse()` results
+
+    Args:
+        max_entries: Maximum number of cached games (None = unbounded)
+        max_bytes: Maximum total size of the cached logs (None = unbounded)
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = 32, max_bytes: Optional[int] = None
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0  # Misses because the file changed
+        self.evictions = 0
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+        # Path -> ((mtime_ns, size), parsed data, derived values), least
+        # recently used first
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, log_path) -> Dict[str, Any]:
+        """Return the parsed game at `log_path`, parsing it on a miss
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        path = os.path.abspath(log_path)
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == version:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+            if cached is not None:
+                self.invalidations += 1
+
+        # Parse outside the lock so other games are served meanwhile
+        parsed = GameLogParser(path).parse()
+
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self.total_bytes -= old[0][1]
+            self._entries[path] = (version, parsed, {})
+            self.total_bytes += stat.st_size
+            self._evict()
+        return parsed
+
+    def get_derived(
+        self, log_path, name: str, build: Callable[[Dict[str, Any]], Any]
+    ) -> Tuple[Dict[str, Any], Any]:
+        """Return the parsed game and `build(parsed)`, cached under `name`
+
+        The derived value is computed once per parse of the log and dropped
+        when the log changes or its entry is evicted. It is shared by every
+        caller, so it must not be mutated.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        path = os.path.abspath(log_path)
+        parsed = self.get(path)
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[1] is parsed and name in cached[2]:
+                return parsed, cached[2][name]
+
+        value = build(parsed)
+
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[1] is parsed:
+                cached[2][name] = value
+        return parsed, value
+
+    def _evict(self):
+        # The newest entry is always kept, even if it alone exceeds max_bytes
+        while len(self._entries) > 1 and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            _, (version, _, _) = self._entries.popitem(last=False)
+            self.total_bytes -= version[1]
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current size, for the stats endpoint"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
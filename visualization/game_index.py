@@ -0,0 +1,256 @@
+"""
+Persistent index of game logs for the visualizer
+
+Listing games used to read every transcript on every request. The index keeps
+one SQLite row per log file with what the game lists show (completed, game
+type, players, rounds, winner), keyed by path, mtime and size. `refresh`
+only stats the directory and re-parses files that are new or changed, and
+`games` keeps its last result in memory until the index changes, so a
+listing over thousands of archived games is served in milliseconds.
+
+    python game_index.py [logs_dir]    # build or update the index up front
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from parser import GameLogParser
+
+# Bump when the summary columns change; older indexes are rebuilt
+SCHEMA_VERSION = 1
+
+DEFAULT_INDEX_PATH = os.getenv(
+    "WEREWOLF_GAME_INDEX",
+    str(Path(__file__).parent.parent / ".training" / "cache" / "game_index.sqlite"),
+)
+
+
+_LIST_COLUMNS = (
+    "path",
+    "filename",
+    "mtime_ns",
+    "size",
+    "completed",
+    "game_type",
+    "player_count",
+    "rounds",
+    "winner",
+)
+
+
+def summarize_log(path: str) -> Dict[str, Any]:
+    """Read a transcript once and return its game list fields"""
+    parser = GameLogParser(path)
+    for _ in parser.iter_events():
+        pass  # Only game info is kept; events are dropped as they stream by
+
+    info = parser.game_info
+    return {
+        "completed": bool(info.get("game_completed")),
+        "game_type": info.get("game_type", "unknown"),
+        "player_count": len(info.get("player_names", [])),
+        "rounds": parser.current_round,
+        "winner": info.get("winner", "unknown"),
+    }
+
+
+class GameIndex:
+    """SQLite index of the game logs in one or more directories
+
+    Args:
+        path: Database file path (created on first use)
+        refresh_interval: Seconds during which `refresh` of the same
+            directory is skipped; statting 20k files takes ~0.1 s
+    """
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH, refresh_interval: float = 0.0):
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.parsed = 0  # Files (re)parsed by refresh, for stats
+        self._lock = threading.Lock()
+        self._refreshed: Dict[str, float] = {}  # Directory -> monotonic time
+        self._writes = 0
+        self._listings: Dict[tuple, tuple] = {}  # (dir, completed) -> (version, games)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not cross a fork (multi-worker WSGI servers)
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            self._pid = os.getpid()
+            self._listings.clear()  # Versions are per connection
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS games")
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS games (
+                    path TEXT PRIMARY KEY,
+                    directory TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    completed INTEGER NOT NULL,
+                    game_type TEXT,
+                    player_count INTEGER,
+                    rounds INTEGER,
+                    winner TEXT
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS games_directory ON games (directory)"
+            )
+        return self._conn
+
+    def refresh(self, logs_dir, force: bool = False) -> Optional[Dict[str, int]]:
+        """Bring the rows of `logs_dir` up to date with the files on disk
+
+        Returns:
+            Counts of added, updated, removed and unchanged files, or None if
+            the directory was refreshed less than `refresh_interval` ago
+        """
+        directory = os.path.abspath(logs_dir)
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+        with self._lock:
+            now = time.monotonic()
+            last = self._refreshed.get(directory)
+            if not force and last is not None and now - last < self.refresh_interval:
+                return None
+            self._refreshed[directory] = now
+
+            conn = self._connection()
+            stored = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in conn.execute(
+                    "SELECT path, mtime_ns, size FROM games WHERE directory = ?",
+                    (directory,),
+                )
+            }
+
+            rows = []
+            try:
+                entries = list(os.scandir(directory))
+            except FileNotFoundError:
+                entries = []
+            for entry in entries:
+                if not entry.name.endswith(".txt") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                known = stored.pop(entry.path, None)
+                if known == (stat.st_mtime_ns, stat.st_size):
+                    counts["unchanged"] += 1
+                    continue
+                counts["added" if known is None else "updated"] += 1
+                rows.append(self._row(directory, entry, stat))
+
+            counts["removed"] = len(stored)
+            if rows or stored:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO games VALUES "
+                        "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    conn.executemany(
+                        "DELETE FROM games WHERE path = ?", [(p,) for p in stored]
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                self._writes += 1
+        return counts
+
+    def _row(self, directory: str, entry: os.DirEntry, stat) -> tuple:
+        self.parsed += 1
+        try:
+            summary = summarize_log(entry.path)
+        except Exception as e:
+            # Indexed as incomplete, so it is not re-read until it changes
+            print(f"Warning: Could not read {entry.name}: {e}")
+            summary = {
+                "completed": False,
+                "game_type": "unknown",
+                "player_count": 0,
+                "rounds": 0,
+                "winner": "unknown",
+            }
+        return (
+            entry.path,
+            directory,
+            entry.name,
+            stat.st_mtime_ns,
+            stat.st_size,
+            int(summary["completed"]),
+            summary["game_type"],
+            summary["player_count"],
+            summary["rounds"],
+            summary["winner"],
+        )
+
+    def games(self, logs_dir, completed_only: bool = False) -> List[Dict[str, Any]]:
+        """Indexed games of `logs_dir`, newest first (call `refresh` before)
+
+        The list is shared between callers until the index changes; do not
+        modify it.
+        """
+        directory = os.path.abspath(logs_dir)
+        key = (directory, completed_only)
+        query = f"SELECT {', '.join(_LIST_COLUMNS)} FROM games WHERE directory = ?"
+        if completed_only:
+            query += " AND completed = 1"
+        query += " ORDER BY mtime_ns DESC"
+
+        with self._lock:
+            conn = self._connection()
+            # data_version changes when another connection (process) commits
+            version = (conn.execute("PRAGMA data_version").fetchone()[0], self._writes)
+            cached = self._listings.get(key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            rows = conn.execute(query, (directory,)).fetchall()
+
+            games = []
+            for row in rows:
+                game = dict(zip(_LIST_COLUMNS, row))
+                game["modified"] = game.pop("mtime_ns") / 1e9
+                game["completed"] = bool(game["completed"])
+                games.append(game)
+            self._listings[key] = (version, games)
+        return games
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._listings.clear()
+
+
+def main():
+    logs_dir = sys.argv[1] if len(sys.argv) > 1 else None
+    if logs_dir is None:
+        from app import get_game_logs_directory
+
+        logs_dir = get_game_logs_directory()
+    index = GameIndex()
+    counts = index.refresh(logs_dir, force=True)
+    print(f"Index: {index.path}")
+    print(", ".join(f"{key}: {value}" for key, value in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
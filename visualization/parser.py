@@ -1,9 +1,15 @@
 """
 Game log parser for Werewolf game visualization
+
+Transcripts are read in a single pass, line by line. Each line is matched
+against a few precompiled patterns chosen by the section of the log it is in
+(night, morning, discussion, voting, ...), so memory stays bounded by the
+longest statement and logs that are still being written can be parsed
+incrementally with `GameLogParser.iter_events(final=False)`.
 """
 
 import re
-from typing import Dict, List, Any
+from typing import Any, Dict, Iterator, List, Optional
 from dataclasses import dataclass, field
 
 
@@ -25,7 +31,63 @@ class GameEvent:
     timestamp: int = 0  # Sequential timestamp for animation
 
 
+SEPARATOR = "=" * 60
+
+# Bytes read at a time; memory use is bounded by this plus the longest line
+BLOCK_SIZE = 64 * 1024
+
+# Section markers at the start of a line, e.g. "[NIGHT PHASE]", "[VOTING] ..."
+_MARKER_RE = re.compile(r"\[([A-Z ]+)\]")
+_ROUND_RE = re.compile(r"ROUND \d+$")
+
+# Header
+_GAME_TYPE_RE = re.compile(r"Game Type: (\w+)")
+_ROLE_RE = re.compile(r"\s+(\w+):\s+(\w+)")
+
+# Night
+_PROTECT_RE = re.compile(r"  (\w+) protects: (\w+)")
+_TARGET_RE = re.compile(r"  (\w+) targets: (\w+)$")
+_NIGHT_ACTION_RE = re.compile(
+    r"  (\w+) (?:"
+    r"checks: (?P<check>\w+)"
+    r"|does not save (?P<no_save>\w+)"
+    r"|saves (?P<save>\w+)$"
+    r"|(?P<no_poison>does not use poison)"
+    r"|poisons (?P<poison>\w+)$"
+    r"|learned: (?P<learned>\w+) is (?P<result>\w+)"
+    r")"
+)
+
+# Morning, last words and hunter shots
+_DEAD_RE = re.compile(r"  \[DEAD\] (\w+) died during the night \((\w+)\)")
+_LAST_WORDS_RE = re.compile(r"\[LAST WORDS\] (\w+)'s final statement:")
+_HUNTER_RE = re.compile(r"\[HUNTER SKILL\] (\w+) activates hunter ability!")
+_SHOOTS_RE = re.compile(r"  (\w+) shoots (\w+)!")
+_KILLED_RE = re.compile(r"  (\w+) \((\w+)\) is killed!")
+
+# Day
+_STATEMENT_RE = re.compile(r"(\w+):(?: (.+))?")
+_VOTE_RE = re.compile(r"  (\w+) votes for: (\w+)")
+_ELIMINATED_RE = re.compile(r"\[ELIMINATED\] (\w+) was eliminated by vote!")
+_ROLE_REVEAL_RE = re.compile(r"   Role: (\w+)")
+
+# Game over
+_WINNER_RE = re.compile(r"\[WINNER\] (\w+)")
+_ROUNDS_PLAYED_RE = re.compile(r"Rounds played: (\d+)")
+_FINAL_ROLE_RE = re.compile(r"\[(?:DEAD|ALIVE)\] (\w+): (\w+)")
+
+# Markers that end a discussion; anything else is part of a statement
+_DISCUSSION_END = ("VOTING", "ELIMINATED")
+
+
 class GameLogParser:
+    """Parse a game transcript into players, game info and `GameEvent`s
+
+    `parse()` reads the whole log. `iter_events()` yields events as lines are
+    read and can be called again on a growing log to continue where it
+    stopped.
+    """
+
     def __init__(self, log_file_path: str):
         self.log_file_path = log_file_path
         self.events: List[GameEvent] = []
@@ -34,23 +96,42 @@ class GameLogParser:
         self.current_round = 0
         self.event_counter = 0
 
+        # Line state machine
+        self._offset = 0
+        self._previous_line = ""
+        self._section = "header"
+        self._resume_section = "round"
+        self._phase = "night"
+        self._ready: List[GameEvent] = []
+        self._subject: Optional[str] = None  # Player the section is about
+        self._guardian_seen = False
+        self._werewolf_targets: Dict[str, str] = {}
+        self._votes: Dict[str, List[str]] = {}
+        self._speaker: Optional[str] = None
+        self._statement: List[str] = []
+        self._alive_seen = False
+        self._hunter_target: Optional[str] = None
+        self._line_handlers = {
+            "header": self._header_line,
+            "roles": self._header_line,
+            "round": self._ignore_line,
+            "guardian": self._night_line,
+            "werewolves": self._night_line,
+            "night": self._night_line,
+            "morning": self._morning_line,
+            "last_words": self._last_words_line,
+            "hunter": self._hunter_line,
+            "discussion": self._discussion_line,
+            "voting": self._voting_line,
+            "elimination": self._elimination_line,
+            "game_over": self._game_over_line,
+            "done": self._ignore_line,
+        }
+
     def parse(self) -> Dict[str, Any]:
         """Parse the game log file and extract all events"""
-        with open(self.log_file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Parse game info
-        self._parse_game_info(content)
-
-        # Parse rounds
-        rounds = re.split(r"={60}\nROUND \d+\n={60}", content)
-
-        for i, round_content in enumerate(rounds[1:], start=1):
-            self.current_round = i
-            self._parse_round(round_content)
-
-        # Parse game over
-        self._parse_game_over(content)
+        for events in self._read_blocks(final=True):
+            self.events.extend(events)
 
         return {
             "game_info": self.game_info,
@@ -58,441 +139,367 @@ class GameLogParser:
             "events": self.events,
         }
 
-    def _parse_game_info(self, content: str):
-        """Parse basic game information"""
-        # Game type
-        game_type_match = re.search(r"Game Type: (\w+)", content)
-        if game_type_match:
-            self.game_info["game_type"] = game_type_match.group(1)
-
-        # Players
-        players_match = re.search(r"Players: ([^\n]+)", content)
-        if players_match:
-            player_names = [name.strip() for name in players_match.group(1).split(",")]
-            self.game_info["player_names"] = player_names
-            for name in player_names:
-                self.players[name] = Player(name=name)
-
-        # Werewolf team
-        werewolf_match = re.search(r"Werewolf team: ([^\n]+)", content)
-        if werewolf_match:
-            werewolf_names = [
-                name.strip() for name in werewolf_match.group(1).split(",")
-            ]
-            self.game_info["werewolf_team"] = werewolf_names
-
-        # Parse all player roles
-        role_section = re.search(r"Player Roles:\n((?:\s+\w+:\s+\w+\n?)+)", content)
-        if role_section:
-            role_lines = role_section.group(1).strip().split("\n")
-            for line in role_lines:
-                match = re.match(r"\s+(\w+):\s+(\w+)", line)
-                if match:
-                    player_name = match.group(1)
-                    role = match.group(2)
-                    if player_name in self.players:
-                        self.players[player_name].role = role
-
-    def _parse_round(self, round_content: str):
-        """Parse a single round"""
-        # Night phase
-        if "[NIGHT PHASE]" in round_content:
-            self._parse_night_phase(round_content)
-
-        # Morning announcement
-        if "[MORNING] Announcement:" in round_content:
-            self._parse_morning(round_content)
-
-        # Day phase
-        if "[DAY PHASE]" in round_content:
-            self._parse_day_phase(round_content)
-
-        # Voting
-        if "[VOTING] Voting Phase" in round_content:
-            self._parse_voting(round_content)
-
-        # Elimination
-        if "[ELIMINATED]" in round_content:
-            self._parse_elimination(round_content)
-
-    def _parse_night_phase(self, content: str):
-        """Parse night phase events"""
-        self.events.append(
+    def iter_events(self, final: bool = True) -> Iterator[GameEvent]:
+        """Yield the events of log lines not read yet
+
+        Args:
+            final: Whether the log is complete. With False (a game still in
+                progress), an unterminated last line and events that depend
+                on the lines after them (vote summaries, statements) are held
+                back until a later call.
+        """
+        for events in self._read_blocks(final):
+            yield from events
+
+    def _read_blocks(self, final: bool) -> Iterator[List[GameEvent]]:
+        """Feed the unread lines in blocks and yield each block's events"""
+        feed = self._feed
+        with open(self.log_file_path, "rb") as f:
+            f.seek(self._offset)
+            pending = b""
+            while True:
+                block = f.read(BLOCK_SIZE)
+                if not block:
+                    break
+                block = pending + block
+                # Only whole lines are decoded, so no character is split
+                end = block.rfind(b"\n") + 1
+                pending = block[end:]
+                if not end:
+                    continue
+                self._offset += end
+                text = block[:end].decode("utf-8", errors="replace")
+                for line in text.replace("\r\n", "\n").split("\n")[:-1]:
+                    feed(line)
+                ready, self._ready = self._ready, []
+                yield ready
+
+        if final:
+            if pending:
+                self._offset += len(pending)
+                feed(pending.decode("utf-8", errors="replace").rstrip("\r"))
+            self._end_section()
+            self.game_info.setdefault("game_completed", False)
+            ready, self._ready = self._ready, []
+            yield ready
+
+    def _emit(self, event_type: str, data: Dict[str, Any], phase: str = None):
+        self._ready.append(
             GameEvent(
                 round_num=self.current_round,
-                phase="night",
-                event_type="phase_start",
-                data={"phase": "night"},
+                phase=phase or self._phase,
+                event_type=event_type,
+                data=data,
                 timestamp=self.event_counter,
             )
         )
         self.event_counter += 1
 
-        # Guardian protecting
-        if "[GUARDIAN] Protecting..." in content:
-            # Try to find who the guardian protected
-            guardian_protect_match = re.search(r"  (\w+) protects: (\w+)", content)
-            if guardian_protect_match:
-                guardian, protected = guardian_protect_match.groups()
-                self.events.append(
-                    GameEvent(
-                        round_num=self.current_round,
-                        phase="night",
-                        event_type="guardian_action",
-                        data={
-                            "action": "protecting",
-                            "guardian": guardian,
-                            "protected": protected,
-                        },
-                        timestamp=self.event_counter,
-                    )
-                )
-            else:
-                # No guardian in this game or guardian didn't protect anyone
-                self.events.append(
-                    GameEvent(
-                        round_num=self.current_round,
-                        phase="night",
-                        event_type="guardian_action",
-                        data={"action": "no_protection"},
-                        timestamp=self.event_counter,
-                    )
-                )
-            self.event_counter += 1
-
-        # Werewolves choosing target
-        werewolf_section = re.search(
-            r"\[WEREWOLVES\] Choosing target\.\.\.\n((?:  \w+ targets: \w+\n)+)",
-            content,
-        )
-        if werewolf_section:
-            targets = {}
-            # Don't use strip() - it removes leading spaces from first line
-            for line in werewolf_section.group(1).split("\n"):
-                if line:  # Skip empty lines
-                    match = re.match(r"  (\w+) targets: (\w+)", line)
-                    if match:
-                        werewolf, target = match.groups()
-                        targets[werewolf] = target
-
-            self.events.append(
-                GameEvent(
-                    round_num=self.current_round,
-                    phase="night",
-                    event_type="werewolf_target",
-                    data={"targets": targets},
-                    timestamp=self.event_counter,
-                )
-            )
-            self.event_counter += 1
-
-        # Seer checking
-        seer_match = re.search(r"  (\w+) checks: (\w+)", content)
-        if seer_match:
-            seer, target = seer_match.groups()
-            self.events.append(
-                GameEvent(
-                    round_num=self.current_round,
-                    phase="night",
-                    event_type="seer_check",
-                    data={"seer": seer, "target": target},
-                    timestamp=self.event_counter,
-                )
-            )
-            self.event_counter += 1
-
-        # Witch decisions
-        witch_save_match = re.search(r"  (\w+) does not save (\w+)", content)
-        if witch_save_match:
-            witch, target = witch_save_match.groups()
-            self.events.append(
-                GameEvent(
-                    round_num=self.current_round,
-                    phase="night",
-                    event_type="witch_save",
-                    data={"witch": witch, "target": target, "saved": False},
-                    timestamp=self.event_counter,
-                )
-            )
-            self.event_counter += 1
-
-        witch_poison_match = re.search(r"  (\w+) does not use poison", content)
-        if witch_poison_match:
-            witch = witch_poison_match.group(1)
-            self.events.append(
-                GameEvent(
-                    round_num=self.current_round,
-                    phase="night",
-                    event_type="witch_poison",
-                    data={"witch": witch, "used": False},
-                    timestamp=self.event_counter,
-                )
-            )
-            self.event_counter += 1
-
-        # Seer learned
-        seer_learned_match = re.search(r"  (\w+) learned: (\w+) is (\w+)", content)
-        if seer_learned_match:
-            seer, target, result = seer_learned_match.groups()
-            self.events.append(
-                GameEvent(
-                    round_num=self.current_round,
-                    phase="night",
-                    event_type="seer_result",
-                    data={"seer": seer, "target": target, "result": result},
-                    timestamp=self.event_counter,
-                )
-            )
-            self.event_counter += 1
-
-    def _parse_morning(self, content: str):
-        """Parse morning announcements"""
-        dead_match = re.search(
-            r"\[DEAD\] (\w+) died during the night \((\w+)\)", content
-        )
-        if dead_match:
-            player_name, reason = dead_match.groups()
-
-            self.events.append(
-                GameEvent(
-                    round_num=self.current_round,
-                    phase="morning",
-                    event_type="death_announcement",
-                    data={"player": player_name, "reason": reason},
-                    timestamp=self.event_counter,
-                )
-            )
-            self.event_counter += 1
-
-            # Update player status
-            if player_name in self.players:
-                self.players[player_name].status = "dead"
-                self.players[player_name].death_round = self.current_round
-                self.players[player_name].death_reason = reason
-
-            # Last words
-            last_words_match = re.search(
-                rf"\[LAST WORDS\] {player_name}\'s final statement:\n  {player_name}: ([^\n]+)",
-                content,
-            )
-            if last_words_match:
-                statement = last_words_match.group(1)
-                self.events.append(
-                    GameEvent(
-                        round_num=self.current_round,
-                        phase="morning",
-                        event_type="last_words",
-                        data={"player": player_name, "statement": statement},
-                        timestamp=self.event_counter,
-                    )
+    def _mark_dead(self, name: str, reason: str, role: str = None):
+        player = self.players.get(name)
+        if player is not None:
+            player.status = "dead"
+            player.death_round = self.current_round
+            player.death_reason = reason
+            if role:
+                player.role = role
+
+    def _feed(self, line: str):
+        """Advance the state machine by one line"""
+        previous, self._previous_line = self._previous_line, line
+
+        if line[:1] == "[":
+            marker = _MARKER_RE.match(line)
+            if marker is not None and self._opens_section(marker.group(1)):
+                self._marker_line(marker.group(1), line)
+                return
+        elif previous.endswith(SEPARATOR):
+            if _ROUND_RE.match(line):
+                self._end_section()
+                self.current_round += 1
+                self._section = "round"
+                self._alive_seen = False
+                return
+            if line == "GAME OVER":
+                self._end_section()
+                self._section = "game_over"
+                self.game_info["game_completed"] = True
+                self.game_info["final_roles"] = {}
+                return
+
+        self._line_handlers[self._section](line)
+
+    def _opens_section(self, marker: str) -> bool:
+        section = self._section
+        if section == "discussion":
+            return marker in _DISCUSSION_END
+        return section not in ("header", "roles", "done")
+
+    def _ignore_line(self, line: str):
+        pass
+
+    def _morning_line(self, line: str):
+        match = _DEAD_RE.match(line)
+        if match:
+            player_name, reason = match.groups()
+            self._emit("death_announcement", {"player": player_name, "reason": reason})
+            self._mark_dead(player_name, reason)
+
+    def _voting_line(self, line: str):
+        match = _VOTE_RE.match(line)
+        if match:
+            voter, target = match.groups()
+            self._votes.setdefault(target, []).append(voter)
+            self._emit("vote", {"voter": voter, "target": target})
+
+    def _elimination_line(self, line: str):
+        """The role revealed below "[ELIMINATED] X was eliminated by vote!\""""
+        self._section = "round"
+        match = _ROLE_REVEAL_RE.match(line)
+        if match:
+            player_name, role = self._subject, match.group(1)
+            self._emit("elimination", {"player": player_name, "role": role})
+            self._mark_dead(player_name, "eliminated", role)
+
+    def _last_words_line(self, line: str):
+        """The first line of the statement below "[LAST WORDS] ...\""""
+        self._section = self._resume_section
+        prefix = f"  {self._subject}: "
+        if line.startswith(prefix) and len(line) > len(prefix):
+            statement = line[len(prefix) :]
+            self._emit("last_words", {"player": self._subject, "statement": statement})
+        else:
+            self._feed(line)
+
+    def _marker_line(self, marker: str, line: str):
+        """Handle a "[MARKER] ..." line that opens a new section"""
+        self._end_section()
+
+        if marker in ("SEER", "WITCH"):
+            self._section = "night"
+        elif marker == "LAST WORDS":
+            match = _LAST_WORDS_RE.match(line)
+            if match:
+                self._resume_section = (
+                    "morning" if self._section == "morning" else "round"
                 )
-                self.event_counter += 1
-
-    def _parse_day_phase(self, content: str):
-        """Parse day phase discussions"""
-        self.events.append(
-            GameEvent(
-                round_num=self.current_round,
-                phase="day",
-                event_type="phase_start",
-                data={"phase": "day"},
-                timestamp=self.event_counter,
-            )
-        )
-        self.event_counter += 1
-
-        # Alive players
-        alive_match = re.search(r"Alive players: ([^\n]+)", content)
-        if alive_match:
-            alive_players = [name.strip() for name in alive_match.group(1).split(",")]
-            self.events.append(
-                GameEvent(
-                    round_num=self.current_round,
-                    phase="day",
-                    event_type="alive_players",
-                    data={"players": alive_players},
-                    timestamp=self.event_counter,
+                self._subject = match.group(1)
+                self._section = "last_words"
+        elif marker == "HUNTER SKILL":
+            match = _HUNTER_RE.match(line)
+            if match:
+                self._resume_section = (
+                    "morning" if self._section == "morning" else "round"
                 )
-            )
-            self.event_counter += 1
-
-        # Discussion - only parse content after [DISCUSSION] marker
-        discussion_section = re.search(
-            r"\[DISCUSSION\].*?\n(.*?)(?=\[VOTING\]|\[ELIMINATED\]|$)",
-            content,
-            re.DOTALL,
-        )
-
-        if discussion_section:
-            discussion_content = discussion_section.group(1)
-            discussion_pattern = r"(\w+): ([^\n]+(?:\n(?!\w+:)[^\n]+)*)"
-            discussions = re.findall(discussion_pattern, discussion_content)
-
-            for speaker, statement in discussions:
-                if speaker in self.players:
-                    self.events.append(
-                        GameEvent(
-                            round_num=self.current_round,
-                            phase="day",
-                            event_type="discussion",
-                            data={"speaker": speaker, "statement": statement.strip()},
-                            timestamp=self.event_counter,
-                        )
-                    )
-                    self.event_counter += 1
-
-    def _parse_voting(self, content: str):
-        """Parse voting phase"""
-        self.events.append(
-            GameEvent(
-                round_num=self.current_round,
-                phase="voting",
-                event_type="phase_start",
-                data={"phase": "voting"},
-                timestamp=self.event_counter,
-            )
-        )
-        self.event_counter += 1
+                self._subject = match.group(1)
+                self._hunter_target = None
+                self._section = "hunter"
+        elif marker == "NIGHT PHASE":
+            self._phase = "night"
+            self._section = "night"
+            self._emit("phase_start", {"phase": "night"})
+        elif marker == "GUARDIAN":
+            self._section = "guardian"
+            self._guardian_seen = False
+        elif marker == "WEREWOLVES":
+            self._section = "werewolves"
+            self._werewolf_targets = {}
+        elif marker == "MORNING":
+            self._phase = "morning"
+            self._section = "morning"
+        elif marker == "DAY PHASE":
+            self._phase = "day"
+            self._section = "round"
+            self._emit("phase_start", {"phase": "day"})
+        elif marker == "DISCUSSION":
+            self._phase = "day"
+            self._section = "discussion"
+        elif marker == "VOTING":
+            self._phase = "voting"
+            self._section = "voting"
+            self._votes = {}
+            self._emit("phase_start", {"phase": "voting"})
+        elif marker == "ELIMINATED":
+            match = _ELIMINATED_RE.match(line)
+            self._phase = "voting"
+            self._section = "elimination" if match else "round"
+            self._subject = match.group(1) if match else None
+        elif marker == "WINNER" and self._section == "game_over":
+            match = _WINNER_RE.match(line)
+            if match:
+                self.game_info["winner"] = match.group(1)
+        elif marker == "LEARNING" and self._section == "game_over":
+            self._section = "done"
+        elif self._section not in ("game_over", "morning"):
+            self._section = "round"
+
+    def _end_section(self):
+        """Emit the events a section only knows once it is over"""
+        section = self._section
+        if section == "guardian":
+            if not self._guardian_seen:
+                # No guardian in this game or guardian didn't protect anyone
+                self._emit("guardian_action", {"action": "no_protection"})
+                self._guardian_seen = True
+        elif section == "werewolves":
+            if self._werewolf_targets:
+                self._emit("werewolf_target", {"targets": self._werewolf_targets})
+                self._werewolf_targets = {}
+        elif section == "discussion":
+            self._flush_statement()
+        elif section == "voting":
+            self._emit("vote_summary", {"votes": self._votes})
+            self._votes = {}
+        else:
+            return
+        self._section = "night" if section in ("guardian", "werewolves") else "round"
+
+    def _header_line(self, line: str):
+        """Game type, players, werewolf team and roles before round 1"""
+        if self._section == "roles":
+            match = _ROLE_RE.match(line)
+            if match:
+                player_name, role = match.groups()
+                if player_name in self.players:
+                    self.players[player_name].role = role
+                return
+            self._section = "header"
 
-        vote_pattern = r"  (\w+) votes for: (\w+)"
-        votes = re.findall(vote_pattern, content)
-
-        vote_data = {}
-        for voter, target in votes:
-            if target not in vote_data:
-                vote_data[target] = []
-            vote_data[target].append(voter)
-
-            self.events.append(
-                GameEvent(
-                    round_num=self.current_round,
-                    phase="voting",
-                    event_type="vote",
-                    data={"voter": voter, "target": target},
-                    timestamp=self.event_counter,
+        if line.startswith("Players: "):
+            player_names = [name.strip() for name in line[9:].split(",")]
+            self.game_info["player_names"] = player_names
+            for name in player_names:
+                self.players[name] = Player(name=name)
+        elif line.startswith("Werewolf team: "):
+            werewolf_names = [name.strip() for name in line[15:].split(",")]
+            self.game_info["werewolf_team"] = werewolf_names
+        elif line == "Player Roles:":
+            self._section = "roles"
+        elif line.startswith("Game Type: "):
+            match = _GAME_TYPE_RE.match(line)
+            if match:
+                self.game_info["game_type"] = match.group(1)
+
+    def _night_line(self, line: str):
+        """Guardian, werewolf, seer and witch actions"""
+        if self._section == "werewolves":
+            match = _TARGET_RE.match(line)
+            if match:
+                werewolf, target = match.groups()
+                self._werewolf_targets[werewolf] = target
+                return
+            # The target list is over
+            self._end_section()
+        elif self._section == "guardian" and not self._guardian_seen:
+            match = _PROTECT_RE.match(line)
+            if match:
+                guardian, protected = match.groups()
+                self._guardian_seen = True
+                self._emit(
+                    "guardian_action",
+                    {
+                        "action": "protecting",
+                        "guardian": guardian,
+                        "protected": protected,
+                    },
                 )
+                return
+
+        match = _NIGHT_ACTION_RE.match(line)
+        if match is None:
+            return
+        actor, kind = match.group(1), match.lastgroup
+        if kind == "check":
+            self._emit("seer_check", {"seer": actor, "target": match.group(kind)})
+        elif kind == "no_save":
+            target = match.group(kind)
+            self._emit("witch_save", {"witch": actor, "target": target, "saved": False})
+        elif kind == "save":
+            target = match.group(kind)
+            self._emit("witch_save", {"witch": actor, "target": target, "saved": True})
+        elif kind == "no_poison":
+            self._emit("witch_poison", {"witch": actor, "used": False})
+        elif kind == "poison":
+            self._emit(
+                "witch_poison",
+                {"witch": actor, "used": True, "poison_target": match.group(kind)},
             )
-            self.event_counter += 1
-
-        # Vote summary
-        self.events.append(
-            GameEvent(
-                round_num=self.current_round,
-                phase="voting",
-                event_type="vote_summary",
-                data={"votes": vote_data},
-                timestamp=self.event_counter,
+        elif kind == "result":
+            self._emit(
+                "seer_result",
+                {
+                    "seer": actor,
+                    "target": match.group("learned"),
+                    "result": match.group("result"),
+                },
             )
-        )
-        self.event_counter += 1
 
-    def _parse_elimination(self, content: str):
-        """Parse elimination"""
-        elim_match = re.search(
-            r"\[ELIMINATED\] (\w+) was eliminated by vote!\n   Role: (\w+)", content
+    def _discussion_line(self, line: str):
+        """Statements, which may continue over several lines"""
+        if not line:
+            self._flush_statement()
+            return
+        if not self._alive_seen and line.startswith("Alive players: "):
+            self._flush_statement()
+            self._alive_seen = True
+            alive_players = [name.strip() for name in line[15:].split(",")]
+            self._emit("alive_players", {"players": alive_players})
+            return
+
+        match = _STATEMENT_RE.match(line)
+        if match is None:
+            if self._speaker is not None:
+                self._statement.append(line)
+            return
+
+        # A new "Name: ..." line ends the previous statement
+        self._flush_statement()
+        if match.group(2) is not None:
+            self._speaker = match.group(1)
+            self._statement = [match.group(2)]
+
+    def _flush_statement(self):
+        speaker, self._speaker = self._speaker, None
+        if speaker in self.players:
+            statement = "\n".join(self._statement).strip()
+            self._emit("discussion", {"speaker": speaker, "statement": statement})
+        self._statement = []
+
+    def _hunter_line(self, line: str):
+        """The shot ("X shoots Y!") and its victim ("Y (role) is killed!")"""
+        if self._hunter_target is None:
+            match = _SHOOTS_RE.match(line)
+            if match and match.group(1) == self._subject:
+                self._hunter_target = match.group(2)
+            elif line:
+                # The hunter could not shoot
+                self._section = self._resume_section
+                self._feed(line)
+            return
+
+        self._section = self._resume_section
+        match = _KILLED_RE.match(line)
+        if match is None or match.group(1) != self._hunter_target:
+            self._feed(line)
+            return
+
+        target, target_role = match.groups()
+        self._emit(
+            "hunter_skill",
+            {"hunter": self._subject, "target": target, "target_role": target_role},
         )
-        if elim_match:
-            player_name, role = elim_match.groups()
-
-            self.events.append(
-                GameEvent(
-                    round_num=self.current_round,
-                    phase="voting",
-                    event_type="elimination",
-                    data={"player": player_name, "role": role},
-                    timestamp=self.event_counter,
-                )
-            )
-            self.event_counter += 1
+        self._mark_dead(target, "hunter_shot", target_role)
 
-            # Update player info
+    def _game_over_line(self, line: str):
+        """Rounds played and final roles"""
+        match = _FINAL_ROLE_RE.search(line)
+        if match:
+            player_name, role = match.groups()
             if player_name in self.players:
-                self.players[player_name].status = "dead"
                 self.players[player_name].role = role
-                self.players[player_name].death_round = self.current_round
-                self.players[player_name].death_reason = "eliminated"
-
-            # Last words
-            last_words_match = re.search(
-                rf"\[LAST WORDS\] {player_name}\'s final statement:\n  {player_name}: ([^\n]+)",
-                content,
-            )
-            if last_words_match:
-                statement = last_words_match.group(1)
-                self.events.append(
-                    GameEvent(
-                        round_num=self.current_round,
-                        phase="voting",
-                        event_type="last_words",
-                        data={"player": player_name, "statement": statement},
-                        timestamp=self.event_counter,
-                    )
-                )
-                self.event_counter += 1
-
-            # Hunter skill activation
-            hunter_skill_match = re.search(
-                rf"\[HUNTER SKILL\] {player_name} activates hunter ability!\n  {player_name} shoots (\w+)!\n  (\w+) \((\w+)\) is killed!",
-                content,
-            )
-            if hunter_skill_match:
-                target = hunter_skill_match.group(1)
-                target_confirm = hunter_skill_match.group(2)
-                target_role = hunter_skill_match.group(3)
-
-                self.events.append(
-                    GameEvent(
-                        round_num=self.current_round,
-                        phase="voting",
-                        event_type="hunter_skill",
-                        data={
-                            "hunter": player_name,
-                            "target": target,
-                            "target_role": target_role,
-                        },
-                        timestamp=self.event_counter,
-                    )
-                )
-                self.event_counter += 1
-
-                # Update target player status
-                if target in self.players:
-                    self.players[target].status = "dead"
-                    self.players[target].role = target_role
-                    self.players[target].death_round = self.current_round
-                    self.players[target].death_reason = "hunter_shot"
-
-    def _parse_game_over(self, content: str):
-        """Parse game over information"""
-        game_over_section = re.search(
-            r"={60}\nGAME OVER\n={60}\n(.*?)(?:\[LEARNING\]|$)", content, re.DOTALL
-        )
-
-        if game_over_section:
-            game_over_content = game_over_section.group(1)
-
-            # Mark game as completed successfully
-            self.game_info["game_completed"] = True
-
-            # Winner
-            winner_match = re.search(r"\[WINNER\] (\w+)", game_over_content)
-            if winner_match:
-                self.game_info["winner"] = winner_match.group(1)
+            self.game_info["final_roles"][player_name] = role
+            return
 
-            # Rounds played
-            rounds_match = re.search(r"Rounds played: (\d+)", game_over_content)
-            if rounds_match:
-                self.game_info["rounds_played"] = int(rounds_match.group(1))
-
-            # Final roles
-            role_pattern = r"\[(?:DEAD|ALIVE)\] (\w+): (\w+)"
-            roles = re.findall(role_pattern, game_over_content)
-
-            for player_name, role in roles:
-                if player_name in self.players:
-                    self.players[player_name].role = role
-
-            self.game_info["final_roles"] = {name: role for name, role in roles}
-        else:
-            # Game did not complete normally
-            self.game_info["game_completed"] = False
+        match = _ROUNDS_PLAYED_RE.match(line)
+        if match:
+            self.game_info["rounds_played"] = int(match.group(1))
@@ -0,0 +1,131 @@
+"""
+Per-viewer game sessions for the visualizer
+
+Each browser gets its own `GameStateManager`, keyed by a random session id,
+instead of one global game shared by everyone. Sessions that have been idle
+for `idle_timeout` seconds are dropped, and the least recently used ones are
+evicted once there are more than `max_sessions` of them or their games add
+up to more than `max_bytes` of transcripts (the log size stands in for the
+size of the game, as in `game_cache`).
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from state_manager import GameStateManager
+
+
+def new_session_id() -> str:
+    return secrets.token_urlsafe(16)
+
+
+@dataclass
+class GameSession:
+    session_id: str
+    filename: str
+    manager: GameStateManager
+    size: int
+    last_seen: float
+    # Serializes requests of one viewer; the manager is not thread-safe
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class SessionStore:
+    """Game sessions keyed by session id
+
+    Args:
+        max_sessions: Maximum number of live sessions (None = unbounded)
+        max_bytes: Maximum total size of the sessions' logs (None = unbounded)
+        idle_timeout: Seconds after which an unused session is dropped
+        clock: Time source, replaceable in tests
+    """
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = 200,
+        max_bytes: Optional[int] = None,
+        idle_timeout: float = 1800.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.idle_timeout = idle_timeout
+        self.clock = clock
+        self.created = 0
+        self.expired = 0  # Dropped after idle_timeout
+        self.evictions = 0  # Dropped to stay within the caps
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+        # Least recently seen first
+        self._sessions: "OrderedDict[str, GameSession]" = OrderedDict()
+
+    def get(self, session_id: str) -> Optional[GameSession]:
+        """Return the live session and mark it as used, or None"""
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_seen = now
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def put(
+        self, session_id: str, filename: str, manager: GameStateManager, size: int
+    ) -> GameSession:
+        """Start (or replace) the session `session_id` viewing `filename`"""
+        with self._lock:
+            now = self.clock()
+            old = self._sessions.pop(session_id, None)
+            if old is not None:
+                self.total_bytes -= old.size
+            session = GameSession(session_id, filename, manager, size, now)
+            self._sessions[session_id] = session
+            self.total_bytes += size
+            self.created += 1
+            self._expire(now)
+            self._evict()
+            return session
+
+    def _expire(self, now: float):
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_seen < self.idle_timeout:
+                break
+            self._drop(session.session_id)
+            self.expired += 1
+
+    def _evict(self):
+        # The newest session is always kept
+        while len(self._sessions) > 1 and (
+            (self.max_sessions is not None and len(self._sessions) > self.max_sessions)
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            self._drop(next(iter(self._sessions)))
+            self.evictions += 1
+
+    def _drop(self, session_id: str):
+        session = self._sessions.pop(session_id)
+        self.total_bytes -= session.size
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current size, for the stats endpoint"""
+        with self._lock:
+            self._expire(self.clock())
+            return {
+                "sessions": len(self._sessions),
+                "bytes": self.total_bytes,
+                "max_sessions": self.max_sessions,
+                "max_bytes": self.max_bytes,
+                "idle_timeout": self.idle_timeout,
+                "created": self.created,
+                "expired": self.expired,
+                "evictions": self.evictions,
+            }
@@ -2,15 +2,25 @@
 State manager for game visualization
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from parser import GameEvent, Player
 
+# Player states are snapshotted every this many events, so seeking replays
+# at most this many events instead of the whole game
+SNAPSHOT_INTERVAL = 32
+
 
 class GameStateManager:
-    def __init__(self, parsed_data: Dict[str, Any]):
+    def __init__(
+        self,
+        parsed_data: Dict[str, Any],
+        snapshot_interval: int = SNAPSHOT_INTERVAL,
+        snapshots: Optional[List[Dict[str, tuple]]] = None,
+    ):
         self.game_info = parsed_data["game_info"]
         self.players = parsed_data["players"]
         self.events = parsed_data["events"]
+        self.snapshot_interval = snapshot_interval
 
         self.current_event_index = 0
         self.current_round = 0
@@ -19,6 +29,15 @@ class GameStateManager:
         # Track current state for visualization
         self.current_player_states = {}
         self._initialize_player_states()
+        # Read-only, so managers of the same game can share them (`snapshots`)
+        self._snapshots = (
+            snapshots if snapshots is not None else self._build_snapshots()
+        )
+
+        # First event of each round, for jump_to_round
+        self._round_starts: Dict[int, int] = {}
+        for i, event in enumerate(self.events):
+            self._round_starts.setdefault(event.round_num, i)
 
     def _initialize_player_states(self):
         """Initialize all players as alive with their actual roles"""
@@ -30,6 +49,11 @@ class GameStateManager:
                 "revealed": True,  # Show actual roles from the beginning
             }
 
+    @property
+    def snapshots(self) -> List[Dict[str, tuple]]:
+        """Player state snapshots, to pass to another manager of this game"""
+        return self._snapshots
+
     def get_current_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         if self.current_event_index >= len(self.events):
@@ -87,9 +111,8 @@ class GameStateManager:
 
     def jump_to_round(self, round_num: int) -> Dict[str, Any]:
         """Jump to the start of a specific round"""
-        for i, event in enumerate(self.events):
-            if event.round_num == round_num:
-                return self.jump_to_event(i)
+        if round_num in self._round_starts:
+            return self.jump_to_event(self._round_starts[round_num])
 
         return self.get_current_state()
 
@@ -116,11 +139,38 @@ class GameStateManager:
                 self.current_player_states[player_name]["role"] = role
                 self.current_player_states[player_name]["revealed"] = True
 
-    def _rebuild_state_up_to_current(self):
-        """Rebuild the state by replaying all events up to current index"""
+    def _build_snapshots(self) -> List[Dict[str, tuple]]:
+        """Replay the game once; entry i is the state after i * interval events"""
+        snapshots = [self._snapshot()]
+        for i, event in enumerate(self.events, 1):
+            self._apply_event(event)
+            if i % self.snapshot_interval == 0:
+                snapshots.append(self._snapshot())
+
         self._initialize_player_states()
+        return snapshots
+
+    def _snapshot(self) -> Dict[str, tuple]:
+        return {
+            name: (state["status"], state["role"], state["revealed"])
+            for name, state in self.current_player_states.items()
+        }
+
+    def _restore(self, snapshot: Dict[str, tuple]):
+        for name, (status, role, revealed) in snapshot.items():
+            self.current_player_states[name] = {
+                "name": name,
+                "status": status,
+                "role": role,
+                "revealed": revealed,
+            }
+
+    def _rebuild_state_up_to_current(self):
+        """Restore the nearest snapshot and replay the events after it"""
+        base = self.current_event_index // self.snapshot_interval
+        self._restore(self._snapshots[base])
 
-        for i in range(self.current_event_index):
+        for i in range(base * self.snapshot_interval, self.current_event_index):
             self._apply_event(self.events[i])
 
     def get_alive_players(self) -> List[str]:
@@ -5,20 +5,30 @@ A multi-agent werewolf game implementation using AgentScope.
 
 from .werewolf_game import WerewolfGame, Role, GamePhase, GameState
 
-# Export agent classes without forcing AgentScope at package import time
-from .agents import (
-    WerewolfAgentBase,
-    VillagerAgent,
-    WerewolfAgent,
-    SeerAgent,
-    WitchAgent,
-    GuardianAgent,
-    create_agent,
+# Agent classes are resolved on first access (PEP 562) so that
+# `import werewolf` stays cheap: `werewolf.agents` pulls in asyncio and
+# AgentScope. Do NOT import the orchestrator here either; use
+# `from werewolf.orchestrator import WerewolfGameOrchestrator`.
+_LAZY_AGENT_EXPORTS = (
+    "WerewolfAgentBase",
+    "VillagerAgent",
+    "WerewolfAgent",
+    "SeerAgent",
+    "WitchAgent",
+    "GuardianAgent",
+    "create_agent",
 )
 
-# Do NOT import orchestrator unconditionally to avoid requiring agentscope
-# for consumers that only need core game logic. Users can import it directly
-# via `from werewolf.orchestrator import WerewolfGameOrchestrator`.
+
+def __getattr__(name):
+    if name in _LAZY_AGENT_EXPORTS:
+        from . import agents
+
+        value = getattr(agents, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "0.1.0"
 __all__ = [
@@ -9,16 +9,13 @@ adequate for unit tests that don't actually invoke models.
 
 from typing import Dict, List, Any, Optional
 import asyncio
+import inspect
+import time
 
 # Optional AgentScope import with graceful fallback for environments without it
 try:
     from agentscope.agent import AgentBase  # type: ignore
     from agentscope.message import Msg  # type: ignore
-    from agentscope.model import (  # type: ignore
-        OpenAIChatModel,
-        DashScopeChatModel,
-        OllamaChatModel,
-    )
 
     _AGENTSCOPE_AVAILABLE = True
 except Exception:  # pragma: no cover
@@ -34,15 +31,6 @@ except Exception:  # pragma: no cover
 
             return _Resp()
 
-    class OpenAIChatModel:  # stub
-        pass
-
-    class DashScopeChatModel:  # stub
-        pass
-
-    class OllamaChatModel:  # stub
-        pass
-
     class Msg:
         def __init__(self, name: str, content: str, role: str = "user") -> None:
             self.name = name
@@ -51,6 +39,10 @@ except Exception:  # pragma: no cover
 
 
 from .werewolf_game import Role, GamePhase
+from .metrics import ModelCallMetrics, extract_usage
+from .model_pool import SharedModel, get_background_loop
+from .rate_limiter import estimate_tokens, get_rate_limiter, model_rate_limits
+from .response_cache import ResponseCacheMiss, get_response_cache
 
 
 def _extract_text_content(response):
@@ -83,94 +75,188 @@ def _extract_text_content(response):
         return str(content)
 
 
-def _run_model_sync(model, msg_list, max_retries: int = 3):
-    """Synchronous wrapper for async model calls with retry logic
+_RETRYABLE_ERROR_KEYWORDS = [
+    "peer closed connection",
+    "incomplete chunked read",
+    "connection reset",
+    "timeout",
+    "connection error",
+    "remote protocol error",
+    "rate limit",
+    "too many requests",
+]
+
+
+def _to_message_dicts(msg_list) -> List[Dict[str, Any]]:
+    """Convert Msg objects to the dict format expected by AgentScope 1.0 models"""
+    messages = []
+    for msg in msg_list:
+        if isinstance(msg, dict):
+            messages.append(msg)
+        elif hasattr(msg, "to_dict"):
+            msg_dict = msg.to_dict()
+            messages.append({"role": msg_dict["role"], "content": msg_dict["content"]})
+        else:
+            # e.g. the fallback Msg without AgentScope; a plain dict keeps the
+            # cache key and token estimate independent of the object
+            messages.append({"role": msg.role, "content": msg.content})
+    return messages
+
+
+async def _run_model_async(
+    model,
+    msg_list,
+    max_retries: int = 3,
+    metrics: Optional[ModelCallMetrics] = None,
+    call_site: str = "other",
+    agent: Optional[str] = None,
+    role: Optional[str] = None,
+):
+    """Await a model call with retry logic
+
+    Native asyncio counterpart of `_run_model_sync`; many of these can be
+    in flight on a single event loop.
 
     Args:
         model: The AgentScope model instance
         msg_list: List of Msg objects to send to the model
         max_retries: Maximum number of retry attempts for network errors
+        metrics: Collector that records wall time, retries and token usage
+        call_site: Call site label for `metrics` (see `metrics.CALL_SITES`)
+        agent: Calling player name for `metrics`
+        role: Calling player role for `metrics`
     """
-    import time
+    messages = _to_message_dicts(msg_list)
+    started = time.perf_counter()
+
+    def record(**fields):
+        if metrics is not None:
+            metrics.record(
+                call_site,
+                getattr(model, "config_name", None),
+                time.perf_counter() - started,
+                agent=agent,
+                role=role,
+                **fields,
+            )
+
+    cache = get_response_cache()
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.make_key(model, messages)
+        cached = await cache.aget(cache_key)
+        if cached is not None:
+            record(cached=True)
+            return cached
+        if cache.mode == "replay":
+            record(error="response cache miss")
+            raise ResponseCacheMiss(f"No recorded response for prompt {cache_key}")
+
+    # Shared per-config request/token budget (see werewolf/rate_limiter.py)
+    limiter = get_rate_limiter()
+    limited = model_rate_limits(model) if limiter is not None else None
 
-    # Retry logic for handling network errors
     last_error = None
     for attempt in range(max_retries):
+        reserved = 0
         try:
-            # Get or create event loop
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            # No event loop in current thread, create a new one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            if limited:
+                reserved = estimate_tokens(messages, limited["max_tokens"])
+                await limiter.aacquire(
+                    limited["config_name"], limited["limits"], reserved
+                )
 
-        try:
-            # Convert Msg objects to dict format expected by model
-            # AgentScope 1.0 models expect list of dicts with 'role' and 'content'
-            messages = []
-            for msg in msg_list:
-                if hasattr(msg, "to_dict"):
-                    msg_dict = msg.to_dict()
-                    messages.append(
-                        {"role": msg_dict["role"], "content": msg_dict["content"]}
-                    )
-                else:
-                    # Fallback for dict input
-                    messages.append(msg)
-
-            # Run the async model call synchronously
             # Note: stream setting should be in model's generate_kwargs config
-            import inspect
-
-            response = loop.run_until_complete(model(messages))
+            response = model(messages)
+            if inspect.isawaitable(response):
+                response = await response
 
             # Check if response is async generator (stream=True case)
             if inspect.isasyncgen(response):
                 # Consume the generator to get the final response
-                async def consume_stream():
-                    final_response = None
-                    async for chunk in response:
-                        final_response = chunk
-                    return final_response
-
-                response = loop.run_until_complete(consume_stream())
-
+                final_response = None
+                async for chunk in response:
+                    final_response = chunk
+                response = final_response
+            # The call went through, so its reservation stays charged
+            charged, reserved = reserved, 0
+
+            if cache is not None:
+                await cache.aput(cache_key, _extract_text_content(response))
+            prompt_tokens, completion_tokens = extract_usage(response)
+            if limited and prompt_tokens is not None:
+                # Replace the estimate with the usage the provider reported
+                await limiter.asettle(
+                    limited["config_name"],
+                    limited["limits"],
+                    prompt_tokens + (completion_tokens or 0) - charged,
+                )
+            record(
+                retries=attempt,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+            )
             return response
 
         except Exception as e:
             last_error = e
             error_msg = str(e).lower()
 
+            if reserved:
+                # A failed attempt (429, timeout) used no tokens; refund them
+                # so that retries are not charged the estimate again
+                await limiter.asettle(
+                    limited["config_name"], limited["limits"], -reserved
+                )
+
             # Check if it's a retryable network error
             is_network_error = any(
-                keyword in error_msg
-                for keyword in [
-                    "peer closed connection",
-                    "incomplete chunked read",
-                    "connection reset",
-                    "timeout",
-                    "connection error",
-                    "remote protocol error",
-                ]
+                keyword in error_msg for keyword in _RETRYABLE_ERROR_KEYWORDS
             )
 
             if is_network_error and attempt < max_retries - 1:
                 wait_time = (attempt + 1) * 2  # Exponential backoff: 2s, 4s, 6s
                 print(f"Network error (attempt {attempt + 1}/{max_retries}): {e}")
                 print(f"Retrying in {wait_time}s...")
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
                 continue
             else:
                 # Non-retryable error or max retries reached
+                record(retries=attempt, error=str(e))
                 raise
 
     # If we get here, all retries failed
     raise last_error
 
 
+def _run_model_sync(model, msg_list, max_retries: int = 3, **call_info):
+    """Synchronous wrapper for async model calls with retry logic
+
+    The call runs on the process-wide background event loop, so it is safe
+    to use from any thread (including one that already runs a loop) and all
+    synchronous callers share the same pooled HTTP clients.
+
+    Args:
+        model: The AgentScope model instance
+        msg_list: List of Msg objects to send to the model
+        max_retries: Maximum number of retry attempts for network errors
+        **call_info: Instrumentation options of `_run_model_async` (metrics,
+            call_site, agent, role)
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        _run_model_async(model, msg_list, max_retries, **call_info),
+        get_background_loop(),
+    )
+    return future.result()
+
+
 class WerewolfAgentBase(AgentBase):
     """Base class for all Werewolf game agents"""
 
+    # Plain-data attributes saved in game checkpoints (known_roles is handled
+    # separately since it holds Role values); subclasses extend this
+    _STATE_FIELDS = ("is_alive", "memory_history", "strategy_rules")
+
     def __init__(
         self,
         name: str,
@@ -179,7 +265,6 @@ class WerewolfAgentBase(AgentBase):
         sys_prompt: str = None,
         **kwargs,
     ):
-        # Create model directly from config
         self.name = name
         self.role = role
         self.is_alive = True
@@ -189,69 +274,11 @@ class WerewolfAgentBase(AgentBase):
         # Strategy rules injected by Learning Engine to guide behavior per role
         self.strategy_rules: List[str] = []
 
-        # Initialize model - create model instance directly
+        # Models are pooled per config so agents share HTTP clients
         self.model_config_name = model_config_name
-        from werewolf.config import MODEL_CONFIGS
-
-        model_config = next(
-            (c for c in MODEL_CONFIGS if c["config_name"] == model_config_name), None
-        )
-        if model_config:
-            model_type = model_config.get("model_type", "openai_chat")
-
-            # Prepare parameters for different model types
-            if model_type == "openai_chat":
-                # OpenAI-compatible models (OpenAI, DeepSeek, ModelScope)
-                params = {
-                    "model_name": model_config["model_name"],
-                    "api_key": model_config.get("api_key"),
-                    "organization": model_config.get("organization"),
-                    "generate_kwargs": model_config.get("generate_args", {}),
-                }
-                # base_url goes into client_args for OpenAI models
-                if "base_url" in model_config:
-                    params["client_args"] = {"base_url": model_config["base_url"]}
-                try:
-                    self.model = OpenAIChatModel(
-                        **{k: v for k, v in params.items() if v is not None}
-                    )
-                except Exception as e:
-                    print(f"Warning: Failed to initialize OpenAI model: {e}")
-                    self.model = lambda msg: type("obj", (object,), {"content": ""})()
-
-            elif model_type == "dashscope_chat":
-                params = {
-                    "model_name": model_config["model_name"],
-                    "api_key": model_config.get("api_key"),
-                    "generate_kwargs": model_config.get("generate_args", {}),
-                }
-                try:
-                    self.model = DashScopeChatModel(
-                        **{k: v for k, v in params.items() if v is not None}
-                    )
-                except Exception as e:
-                    print(f"Warning: Failed to initialize DashScope model: {e}")
-                    self.model = lambda msg: type("obj", (object,), {"content": ""})()
-
-            elif model_type == "ollama_chat":
-                params = {
-                    "model_name": model_config["model_name"],
-                    "host": model_config.get("host", "http://localhost:11434"),
-                    "generate_kwargs": model_config.get("generate_args", {}),
-                }
-                try:
-                    self.model = OllamaChatModel(
-                        **{k: v for k, v in params.items() if v is not None}
-                    )
-                except Exception as e:
-                    print(f"Warning: Failed to initialize Ollama model: {e}")
-                    self.model = lambda msg: type("obj", (object,), {"content": ""})()
-            else:
-                # Fallback
-                self.model = lambda msg: type("obj", (object,), {"content": ""})()
-        else:
-            # No config found - create stub
-            self.model = lambda msg: type("obj", (object,), {"content": ""})()
+        self.model = SharedModel(model_config_name)
+        # Per-game model call metrics, attached by the orchestrator
+        self.metrics: Optional[ModelCallMetrics] = None
 
     # Strategy API
     def set_strategy_rules(self, rules: List[str]):
@@ -295,14 +322,82 @@ Always think carefully about your actions and their consequences."""
         """Mark this agent as dead"""
         self.is_alive = False
 
-    def last_words(self, context: str, cause_of_death: str) -> str:
-        """Provide last words before death
+    def get_state(self) -> Dict[str, Any]:
+        """JSON-serializable agent state for checkpoints"""
+        state = {field: getattr(self, field) for field in self._STATE_FIELDS}
+        state["known_roles"] = {p: r.value for p, r in self.known_roles.items()}
+        return state
+
+    def load_state(self, state: Dict[str, Any]):
+        """Restore state saved by `get_state`"""
+        for field in self._STATE_FIELDS:
+            if field in state:
+                setattr(self, field, state[field])
+        if "known_roles" in state:
+            self.known_roles = {p: Role(r) for p, r in state["known_roles"].items()}
+
+    # Model call helpers
+    def _call_info(self, call_site: str) -> Dict[str, Any]:
+        return {
+            "metrics": getattr(self, "metrics", None),
+            "call_site": call_site,
+            "agent": self.name,
+            "role": self.role.value,
+        }
+
+    def _ask(self, prompt: str, call_site: str = "other"):
+        """Send a single user prompt to this agent's model"""
+        return _run_model_sync(
+            self.model,
+            [Msg(name=self.name, content=prompt, role="user")],
+            **self._call_info(call_site),
+        )
 
-        Args:
-            context: Current game context
-            cause_of_death: How the player died (werewolf_kill, voted_out, witch_poison)
-        """
-        prompt = f"""You are about to die in the Werewolf game.
+    async def _aask(self, prompt: str, call_site: str = "other"):
+        """Async counterpart of `_ask`"""
+        return await _run_model_async(
+            self.model,
+            [Msg(name=self.name, content=prompt, role="user")],
+            **self._call_info(call_site),
+        )
+
+    # Actions shared by all roles. Subclasses provide the prompts.
+    def _discuss_prompt(self, context: str, discussion_history: List[Msg]) -> str:
+        raise NotImplementedError
+
+    def _vote_prompt(self, context: str, alive_players: List[str]) -> str:
+        raise NotImplementedError
+
+    def _parse_vote(self, response: str, alive_players: List[str]) -> str:
+        """Turn a vote response into a player name"""
+        return self._extract_vote(response, alive_players)
+
+    def discuss(self, context: str, discussion_history: List[Msg]) -> str:
+        """Participate in day discussion"""
+        response = self._ask(
+            self._discuss_prompt(context, discussion_history), "discuss"
+        )
+        return _extract_text_content(response)
+
+    async def adiscuss(self, context: str, discussion_history: List[Msg]) -> str:
+        """Async counterpart of `discuss`"""
+        response = await self._aask(
+            self._discuss_prompt(context, discussion_history), "discuss"
+        )
+        return _extract_text_content(response)
+
+    def vote(self, context: str, alive_players: List[str]) -> str:
+        """Vote for a player to eliminate"""
+        response = self._ask(self._vote_prompt(context, alive_players), "vote")
+        return self._parse_vote(_extract_text_content(response), alive_players)
+
+    async def avote(self, context: str, alive_players: List[str]) -> str:
+        """Async counterpart of `vote`"""
+        response = await self._aask(self._vote_prompt(context, alive_players), "vote")
+        return self._parse_vote(_extract_text_content(response), alive_players)
+
+    def _last_words_prompt(self, context: str, cause_of_death: str) -> str:
+        return f"""You are about to die in the Werewolf game.
         
 Your Role: {self.role.value}
 Cause of Death: {cause_of_death}
@@ -319,8 +414,22 @@ Consider:
 
 Your last words (keep it brief, 2-3 sentences):"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
+    def last_words(self, context: str, cause_of_death: str) -> str:
+        """Provide last words before death
+
+        Args:
+            context: Current game context
+            cause_of_death: How the player died (werewolf_kill, voted_out, witch_poison)
+        """
+        response = self._ask(
+            self._last_words_prompt(context, cause_of_death), "last_words"
+        )
+        return _extract_text_content(response)
+
+    async def alast_words(self, context: str, cause_of_death: str) -> str:
+        """Async counterpart of `last_words`"""
+        response = await self._aask(
+            self._last_words_prompt(context, cause_of_death), "last_words"
         )
         return _extract_text_content(response)
 
@@ -350,9 +459,8 @@ Communication Style:
 - Share your observations without revealing too much
 - Collaborate with others to find werewolves"""
 
-    def discuss(self, context: str, discussion_history: List[Msg]) -> str:
-        """Participate in day discussion"""
-        prompt = f"""Current game context:
+    def _discuss_prompt(self, context: str, discussion_history: List[Msg]) -> str:
+        return f"""Current game context:
 {context}
 
 Recent discussion:
@@ -367,14 +475,8 @@ IMPORTANT: Just provide your statement directly. Do NOT start with your name.
 
 Your statement:"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-        return _extract_text_content(response)
-
-    def vote(self, context: str, alive_players: List[str]) -> str:
-        """Vote for a player to eliminate"""
-        prompt = f"""Current game context:
+    def _vote_prompt(self, context: str, alive_players: List[str]) -> str:
+        return f"""Current game context:
 {context}
 
 Alive players: {', '.join(alive_players)}
@@ -388,11 +490,6 @@ Provide your vote and brief reasoning.
 Format: VOTE: [player_name]
 Reasoning: [your reasoning]"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-        return self._extract_vote(_extract_text_content(response), alive_players)
-
     def _format_discussion(self, messages: List[Msg]) -> str:
         """Format discussion messages for prompt"""
         if not messages:
@@ -411,6 +508,8 @@ Reasoning: [your reasoning]"""
 class WerewolfAgent(WerewolfAgentBase):
     """Werewolf agent - evil side, can kill at night"""
 
+    _STATE_FIELDS = WerewolfAgentBase._STATE_FIELDS + ("kill_history",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.kill_history: List[Dict[str, str]] = []  # Track who was killed each night
@@ -441,9 +540,8 @@ Deception Tactics:
 
 CRITICAL: Never reveal you are a werewolf during day discussions!"""
 
-    def discuss(self, context: str, discussion_history: List[Msg]) -> str:
-        """Participate in day discussion while hiding identity"""
-        prompt = f"""Current game context:
+    def _discuss_prompt(self, context: str, discussion_history: List[Msg]) -> str:
+        return f"""Current game context:
 {context}
 
 Recent discussion:
@@ -458,16 +556,10 @@ IMPORTANT: Just provide your statement directly. Do NOT start with your name.
 
 Your statement:"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-        return _extract_text_content(response)
-
-    def night_action(
+    def _night_action_prompt(
         self, context: str, targets: List[str], team_members: List[str]
     ) -> str:
-        """Choose target to kill at night"""
-        prompt = f"""Night Phase - Werewolf Team Discussion
+        return f"""Night Phase - Werewolf Team Discussion
 
 Your werewolf team: {', '.join(team_members)}
 Possible targets: {', '.join(targets)}
@@ -486,11 +578,23 @@ Who should the werewolf team kill tonight? Consider:
 
 Your choice: """
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
+    def night_action(
+        self, context: str, targets: List[str], team_members: List[str]
+    ) -> str:
+        """Choose target to kill at night"""
+        response = self._ask(
+            self._night_action_prompt(context, targets, team_members), "night_action"
+        )
+        return self._extract_vote(_extract_text_content(response), targets)
+
+    async def anight_action(
+        self, context: str, targets: List[str], team_members: List[str]
+    ) -> str:
+        """Async counterpart of `night_action`"""
+        response = await self._aask(
+            self._night_action_prompt(context, targets, team_members), "night_action"
         )
-        content = _extract_text_content(response)
-        return self._extract_vote(content, targets)
+        return self._extract_vote(_extract_text_content(response), targets)
 
     def _format_discussion(self, messages: List[Msg]) -> str:
         if not messages:
@@ -520,9 +624,8 @@ Your choice: """
         """Record the result of a kill attempt"""
         self.kill_history.append({"target": target, "result": result})
 
-    def vote(self, context: str, alive_players: List[str]) -> str:
-        """Vote for a player to eliminate (as werewolf pretending to be villager)"""
-        prompt = f"""Current game context:
+    def _vote_prompt(self, context: str, alive_players: List[str]) -> str:
+        return f"""Current game context:
 {context}
 
 Alive players: {', '.join(alive_players)}
@@ -540,16 +643,14 @@ Consider:
 Format: VOTE: [player_name]
 Reasoning: [your fake reasoning]"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
+    def _parse_vote(self, response: str, alive_players: List[str]) -> str:
         # Filter out werewolf teammates from valid vote options
         non_werewolf_players = [
             p for p in alive_players if self.known_roles.get(p) != Role.WEREWOLF
         ]
         if not non_werewolf_players:
             non_werewolf_players = alive_players  # Fallback
-        return self._extract_vote(_extract_text_content(response), non_werewolf_players)
+        return self._extract_vote(response, non_werewolf_players)
 
 
 class SeerAgent(WerewolfAgentBase):
@@ -579,16 +680,19 @@ Information Sharing:
 - Confirm villagers to build a coalition
 - Reveal werewolves at the right moment"""
 
-    def night_action(self, context: str, targets: List[str]) -> str:
-        """Choose player to check at night"""
-        # Filter out players already checked (excluding self)
+    def _available_targets(self, targets: List[str]) -> List[str]:
+        """Filter out players already checked (excluding self)"""
         checked_players = set(self.known_roles.keys()) - {self.name}
         unchecked_targets = [t for t in targets if t not in checked_players]
 
         # If all players have been checked, allow re-checking (fallback)
-        available_targets = unchecked_targets if unchecked_targets else targets
+        return unchecked_targets if unchecked_targets else targets
+
+    def _night_action_prompt(self, context: str, targets: List[str]) -> str:
+        checked_players = set(self.known_roles.keys()) - {self.name}
+        available_targets = self._available_targets(targets)
 
-        prompt = f"""Night Phase - Seer's Check
+        return f"""Night Phase - Seer's Check
 
 Available targets: {', '.join(available_targets)}
 {f"(Note: You've already checked: {', '.join(checked_players)})" if checked_players else ""}
@@ -609,20 +713,32 @@ Who should you check tonight? Consider:
 
 Your choice:"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
+    def night_action(self, context: str, targets: List[str]) -> str:
+        """Choose player to check at night"""
+        response = self._ask(
+            self._night_action_prompt(context, targets), "night_action"
+        )
+        return self._extract_choice(
+            _extract_text_content(response), self._available_targets(targets)
         )
-        return self._extract_choice(_extract_text_content(response), available_targets)
 
-    def discuss(self, context: str, discussion_history: List[Msg]) -> str:
-        """Participate in discussion with knowledge of roles"""
+    async def anight_action(self, context: str, targets: List[str]) -> str:
+        """Async counterpart of `night_action`"""
+        response = await self._aask(
+            self._night_action_prompt(context, targets), "night_action"
+        )
+        return self._extract_choice(
+            _extract_text_content(response), self._available_targets(targets)
+        )
+
+    def _discuss_prompt(self, context: str, discussion_history: List[Msg]) -> str:
         known_wolves = [
             p
             for p, r in self.known_roles.items()
             if r == Role.WEREWOLF and p != self.name
         ]
 
-        prompt = f"""Current game context:
+        return f"""Current game context:
 {context}
 
 Recent discussion:
@@ -641,11 +757,6 @@ IMPORTANT: Just provide your statement directly. Do NOT start with your name.
 
 Your statement:"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-        return _extract_text_content(response)
-
     def _format_known_roles(self) -> str:
         if len(self.known_roles) <= 1:
             return "No players checked yet."
@@ -669,15 +780,14 @@ Your statement:"""
                 return player
         return valid_players[0] if valid_players else ""
 
-    def vote(self, context: str, alive_players: List[str]) -> str:
-        """Vote for a player to eliminate (using seer knowledge)"""
+    def _vote_prompt(self, context: str, alive_players: List[str]) -> str:
         known_wolves = [
             p
             for p, r in self.known_roles.items()
             if r == Role.WEREWOLF and p in alive_players
         ]
 
-        prompt = f"""Current game context:
+        return f"""Current game context:
 {context}
 
 Alive players: {', '.join(alive_players)}
@@ -694,11 +804,6 @@ As the seer, who should you vote for?
 Format: VOTE: [player_name]
 Reasoning: [your reasoning - be careful not to reveal too much seer knowledge]"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-        return self._extract_vote(_extract_text_content(response), alive_players)
-
     def _extract_vote(self, response: str, valid_players: List[str]) -> str:
         response_upper = response.upper()
         for player in valid_players:
@@ -710,6 +815,14 @@ Reasoning: [your reasoning - be careful not to reveal too much seer knowledge]""
 class WitchAgent(WerewolfAgentBase):
     """Witch agent - has one antidote and one poison"""
 
+    _STATE_FIELDS = WerewolfAgentBase._STATE_FIELDS + (
+        "antidote_used",
+        "poison_used",
+        "night_victims",
+        "saved_player",
+        "poisoned_player",
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.antidote_used = False
@@ -727,6 +840,7 @@ Your Role:
 - You are on the good side
 - You have one antidote (save the werewolf victim once)
 - You have one poison (kill any player once)
+- You can use at most one of them per night
 - You learn who the werewolves targeted each night
 
 Strategy:
@@ -742,17 +856,8 @@ Decision Making:
 - Consider saving abilities for late game
 - Don't waste poison on villagers"""
 
-    def night_action_save(self, victim: str, context: str) -> bool:
-        """Decide whether to save the victim"""
-        if self.antidote_used:
-            return False
-
-        # Record victim information
-        self.night_victims.append(
-            {"victim": victim, "round": len(self.night_victims) + 1}
-        )
-
-        prompt = f"""Night Phase - Witch's Decision (Antidote)
+    def _save_prompt(self, victim: str, context: str) -> str:
+        return f"""Night Phase - Witch's Decision (Antidote)
 
 The werewolves have attacked: {victim}
 
@@ -774,16 +879,38 @@ Consider:
 
 Decision (YES/NO):"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
+    def _record_victim(self, victim: str):
+        """Record night victim information"""
+        self.night_victims.append(
+            {"victim": victim, "round": len(self.night_victims) + 1}
         )
-        decision = "YES" in _extract_text_content(response).upper()
+
+    def _apply_save_decision(self, victim: str, response: str) -> bool:
+        decision = "YES" in response.upper()
 
         if decision:
             self.antidote_used = True
             self.saved_player = victim
         return decision
 
+    def night_action_save(self, victim: str, context: str) -> bool:
+        """Decide whether to save the victim"""
+        if self.antidote_used:
+            return False
+
+        self._record_victim(victim)
+        response = self._ask(self._save_prompt(victim, context), "witch_save")
+        return self._apply_save_decision(victim, _extract_text_content(response))
+
+    async def anight_action_save(self, victim: str, context: str) -> bool:
+        """Async counterpart of `night_action_save`"""
+        if self.antidote_used:
+            return False
+
+        self._record_victim(victim)
+        response = await self._aask(self._save_prompt(victim, context), "witch_save")
+        return self._apply_save_decision(victim, _extract_text_content(response))
+
     def _format_night_history(self) -> str:
         """Format night victim history"""
         if not self.night_victims:
@@ -795,12 +922,8 @@ Decision (YES/NO):"""
             ]
         )
 
-    def night_action_poison(self, context: str, targets: List[str]) -> Optional[str]:
-        """Decide whether to poison someone"""
-        if self.poison_used:
-            return None
-
-        prompt = f"""Night Phase - Witch's Decision (Poison)
+    def _poison_prompt(self, context: str, targets: List[str]) -> str:
+        return f"""Night Phase - Witch's Decision (Poison)
 
 Possible targets: {', '.join(targets)}
 
@@ -821,19 +944,38 @@ Consider:
 
 Decision: POISON: [player_name] or PASS"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-
-        if "PASS" in _extract_text_content(response).upper():
+    def _apply_poison_decision(
+        self, response: str, targets: List[str]
+    ) -> Optional[str]:
+        if "PASS" in response.upper():
             return None
 
-        target = self._extract_choice(_extract_text_content(response), targets)
+        target = self._extract_choice(response, targets)
         if target:
             self.poison_used = True
             self.poisoned_player = target
         return target
 
+    def night_action_poison(self, context: str, targets: List[str]) -> Optional[str]:
+        """Decide whether to poison someone"""
+        if self.poison_used:
+            return None
+
+        response = self._ask(self._poison_prompt(context, targets), "witch_poison")
+        return self._apply_poison_decision(_extract_text_content(response), targets)
+
+    async def anight_action_poison(
+        self, context: str, targets: List[str]
+    ) -> Optional[str]:
+        """Async counterpart of `night_action_poison`"""
+        if self.poison_used:
+            return None
+
+        response = await self._aask(
+            self._poison_prompt(context, targets), "witch_poison"
+        )
+        return self._apply_poison_decision(_extract_text_content(response), targets)
+
     def _extract_choice(self, response: str, valid_players: List[str]) -> Optional[str]:
         response_upper = response.upper()
         for player in valid_players:
@@ -841,9 +983,8 @@ Decision: POISON: [player_name] or PASS"""
                 return player
         return None
 
-    def discuss(self, context: str, discussion_history: List[Msg]) -> str:
-        """Participate in day discussion as witch"""
-        prompt = f"""Current game context:
+    def _discuss_prompt(self, context: str, discussion_history: List[Msg]) -> str:
+        return f"""Current game context:
 {context}
 
 Recent discussion:
@@ -858,14 +999,8 @@ IMPORTANT: Just provide your statement directly. Do NOT start with your name.
 
 Your statement:"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-        return _extract_text_content(response)
-
-    def vote(self, context: str, alive_players: List[str]) -> str:
-        """Vote for a player to eliminate"""
-        prompt = f"""Current game context:
+    def _vote_prompt(self, context: str, alive_players: List[str]) -> str:
+        return f"""Current game context:
 {context}
 
 Alive players: {', '.join(alive_players)}
@@ -877,11 +1012,6 @@ Strategy guidelines for your role:
 Format: VOTE: [player_name]
 Reasoning: [your reasoning]"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-        return self._extract_vote(_extract_text_content(response), alive_players)
-
     def _format_discussion(self, messages: List[Msg]) -> str:
         if not messages:
             return "No discussion yet."
@@ -898,6 +1028,8 @@ Reasoning: [your reasoning]"""
 class GuardianAgent(WerewolfAgentBase):
     """Guardian agent - can protect one player each night"""
 
+    _STATE_FIELDS = WerewolfAgentBase._STATE_FIELDS + ("last_protected",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.last_protected: Optional[str] = None
@@ -924,11 +1056,8 @@ Protection Priority:
 - Yourself if under suspicion
 - Random rotation to avoid patterns"""
 
-    def night_action(self, context: str, targets: List[str]) -> str:
-        """Choose player to protect"""
-        available = [t for t in targets if t != self.last_protected]
-
-        prompt = f"""Night Phase - Guardian's Protection
+    def _night_action_prompt(self, context: str, available: List[str]) -> str:
+        return f"""Night Phase - Guardian's Protection
 
 Available targets: {', '.join(available)}
 {'Last protected: ' + self.last_protected if self.last_protected else 'First night'}
@@ -947,8 +1076,21 @@ Who should you protect tonight? Consider:
 
 Your choice:"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
+    def night_action(self, context: str, targets: List[str]) -> str:
+        """Choose player to protect"""
+        available = [t for t in targets if t != self.last_protected]
+        response = self._ask(
+            self._night_action_prompt(context, available), "night_action"
+        )
+        choice = self._extract_choice(_extract_text_content(response), available)
+        self.last_protected = choice
+        return choice
+
+    async def anight_action(self, context: str, targets: List[str]) -> str:
+        """Async counterpart of `night_action`"""
+        available = [t for t in targets if t != self.last_protected]
+        response = await self._aask(
+            self._night_action_prompt(context, available), "night_action"
         )
         choice = self._extract_choice(_extract_text_content(response), available)
         self.last_protected = choice
@@ -961,9 +1103,8 @@ Your choice:"""
                 return player
         return valid_players[0] if valid_players else ""
 
-    def discuss(self, context: str, discussion_history: List[Msg]) -> str:
-        """Participate in day discussion as guardian"""
-        prompt = f"""Current game context:
+    def _discuss_prompt(self, context: str, discussion_history: List[Msg]) -> str:
+        return f"""Current game context:
 {context}
 
 Recent discussion:
@@ -978,14 +1119,8 @@ IMPORTANT: Just provide your statement directly. Do NOT start with your name.
 
 Your statement:"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-        return _extract_text_content(response)
-
-    def vote(self, context: str, alive_players: List[str]) -> str:
-        """Vote for a player to eliminate"""
-        prompt = f"""Current game context:
+    def _vote_prompt(self, context: str, alive_players: List[str]) -> str:
+        return f"""Current game context:
 {context}
 
 Alive players: {', '.join(alive_players)}
@@ -997,11 +1132,6 @@ Strategy guidelines for your role:
 Format: VOTE: [player_name]
 Reasoning: [your reasoning]"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-        return self._extract_vote(_extract_text_content(response), alive_players)
-
     def _format_discussion(self, messages: List[Msg]) -> str:
         if not messages:
             return "No discussion yet."
@@ -1014,13 +1144,13 @@ Reasoning: [your reasoning]"""
                 return player
         return valid_players[0] if valid_players else ""
 
-    def last_words(self, context: str, cause_of_death: str) -> str:
+    def _last_words_prompt(self, context: str, cause_of_death: str) -> str:
         """Guardian's last words - can mention protection patterns"""
         protection_history = []
         if hasattr(self, "last_protected") and self.last_protected:
             protection_history.append(f"Last protected: {self.last_protected}")
 
-        prompt = f"""You are about to die in the Werewolf game.
+        return f"""You are about to die in the Werewolf game.
         
 Your Role: {self.role.value}
 Cause of Death: {cause_of_death}
@@ -1038,11 +1168,6 @@ This is your last chance to speak. What are your final words?
 
 Your last words (keep it brief, 2-3 sentences):"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-        return _extract_text_content(response)
-
 
 class HunterAgent(WerewolfAgentBase):
     """Hunter agent - can shoot someone when dying (except by witch poison)"""
@@ -1067,17 +1192,10 @@ Strategy When Dying:
 3. Don't shoot randomly - make it count
 4. Consider information from seer or other sources"""
 
-    def shoot_target(
+    def _shoot_prompt(
         self, context: str, alive_players: List[str], cause_of_death: str
     ) -> str:
-        """Choose who to shoot when dying
-
-        Args:
-            context: Current game context
-            alive_players: List of players still alive
-            cause_of_death: How the hunter died
-        """
-        prompt = f"""You are the HUNTER and you are dying!
+        return f"""You are the HUNTER and you are dying!
 
 Cause of Death: {cause_of_death}
 
@@ -1097,8 +1215,27 @@ Consider:
 
 Your choice (just the player name):"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
+    def shoot_target(
+        self, context: str, alive_players: List[str], cause_of_death: str
+    ) -> str:
+        """Choose who to shoot when dying
+
+        Args:
+            context: Current game context
+            alive_players: List of players still alive
+            cause_of_death: How the hunter died
+        """
+        response = self._ask(
+            self._shoot_prompt(context, alive_players, cause_of_death), "hunter_shot"
+        )
+        return self._extract_choice(_extract_text_content(response), alive_players)
+
+    async def ashoot_target(
+        self, context: str, alive_players: List[str], cause_of_death: str
+    ) -> str:
+        """Async counterpart of `shoot_target`"""
+        response = await self._aask(
+            self._shoot_prompt(context, alive_players, cause_of_death), "hunter_shot"
         )
         return self._extract_choice(_extract_text_content(response), alive_players)
 
@@ -1109,9 +1246,8 @@ Your choice (just the player name):"""
                 return player
         return valid_players[0] if valid_players else ""
 
-    def discuss(self, context: str, discussion_history: List[Msg]) -> str:
-        """Participate in day discussion as hunter (pretending to be villager)"""
-        prompt = f"""Current game context:
+    def _discuss_prompt(self, context: str, discussion_history: List[Msg]) -> str:
+        return f"""Current game context:
 {context}
 
 Recent discussion:
@@ -1126,14 +1262,8 @@ IMPORTANT: Just provide your statement directly. Do NOT start with your name.
 
 Your statement:"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-        return _extract_text_content(response)
-
-    def vote(self, context: str, alive_players: List[str]) -> str:
-        """Vote for a player to eliminate"""
-        prompt = f"""Current game context:
+    def _vote_prompt(self, context: str, alive_players: List[str]) -> str:
+        return f"""Current game context:
 {context}
 
 Alive players: {', '.join(alive_players)}
@@ -1145,11 +1275,6 @@ Strategy guidelines for your role:
 Format: VOTE: [player_name]
 Reasoning: [your reasoning]"""
 
-        response = _run_model_sync(
-            self.model, [Msg(name=self.name, content=prompt, role="user")]
-        )
-        return self._extract_vote(_extract_text_content(response), alive_players)
-
     def _format_discussion(self, messages: List[Msg]) -> str:
         if not messages:
             return "No discussion yet."
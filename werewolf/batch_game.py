@@ -0,0 +1,428 @@
+"""
+Vectorized batch rules engine (NumPy)
+
+Runs thousands of independent games in lock-step as (games, players) arrays
+instead of one `WerewolfGame` per game, for rule-balance sweeps and policy
+evaluation where per-game Python overhead dominates.
+
+Layout (N games, P players):
+- roles:         int8 (N, P) role codes, see `ROLE_CODES`
+- alive:         bool (N, P)
+- death_cause:   int8 (N, P) index into `DEATH_CAUSES` (0 = alive)
+- antidote_used, poison_used: bool (N,)
+- guardian_last: int (N,) seat last guarded, -1 if none
+
+Player choices are passed as int arrays of seat indices with -1 meaning
+"no choice". Rules follow `WerewolfGame`, with one documented difference:
+ties in the werewolf tally break to the lowest seat index instead of the
+first target named.
+"""
+
+import time
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from .simulator import PLAYER_COUNTS, SimulationResult
+from .werewolf_game import GOD_ROLES, ROLE_PRESETS, Role
+
+ROLES = list(Role)
+ROLE_CODES = {role: code for code, role in enumerate(ROLES)}
+DEATH_CAUSES = ("", "werewolf_kill", "witch_poison", "voted_out", "hunter_shot")
+
+# Winner codes returned by `check_game_end`
+NO_WINNER, WEREWOLVES_WIN, VILLAGERS_WIN = 0, 1, 2
+WINNER_NAMES = {NO_WINNER: "", WEREWOLVES_WIN: "werewolves", VILLAGERS_WIN: "villagers"}
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("The batch engine requires numpy. Run: pip install numpy")
+
+
+def random_choice(rng, mask):
+    """Pick a uniformly random True index along the last axis of `mask`
+
+    Returns an int array of mask.shape[:-1]; rows without candidates get -1.
+    """
+    scores = rng.random(mask.shape)
+    scores[~mask] = -1.0
+    choice = scores.argmax(axis=-1)
+    choice[~mask.any(axis=-1)] = -1
+    return choice
+
+
+class BatchWerewolfGame:
+    """N independent games of the same `game_type`, stepped together
+
+    Args:
+        n_games: Number of games in the batch
+        game_type: Role preset (six, nine, twelve)
+        rng: `numpy.random.Generator` used for role assignment
+        n_players: Seats per game (default: preset size for `game_type`)
+    """
+
+    def __init__(
+        self,
+        n_games: int,
+        game_type: str = "six",
+        rng=None,
+        n_players: Optional[int] = None,
+    ):
+        _require_numpy()
+        preset = ROLE_PRESETS.get(game_type, ROLE_PRESETS["twelve"])
+        n_players = n_players or PLAYER_COUNTS.get(game_type, len(preset))
+        if n_players < 4:
+            raise ValueError("Need at least 4 players to play")
+
+        self.game_type = game_type
+        self.n_games = n_games
+        self.n_players = n_players
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        # Like `WerewolfGame._assign_roles`: shuffle the whole preset (padded
+        # with villagers), then deal the first n_players roles
+        codes = [ROLE_CODES[r] for r in preset]
+        codes += [ROLE_CODES[Role.VILLAGER]] * (n_players - len(codes))
+        # Independent shuffle per game: argsort of uniform keys is a random permutation
+        perm = self.rng.random((n_games, len(codes))).argsort(axis=1)
+        self.roles = np.asarray(codes, dtype=np.int8)[perm[:, :n_players]]
+
+        self.alive = np.ones((n_games, n_players), dtype=bool)
+        self.death_cause = np.zeros((n_games, n_players), dtype=np.int8)
+        self.antidote_used = np.zeros(n_games, dtype=bool)
+        self.poison_used = np.zeros(n_games, dtype=bool)
+        self.guardian_last = np.full(n_games, -1, dtype=np.int64)
+        self.day_count = np.zeros(n_games, dtype=np.int64)
+
+        self._rows = np.arange(n_games)
+        self._seats = np.arange(n_players)
+        self._is_wolf = self.roles == ROLE_CODES[Role.WEREWOLF]
+        self._is_villager = self.roles == ROLE_CODES[Role.VILLAGER]
+        self._is_god = np.isin(self.roles, [ROLE_CODES[r] for r in GOD_ROLES])
+
+    def has_role(self, role: Role):
+        """bool (N, P): seats holding `role`, dead or alive"""
+        return self.roles == ROLE_CODES[role]
+
+    def alive_with_role(self, role: Role):
+        """bool (N, P): living seats holding `role`"""
+        return self.alive & self.has_role(role)
+
+    def _is_alive(self, seats):
+        """bool (N,): whether seat `seats[i]` is alive in game i (-1 -> False)"""
+        return (seats >= 0) & self.alive[self._rows, np.maximum(seats, 0)]
+
+    def _kill(self, seats, mask, cause: str):
+        rows = self._rows[mask]
+        self.alive[rows, seats[mask]] = False
+        self.death_cause[rows, seats[mask]] = DEATH_CAUSES.index(cause)
+
+    def tally(self, choices, voters):
+        """Count valid choices per target
+
+        Args:
+            choices: int (N, P) target seat chosen by each seat, -1 for none
+            voters: bool (N, P) seats whose choice counts
+
+        A choice is valid if the voter is alive, the target is alive and the
+        voter does not pick themself. Returns int (N, P) counts per target.
+        """
+        target_alive = np.take_along_axis(self.alive, np.maximum(choices, 0), axis=1)
+        valid = (
+            voters
+            & self.alive
+            & (choices >= 0)
+            & target_alive
+            & (choices != self._seats)
+        )
+        flat = (self._rows[:, None] * self.n_players + choices)[valid]
+        return np.bincount(flat, minlength=self.n_games * self.n_players).reshape(
+            self.n_games, self.n_players
+        )
+
+    @staticmethod
+    def top_target(counts) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return (target, unique): the most-chosen seat per game and whether it
+        is the only one with that count. Games without choices get -1/False."""
+        top = counts.max(axis=1)
+        target = counts.argmax(axis=1)
+        unique = ((counts == top[:, None]).sum(axis=1) == 1) & (top > 0)
+        target[top == 0] = -1
+        return target, unique
+
+    def werewolf_target(self, wolf_choices):
+        """Werewolf majority target per game (ties -> lowest seat), and whether
+        the werewolves agreed on a unique target"""
+        return self.top_target(self.tally(wolf_choices, self._is_wolf))
+
+    def execute_night_phase(
+        self,
+        wolf_choices,
+        guard_targets=None,
+        saves=None,
+        poison_targets=None,
+        active=None,
+    ):
+        """Resolve one night for every active game
+
+        Args:
+            wolf_choices: int (N, P) each werewolf's target seat
+            guard_targets: int (N,) seat the guardian protects, -1 for none
+            saves: bool (N,) witch uses the antidote on the werewolf target
+            poison_targets: int (N,) seat the witch poisons, -1 for none
+            active: bool (N,) games still in progress (default: all)
+
+        Returns:
+            (night_death, poisoned): int (N,) seats, -1 where nobody died
+        """
+        n = self.n_games
+        active = np.ones(n, dtype=bool) if active is None else active
+        guard_targets = (
+            np.full(n, -1, dtype=np.int64) if guard_targets is None else guard_targets
+        )
+        saves = np.zeros(n, dtype=bool) if saves is None else saves
+        poison_targets = (
+            np.full(n, -1, dtype=np.int64) if poison_targets is None else poison_targets
+        )
+
+        victim, _ = self.werewolf_target(wolf_choices)
+        victim = np.where(active, victim, -1)
+        has_victim = victim >= 0
+
+        # Guardian: valid target, not the same player two nights in a row
+        guardian_alive = self.alive_with_role(Role.GUARDIAN).any(axis=1)
+        guard_ok = (
+            active
+            & guardian_alive
+            & self._is_alive(guard_targets)
+            & (guard_targets != self.guardian_last)
+        )
+        self.guardian_last[guard_ok] = guard_targets[guard_ok]
+        guarded = guard_ok & (guard_targets == victim)
+
+        # Witch: antidote and poison are one-shot each, and at most one of
+        # them is used per night (a save takes precedence)
+        witch_alive = self.alive_with_role(Role.WITCH).any(axis=1)
+        saved = active & witch_alive & saves & ~self.antidote_used & has_victim
+        self.antidote_used |= saved
+        poison_ok = (
+            active
+            & witch_alive
+            & ~saved
+            & ~self.poison_used
+            & self._is_alive(poison_targets)
+        )
+        self.poison_used |= poison_ok
+        self._kill(poison_targets, poison_ok, "witch_poison")
+        poisoned = np.where(poison_ok, poison_targets, -1)
+
+        # Guarded and saved -> dies; only one of the two -> survives
+        dies = has_victim & (guarded == saved) & self._is_alive(victim)
+        self._kill(victim, dies, "werewolf_kill")
+        night_death = np.where(dies, victim, -1)
+        return night_death, poisoned
+
+    def execute_day_phase(self, votes, active=None):
+        """Eliminate each active game's unique vote leader (tie -> nobody)
+
+        Args:
+            votes: int (N, P) each seat's vote target, -1 for abstain
+            active: bool (N,) games still in progress (default: all)
+
+        Returns:
+            int (N,) eliminated seat, -1 where nobody was eliminated
+        """
+        active = np.ones(self.n_games, dtype=bool) if active is None else active
+        target, unique = self.top_target(self.tally(votes, self.alive))
+        eliminated = active & unique
+        self._kill(target, eliminated, "voted_out")
+        self.day_count += active
+        return np.where(eliminated, target, -1)
+
+    def hunter_shoot(self, dead, targets):
+        """Apply hunter shots for games where seat `dead[i]` is a hunter
+
+        Args:
+            dead: int (N,) seat that just died, -1 for none
+            targets: int (N,) seat the hunter shoots, -1 for none
+
+        Returns:
+            int (N,) seat shot, -1 where no shot was fired
+        """
+        is_hunter = (dead >= 0) & (
+            self.roles[self._rows, np.maximum(dead, 0)] == ROLE_CODES[Role.HUNTER]
+        )
+        shot = is_hunter & self._is_alive(targets)
+        self._kill(targets, shot, "hunter_shot")
+        return np.where(shot, targets, -1)
+
+    def check_game_end(self):
+        """Vectorized `WerewolfGame.check_game_end`
+
+        Returns:
+            (ended, winner): bool (N,) and int8 (N,) codes from `WINNER_NAMES`
+        """
+        wolves = (self.alive & self._is_wolf).sum(axis=1)
+        civilians = (self.alive & self._is_villager).sum(axis=1)
+        gods = (self.alive & self._is_god).sum(axis=1)
+
+        if self.n_players == 6:
+            wolves_win = (civilians == 0) & (gods == 0)
+        else:
+            wolves_win = (civilians == 0) | (gods == 0)
+        wolves_win |= wolves >= civilians + gods
+
+        villagers_win = wolves == 0
+        winner = np.where(
+            villagers_win,
+            VILLAGERS_WIN,
+            np.where(wolves_win, WEREWOLVES_WIN, NO_WINNER),
+        ).astype(np.int8)
+        return winner != NO_WINNER, winner
+
+    def death_records(self, game: int) -> dict:
+        """`GameState.death_records`-style dict for one game (keys are seats)"""
+        return {
+            int(seat): DEATH_CAUSES[cause]
+            for seat, cause in enumerate(self.death_cause[game])
+            if cause
+        }
+
+
+class BatchRandomPolicy:
+    """Vectorized equivalent of `simulator.Policy` (uniformly random play)"""
+
+    name = "random"
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def guardian_targets(self, game: BatchWerewolfGame):
+        last = game.guardian_last[:, None]
+        return random_choice(self.rng, game.alive & (game._seats != last))
+
+    def werewolf_choices(self, game: BatchWerewolfGame):
+        candidates = game.alive & ~game._is_wolf
+        per_wolf = np.broadcast_to(
+            candidates[:, None, :], (game.n_games, game.n_players, game.n_players)
+        )
+        choices = random_choice(self.rng, per_wolf)
+        choices[~(game.alive & game._is_wolf)] = -1
+        return choices
+
+    def witch_saves(self, game: BatchWerewolfGame):
+        return self.rng.random(game.n_games) < 0.5
+
+    def witch_poison(self, game: BatchWerewolfGame):
+        wants = self.rng.random(game.n_games) < 0.2
+        witch = game.alive_with_role(Role.WITCH)
+        targets = random_choice(self.rng, game.alive & ~witch)
+        return np.where(wants, targets, -1)
+
+    def votes(self, game: BatchWerewolfGame):
+        candidates = game.alive[:, None, :] & ~np.eye(game.n_players, dtype=bool)
+        votes = random_choice(self.rng, candidates)
+        votes[~game.alive] = -1
+        return votes
+
+    def hunter_shots(self, game: BatchWerewolfGame):
+        return random_choice(self.rng, game.alive)
+
+
+class BatchSimulator:
+    """Play a batch of games to completion with a vectorized policy
+
+    Mirrors `HeadlessSimulator`: the witch is only offered the antidote when
+    the werewolves agree on a unique target, and is only asked to poison on
+    nights the witch does not save.
+    """
+
+    def __init__(self, policy: BatchRandomPolicy, max_rounds: int = 20):
+        self.policy = policy
+        self.max_rounds = max_rounds
+
+    def _night(self, game: BatchWerewolfGame, active):
+        policy = self.policy
+        guard_targets = policy.guardian_targets(game)
+        wolf_choices = policy.werewolf_choices(game)
+
+        target, agreed = game.werewolf_target(wolf_choices)
+        witch_alive = game.alive_with_role(Role.WITCH).any(axis=1)
+        offered = active & agreed & witch_alive & ~game.antidote_used
+        saves = offered & policy.witch_saves(game)
+        poison = policy.witch_poison(game)
+        poison = np.where(active & witch_alive & ~game.poison_used & ~saves, poison, -1)
+
+        night_death, _ = game.execute_night_phase(
+            wolf_choices, guard_targets, saves, poison, active
+        )
+        game.hunter_shoot(night_death, policy.hunter_shots(game))
+
+    def _day(self, game: BatchWerewolfGame, active):
+        eliminated = game.execute_day_phase(self.policy.votes(game), active)
+        game.hunter_shoot(eliminated, self.policy.hunter_shots(game))
+
+    def play(self, game: BatchWerewolfGame):
+        """Play every game in the batch to completion
+
+        Returns:
+            (winner, rounds): int8 (N,) winner codes and int (N,) rounds played;
+            games still running after `max_rounds` are draws (NO_WINNER)
+        """
+        n = game.n_games
+        active = np.ones(n, dtype=bool)
+        winner = np.zeros(n, dtype=np.int8)
+        rounds = np.full(n, self.max_rounds, dtype=np.int64)
+
+        for round_num in range(1, self.max_rounds + 1):
+            for step in (self._night, self._day):
+                step(game, active)
+                ended, result = game.check_game_end()
+                finished = active & ended
+                winner[finished] = result[finished]
+                rounds[finished] = round_num
+                active &= ~ended
+            if not active.any():
+                break
+
+        return winner, rounds
+
+
+def simulate_batch(
+    game_type: str = "six",
+    n_games: int = 10000,
+    seed: Optional[int] = None,
+    max_rounds: int = 20,
+    batch_size: int = 65536,
+) -> SimulationResult:
+    """Vectorized counterpart of `simulator.simulate` for the random policy
+
+    Args:
+        game_type: Game type (six, nine, twelve)
+        n_games: Number of games to play
+        seed: Seed for the NumPy generator
+        max_rounds: Maximum number of day/night cycles per game
+        batch_size: Games stepped together per batch (bounds memory)
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    simulator = BatchSimulator(BatchRandomPolicy(rng), max_rounds)
+    result = SimulationResult(game_type=game_type, policy=BatchRandomPolicy.name)
+
+    start = time.perf_counter()
+    remaining = n_games
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        winner, rounds = simulator.play(BatchWerewolfGame(size, game_type, rng))
+        result.games += size
+        result.total_rounds += int(rounds.sum())
+        result.werewolf_wins += int((winner == WEREWOLVES_WIN).sum())
+        result.villager_wins += int((winner == VILLAGERS_WIN).sum())
+        result.draws += int((winner == NO_WINNER).sum())
+        remaining -= size
+    result.elapsed = time.perf_counter() - start
+    return result
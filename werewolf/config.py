@@ -5,6 +5,8 @@ Configuration file for Werewolf Multi-Agent Game
 import os
 from pathlib import Path
 
+from .response_cache import parse_cache_mode
+
 # Load environment variables from .env.local if it exists
 try:
     from dotenv import load_dotenv
@@ -73,6 +75,35 @@ MODEL_CONFIGS = [
             "stream": True,  # Use streaming (AgentScope bug with stream_options when stream=False)
         },
     },
+    # Offline load testing against `python -m werewolf.mock_server`
+    {
+        "config_name": "mock_openai",
+        "model_type": "openai_chat",
+        "model_name": "mock",
+        "api_key": "mock",
+        "base_url": os.getenv("WEREWOLF_MOCK_URL", "http://127.0.0.1:8765") + "/v1",
+        "generate_args": {
+            "temperature": 0.7,
+            "max_tokens": 1200,
+            "stream": True,
+        },
+    },
+    {
+        "config_name": "mock_ollama",
+        "model_type": "ollama_chat",
+        "model_name": "mock",
+        "host": os.getenv("WEREWOLF_MOCK_URL", "http://127.0.0.1:8765"),
+        "generate_args": {
+            "temperature": 0.7,
+        },
+    },
+    # Same scripted answers in-process, no server needed
+    {
+        "config_name": "mock_canned",
+        "model_type": "canned",
+        "seed": 0,
+        "latency": "fixed:0",  # e.g. "lognormal:0.8,0.5"
+    },
 ]
 
 # Game configurations
@@ -153,3 +184,40 @@ LOGGING_CONFIG = {
     "save_to_file": True,
     "log_file": "werewolf_game.log",
 }
+
+# Game transcript buffering (see werewolf/transcript.py): lines are appended
+# in batches instead of one open/write/close per line
+TRANSCRIPT_CONFIG = {
+    "flush_lines": 50,  # Flush after this many buffered lines (1 = real-time)
+    "flush_interval": 2.0,  # ...or when a line arrives this many seconds later
+    "flush_on_phase": True,  # ...and at every night/day phase boundary
+    "fsync": False,  # fsync on every flush (power-loss safe, slower)
+}
+
+# Cross-process rate limiting of model calls (see werewolf/rate_limiter.py).
+# Only configs with a "rate_limit" entry in MODEL_CONFIGS are throttled, e.g.
+#   "rate_limit": {"requests_per_minute": 500, "tokens_per_minute": 200000},
+RATE_LIMIT_CONFIG = {
+    "enabled": os.getenv("WEREWOLF_RATE_LIMIT", "1") != "0",
+    "path": os.getenv(
+        "WEREWOLF_RATE_LIMIT_PATH",
+        os.path.join(".training", "cache", "rate_limits.sqlite"),
+    ),
+    "headroom": 0.9,  # Use this fraction of the provider limits
+    "burst_seconds": 1.0,  # Bucket capacity in seconds of refill
+}
+
+# Optional on-disk LLM response cache (see werewolf/response_cache.py).
+# Enable with e.g. WEREWOLF_RESPONSE_CACHE=readwrite (or readonly/record/replay,
+# 1/on for readwrite); 0/off/false or unset disables it. Other values raise.
+_RESPONSE_CACHE_MODE = parse_cache_mode(os.getenv("WEREWOLF_RESPONSE_CACHE"))
+RESPONSE_CACHE_CONFIG = {
+    "enabled": _RESPONSE_CACHE_MODE is not None,
+    "mode": _RESPONSE_CACHE_MODE or "readwrite",
+    "path": os.getenv(
+        "WEREWOLF_RESPONSE_CACHE_PATH",
+        os.path.join(".training", "cache", "responses.sqlite"),
+    ),
+    "max_entries": 50000,
+    "max_bytes": 512 * 1024 * 1024,
+}
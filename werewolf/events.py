@@ -0,0 +1,98 @@
+"""
+Structured game event stream (JSONL)
+
+Alongside the human-readable transcript, the orchestrator writes one JSON
+object per line for every phase change, action, vote, statement and death,
+so tools can load a game with `json.loads` per line instead of parsing the
+transcript with regexes.
+
+Every record has:
+- seq:   0-based position in the stream
+- type:  one of `EVENT_TYPES`
+- round: game round (0 before the first night)
+- phase: "setup", "night", "day" or "end"
+- ts:    Unix timestamp
+
+plus type-specific fields:
+- game_start:  game_type, players, roles
+- phase_start: alive
+- action:      actor, role, action (protect, kill, check, save, no_save,
+               poison, no_poison, shoot), target
+- seer_result: actor, target, team
+- statement:   speaker, kind (discussion, last_words), text
+- vote:        voter, target
+- vote_result: eliminated (None on a tie), votes
+- death:       player, role, cause
+- game_end:    winner, rounds, survivors
+"""
+
+import json
+import time
+from typing import Any, Dict, Iterator
+
+from .transcript import TranscriptWriter
+
+EVENT_TYPES = (
+    "game_start",
+    "phase_start",
+    "action",
+    "seer_result",
+    "statement",
+    "vote",
+    "vote_result",
+    "death",
+    "game_end",
+)
+
+
+class EventLog:
+    """JSONL event writer with the same buffering policy as the transcript
+
+    Args:
+        path: Output file (truncated on creation unless `append`)
+        seq: Sequence number of the first event written
+        append: Continue an existing stream (e.g. a resumed game)
+        **flush_policy: `TranscriptWriter` flush options
+    """
+
+    def __init__(self, path: str, seq: int = 0, append: bool = False, **flush_policy):
+        self.path = path
+        self.seq = seq
+        self._writer = TranscriptWriter(path, **flush_policy)
+        if not append:
+            self._writer.write_header([])
+
+    def emit(
+        self, event_type: str, round_num: int, phase: str, **data: Any
+    ) -> Dict[str, Any]:
+        """Append one event and return the record"""
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+        record = {
+            "seq": self.seq,
+            "type": event_type,
+            "round": round_num,
+            "phase": phase,
+            "ts": round(time.time(), 3),
+            **data,
+        }
+        self.seq += 1
+        self._writer.write(json.dumps(record, ensure_ascii=False, default=str))
+        return record
+
+    def phase_boundary(self):
+        self._writer.phase_boundary()
+
+    def flush(self):
+        self._writer.flush()
+
+    def close(self):
+        self._writer.close()
+
+
+def read_events(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the events of a JSONL event log in order"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -11,9 +11,10 @@ from __future__ import annotations
 import os
 import json
 import datetime
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 
 from .agents import WerewolfAgentBase
+from .metrics import ModelCallMetrics
 from .werewolf_game import Role
 
 try:
@@ -77,8 +78,9 @@ def _extract_and_fix_json(text: str) -> str:
 
 
 class ReviewAgent:
-    def __init__(self, model):
+    def __init__(self, model, metrics: Optional[ModelCallMetrics] = None):
         self.model = model
+        self.metrics = metrics
 
     def analyze_transcript(
         self, transcript: str, roles: Dict[str, Role], winner: str
@@ -126,7 +128,10 @@ IMPORTANT: Make sure to close ALL quotes and braces. The response must end with
 Start your response with {{ and end with }}
 """
         response = _run_model_sync(
-            self.model, [Msg(name="reviewer", content=prompt, role="user")]
+            self.model,
+            [Msg(name="reviewer", content=prompt, role="user")],
+            metrics=self.metrics,
+            call_site="review",
         )
         try:
             # Extract content from AgentScope response format
@@ -282,8 +287,9 @@ Start your response with {{ and end with }}
 
 
 class CriticAgent:
-    def __init__(self, model):
+    def __init__(self, model, metrics: Optional[ModelCallMetrics] = None):
         self.model = model
+        self.metrics = metrics
 
     def refine_lessons(
         self, lessons_by_role: Dict[str, List[str]]
@@ -321,7 +327,10 @@ Output: ["Analyze voting patterns rather than blindly following consensus"]
 Generate merged, high-quality rules (6-10 per role).
 """
         response = _run_model_sync(
-            self.model, [Msg(name="critic", content=prompt, role="user")]
+            self.model,
+            [Msg(name="critic", content=prompt, role="user")],
+            metrics=self.metrics,
+            call_site="critic",
         )
         try:
             # Extract content from AgentScope response format
@@ -463,9 +472,16 @@ class StrategyManager:
 
 
 def run_learning_pipeline(
-    log_file: str, agents: Dict[str, WerewolfAgentBase], roles: Dict[str, Role], model
+    log_file: str,
+    agents: Dict[str, WerewolfAgentBase],
+    roles: Dict[str, Role],
+    model,
+    metrics: Optional[ModelCallMetrics] = None,
 ) -> str:
-    """Run end-to-end learning pipeline. Returns review directory path."""
+    """Run end-to-end learning pipeline. Returns review directory path.
+
+    Review and critic model calls are recorded in `metrics` if given.
+    """
     # Read transcript
     with open(log_file, "r", encoding="utf-8") as f:
         transcript = f.read()
@@ -482,12 +498,12 @@ def run_learning_pipeline(
     review_dir = os.path.join(os.getcwd(), ".training", "reviews", timestamp)
     os.makedirs(review_dir, exist_ok=True)
 
-    reviewer = ReviewAgent(model)
+    reviewer = ReviewAgent(model, metrics)
     per_player, overall, lessons = reviewer.analyze_transcript(
         transcript, roles, winner
     )
 
-    critic = CriticAgent(model)
+    critic = CriticAgent(model, metrics)
     refined_lessons = critic.refine_lessons(lessons)
 
     # Save reports
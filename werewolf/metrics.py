@@ -0,0 +1,197 @@
+"""
+Model call instrumentation
+
+Every model call made through `_run_model_async`/`_run_model_sync` can be
+recorded in a `ModelCallMetrics` collector. The orchestrator keeps one per
+game, hands it to its agents and the learning pipeline, exposes the
+aggregates in `get_game_summary()["model_calls"]` and writes one JSON object
+per call to `<transcript name>.metrics.jsonl`.
+
+Each record has:
+- seq:               0-based position in the stream
+- call_site:         one of `CALL_SITES`
+- model_config:      model config name
+- agent, role:       calling player and role (None for review/critic)
+- round, phase:      game position when the call was made
+- wall_time:         seconds from first attempt to result, incl. retry waits
+- retries:           failed attempts before the final one
+- prompt_tokens,
+  completion_tokens: token usage reported by the model (None if unreported)
+- cached:            served from the response cache
+- error:             error message if the call finally failed, else None
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .transcript import TranscriptWriter
+
+CALL_SITES = (
+    "discuss",
+    "vote",
+    "last_words",
+    "night_action",
+    "witch_save",
+    "witch_poison",
+    "hunter_shot",
+    "review",
+    "critic",
+)
+
+# Usage attribute names: AgentScope ChatUsage first, then OpenAI style
+_PROMPT_TOKEN_KEYS = ("input_tokens", "prompt_tokens")
+_COMPLETION_TOKEN_KEYS = ("output_tokens", "completion_tokens")
+
+
+def _usage_value(usage: Any, keys: Tuple[str, ...]) -> Optional[int]:
+    for key in keys:
+        if isinstance(usage, dict):
+            value = usage.get(key)
+        else:
+            value = getattr(usage, key, None)
+        if isinstance(value, (int, float)):
+            return int(value)
+    return None
+
+
+def extract_usage(response: Any) -> Tuple[Optional[int], Optional[int]]:
+    """(prompt_tokens, completion_tokens) reported with a model response"""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None, None
+    return (
+        _usage_value(usage, _PROMPT_TOKEN_KEYS),
+        _usage_value(usage, _COMPLETION_TOKEN_KEYS),
+    )
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list (0 if empty)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * q / 100))
+    return sorted_values[rank - 1]
+
+
+def aggregate(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Call count, latency percentiles, retries and token totals"""
+    records = list(records)
+    latencies = sorted(r["wall_time"] for r in records)
+    return {
+        "calls": len(records),
+        "errors": sum(1 for r in records if r["error"]),
+        "cached": sum(1 for r in records if r["cached"]),
+        "retries": sum(r["retries"] for r in records),
+        "wall_time": round(sum(latencies), 6),
+        "latency_p50": _percentile(latencies, 50),
+        "latency_p95": _percentile(latencies, 95),
+        "latency_max": latencies[-1] if latencies else 0.0,
+        "prompt_tokens": sum(r["prompt_tokens"] or 0 for r in records),
+        "completion_tokens": sum(r["completion_tokens"] or 0 for r in records),
+    }
+
+
+class ModelCallMetrics:
+    """Thread-safe per-game collector of model call records
+
+    Args:
+        path: JSONL output file (truncated on creation unless `append`);
+            None keeps the records in memory only
+        append: Load the records already in `path` and continue the file
+            (e.g. a resumed game)
+        **flush_policy: `TranscriptWriter` flush options
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, append: bool = False, **flush_policy
+    ):
+        self.path = path
+        self.records: List[Dict[str, Any]] = []
+        self.round = 0
+        self.phase = "setup"
+        # (start, end) perf_counter times of each call, for `PhaseProfiler`
+        self.intervals: List[Tuple[float, float]] = []
+        self._lock = threading.Lock()
+        self._writer: Optional[TranscriptWriter] = None
+        if path:
+            self._writer = TranscriptWriter(path, **flush_policy)
+            if append and os.path.exists(path):
+                self.records = read_metrics(path)
+            else:
+                self._writer.write_header([])
+
+    def set_position(self, round_num: int, phase: str):
+        """Game position stamped on subsequent records"""
+        self.round = round_num
+        self.phase = phase
+
+    def record(
+        self,
+        call_site: str,
+        model_config: Optional[str],
+        wall_time: float,
+        retries: int = 0,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        cached: bool = False,
+        error: Optional[str] = None,
+        agent: Optional[str] = None,
+        role: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Add one call and return the record"""
+        end = time.perf_counter()
+        with self._lock:
+            self.intervals.append((end - wall_time, end))
+            record = {
+                "seq": len(self.records),
+                "call_site": call_site,
+                "model_config": model_config,
+                "agent": agent,
+                "role": role,
+                "round": self.round,
+                "phase": self.phase,
+                "wall_time": round(wall_time, 6),
+                "retries": retries,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "cached": cached,
+                "error": error,
+            }
+            self.records.append(record)
+        if self._writer:
+            self._writer.write(json.dumps(record, ensure_ascii=False, default=str))
+        return record
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals plus the same aggregates per call site, role and phase"""
+        with self._lock:
+            records = list(self.records)
+        summary = aggregate(records)
+        for key in ("call_site", "role", "phase"):
+            groups: Dict[str, List[Dict[str, Any]]] = {}
+            for r in records:
+                groups.setdefault(str(r[key]), []).append(r)
+            summary[f"by_{key}"] = {k: aggregate(v) for k, v in groups.items()}
+        return summary
+
+    def phase_boundary(self):
+        if self._writer:
+            self._writer.phase_boundary()
+
+    def flush(self):
+        if self._writer:
+            self._writer.flush()
+
+    def close(self):
+        if self._writer:
+            self._writer.close()
+
+
+def read_metrics(path: str) -> List[Dict[str, Any]]:
+    """Load the records of a metrics JSONL file"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
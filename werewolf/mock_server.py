@@ -0,0 +1,679 @@
+"""
+Local stand-in for the model APIs configured in `werewolf.config`
+
+Serves the two HTTP protocols `MODEL_CONFIGS` uses, so games, the retry
+logic of `_run_model_async` and the self-play runner can be exercised end to
+end without a paid API:
+- OpenAI chat completions: POST /v1/chat/completions (plain JSON or SSE
+  stream, with `usage` and `stream_options.include_usage`)
+- Ollama: POST /api/chat (plain JSON or NDJSON stream), GET /api/tags
+
+Answers come from `CannedResponder`, which recognizes the prompts built in
+`werewolf.agents` and `werewolf.learning_engine` and replies in the format
+each one parses, naming players taken from the prompt itself (targets,
+alive players, players and roles). Answers are a deterministic function of
+the prompt and the seed.
+
+Load shaping:
+- latency:          time to first byte, e.g. "fixed:0.5", "uniform:0.2,1.5",
+                    "normal:0.8,0.3", "lognormal:0.8,0.5" (median, sigma),
+                    "exponential:0.8" (mean)
+- chunk_interval:   delay between streamed chunks
+- disconnect_rate:  fraction of requests cut off mid-body; clients see
+                    "peer closed connection without sending complete
+                    message body"
+- timeout_rate:     fraction of requests that hang for `timeout_seconds`
+                    and then close, to trip client read timeouts
+- rate_limit_rate:  fraction answered with HTTP 429 "Rate limit reached"
+
+`CannedModel` gives the same answers in-process (model_type "canned").
+
+Usage:
+    python -m werewolf.mock_server --port 8765 --latency lognormal:0.8,0.5
+    python run_selfplay.py -m mock_openai --scheduler async -c 200
+
+The `mock_openai` and `mock_ollama` configs point at WEREWOLF_MOCK_URL
+(default http://127.0.0.1:8765). GET /stats returns request counters.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Sampler for a latency spec such as "lognormal:0.8,0.5" (seconds)"""
+    name, _, args = spec.partition(":")
+    try:
+        params = [float(a) for a in args.split(",") if a.strip()]
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec!r}") from None
+    expected = {
+        "fixed": 1,
+        "uniform": 2,
+        "normal": 2,
+        "lognormal": 2,
+        "exponential": 1,
+    }.get(name)
+    if expected is None:
+        raise ValueError(
+            f"Unknown latency distribution {name!r}, "
+            f"expected one of {', '.join(LATENCY_DISTRIBUTIONS)}"
+        )
+    if len(params) != expected:
+        raise ValueError(f"{name} latency takes {expected} parameter(s): {spec!r}")
+
+    if name == "fixed":
+        return lambda rng: params[0]
+    if name == "uniform":
+        return lambda rng: rng.uniform(params[0], params[1])
+    if name == "normal":
+        return lambda rng: max(0.0, rng.gauss(params[0], params[1]))
+    if name == "lognormal":
+        mu = math.log(params[0]) if params[0] > 0 else 0.0
+        return lambda rng: rng.lognormvariate(mu, params[1])
+    return lambda rng: rng.expovariate(1.0 / params[0]) if params[0] > 0 else 0.0
+
+
+def estimate_token_count(text: str) -> int:
+    """About 4 characters per token, like `rate_limiter.estimate_tokens`"""
+    return len(text) // 4 + 1
+
+
+def _message_text(content: Any) -> str:
+    if isinstance(content, list):
+        return " ".join(
+            block.get("text", "") if isinstance(block, dict) else str(block)
+            for block in content
+        )
+    return str(content or "")
+
+
+def _last_prompt(messages: List[Any]) -> str:
+    """Text of the last message (a dict, or a Msg-like object)"""
+    if not messages:
+        return ""
+    last = messages[-1]
+    if isinstance(last, dict):
+        return _message_text(last.get("content"))
+    return _message_text(getattr(last, "content", ""))
+
+
+def _names(text: str) -> List[str]:
+    return [n.strip() for n in text.split(",") if n.strip()]
+
+
+class CannedResponder:
+    """Role-aware answers to the game's prompts
+
+    Each answer uses the format the matching agent method parses (a bare
+    name, "VOTE: name", YES/NO, "POISON: name"/PASS, review and critic JSON)
+    and only names players that appear in the prompt.
+
+    Args:
+        seed: Mixed into every answer's random choices
+        save_rate: Probability that the witch uses the antidote
+        poison_rate: Probability that the witch poisons someone
+    """
+
+    def __init__(self, seed: int = 0, save_rate: float = 0.5, poison_rate: float = 0.2):
+        self.seed = seed
+        self.save_rate = save_rate
+        self.poison_rate = poison_rate
+
+    @staticmethod
+    def _list_after(prompt: str, *labels: str) -> List[str]:
+        """Comma-separated names on the line after `<label>:` (or on the next
+        line, as in the orchestrator's "Alive Players (6):" context block)"""
+        for label in labels:
+            match = re.search(
+                rf"^{re.escape(label)}(?: \(\d+\))?:[ \t]*(.*)$", prompt, re.M
+            )
+            if not match:
+                continue
+            names = _names(match.group(1))
+            if not names:
+                rest = prompt[match.end() :].lstrip("\n").split("\n", 1)[0]
+                names = _names(rest)
+            if names:
+                return names
+        return []
+
+    def kind(self, prompt: str) -> str:
+        """Which game prompt this is (the metrics call site it comes from)"""
+        if "Werewolf-game analyst" in prompt:
+            return "review"
+        if "strategy critic" in prompt:
+            return "critic"
+        if "Witch's Decision (Antidote)" in prompt:
+            return "witch_save"
+        if "Witch's Decision (Poison)" in prompt:
+            return "witch_poison"
+        if prompt.startswith("Night Phase"):
+            return "night_action"
+        if "You are the HUNTER and you are dying" in prompt:
+            return "hunter_shot"
+        if "You are about to die" in prompt:
+            return "last_words"
+        if "VOTE: [player_name]" in prompt:
+            return "vote"
+        return "discuss"
+
+    def respond(self, messages: List[Dict[str, Any]]) -> str:
+        """Answer the last message of a chat request"""
+        prompt = _last_prompt(messages)
+        rng = random.Random(f"{self.seed}:{prompt}")
+        kind = self.kind(prompt)
+        alive = self._list_after(prompt, "Alive Players", "Alive players")
+
+        if kind == "review":
+            return self._review(prompt, rng)
+        if kind == "critic":
+            return self._critic(prompt)
+        if kind == "witch_save":
+            return "YES" if rng.random() < self.save_rate else "NO"
+        if kind == "witch_poison":
+            targets = self._list_after(prompt, "Possible targets")
+            if targets and rng.random() < self.poison_rate:
+                return f"POISON: {rng.choice(targets)}"
+            return "PASS"
+        if kind == "night_action":
+            targets = self._list_after(prompt, "Possible targets", "Available targets")
+            return rng.choice(targets) if targets else "PASS"
+        if kind == "hunter_shot":
+            return rng.choice(alive) if alive else "PASS"
+        if kind == "vote":
+            target = rng.choice(alive) if alive else "nobody"
+            return f"VOTE: {target}\nReasoning: {target} has been the least consistent."
+        if kind == "last_words":
+            suspect = rng.choice(alive) if alive else "someone"
+            return f"Keep an eye on {suspect}. Their story never added up."
+        suspect = rng.choice(alive) if alive else "someone"
+        return rng.choice(
+            [
+                f"I think {suspect} has been too quiet, that worries me.",
+                f"Something about {suspect}'s reasoning feels off to me.",
+                f"I'd like to hear {suspect} explain their vote from yesterday.",
+                f"I'm not sure yet, but {suspect} seems to be steering us.",
+            ]
+        )
+
+    def _review(self, prompt: str, rng: random.Random) -> str:
+        match = re.search(r"^Players and roles: (.*)$", prompt, re.M)
+        players = re.findall(r"(\w+)\((\w+)\)", match.group(1)) if match else []
+        roles = sorted({role.capitalize() for _, role in players}) or ["Villager"]
+        return json.dumps(
+            {
+                "per_player": {
+                    name: f"Played the {role} role {rng.choice(['well', 'poorly'])}."
+                    for name, role in players
+                },
+                "overall": "The winning side coordinated its votes better.",
+                "lessons": {
+                    role: [
+                        f"{role}: compare claims against voting records",
+                        f"{role}: speak early with one concrete suspicion",
+                    ]
+                    for role in roles
+                },
+            }
+        )
+
+    def _critic(self, prompt: str) -> str:
+        match = re.search(r"Input lessons:\n(.*?)\n\nCRITICAL", prompt, re.S)
+        try:
+            lessons = json.loads(match.group(1)) if match else {}
+        except ValueError:
+            lessons = {}
+        return json.dumps({role: rules[:10] for role, rules in lessons.items()})
+
+
+class CannedModel:
+    """In-process model answering with `CannedResponder`, without HTTP
+
+    Built by `model_pool.build_model` for configs with
+    `"model_type": "canned"`; used by benchmarks that should measure the
+    game rather than a network stack. Returns AgentScope-style responses
+    (text blocks plus `usage`). `cpu_time` accumulates the thread CPU time
+    spent producing answers.
+
+    Args:
+        seed: Seed of the responder and of the latency draws
+        latency: Simulated response time (see `parse_latency`)
+    """
+
+    def __init__(self, seed: int = 0, latency: str = "fixed:0"):
+        self.responder = CannedResponder(seed)
+        self.latency = parse_latency(latency)
+        self.calls = 0
+        self.cpu_time = 0.0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    async def __call__(self, messages: List[Any], **kwargs) -> Any:
+        started = time.thread_time()
+        prompt = _last_prompt(messages)
+        text = self.responder.respond(messages)
+        with self._lock:
+            self.calls += 1
+            delay = self.latency(self._rng)
+            self.cpu_time += time.thread_time() - started
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return SimpleNamespace(
+            content=[{"type": "text", "text": text}],
+            usage=SimpleNamespace(
+                input_tokens=estimate_token_count(prompt),
+                output_tokens=estimate_token_count(text),
+            ),
+        )
+
+
+class MockModelServer:
+    """Threaded HTTP server speaking the OpenAI and Ollama chat protocols
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 = any free port; see `url`)
+        responder: Produces the answer text (default `CannedResponder`)
+        latency: Time-to-first-byte distribution (see `parse_latency`)
+        chunk_interval: Seconds between streamed chunks
+        disconnect_rate: Fraction of requests cut off mid-body
+        timeout_rate: Fraction of requests that hang for `timeout_seconds`
+        timeout_seconds: How long a hanging request stalls before closing
+        rate_limit_rate: Fraction of requests rejected with HTTP 429
+        seed: Seed of the latency and error injection draws
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        responder: Optional[CannedResponder] = None,
+        latency: str = "fixed:0",
+        chunk_interval: float = 0.0,
+        disconnect_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        timeout_seconds: float = 30.0,
+        rate_limit_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.responder = responder or CannedResponder(seed)
+        self.latency = parse_latency(latency)
+        self.chunk_interval = chunk_interval
+        self.disconnect_rate = disconnect_rate
+        self.timeout_rate = timeout_rate
+        self.timeout_seconds = timeout_seconds
+        self.rate_limit_rate = rate_limit_rate
+        self.stats: Dict[str, Any] = {
+            "requests": 0,
+            "streamed": 0,
+            "disconnects": 0,
+            "timeouts": 0,
+            "rate_limited": 0,
+            "by_kind": {},
+        }
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(_MockHandler):
+            mock = server
+
+        return Handler
+
+    def draw(self) -> Dict[str, Any]:
+        """Latency and injected fault of the next request (thread-safe)"""
+        with self._lock:
+            roll = self._rng.random()
+            latency = self.latency(self._rng)
+        fault = None
+        for name, rate in (
+            ("rate_limited", self.rate_limit_rate),
+            ("timeouts", self.timeout_rate),
+            ("disconnects", self.disconnect_rate),
+        ):
+            if roll < rate:
+                fault = name
+                break
+            roll -= rate
+        return {"latency": latency, "fault": fault}
+
+    def count(self, key: str, kind: Optional[str] = None):
+        with self._lock:
+            self.stats[key] += 1
+            if kind:
+                by_kind = self.stats["by_kind"]
+                by_kind[kind] = by_kind.get(kind, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, "by_kind": dict(self.stats["by_kind"])}
+
+    def start(self) -> "MockModelServer":
+        """Serve from a daemon thread"""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="werewolf-mock-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "MockModelServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so pooled HTTP clients reuse connections as with a real API
+    protocol_version = "HTTP/1.1"
+    mock: MockModelServer
+
+    def log_message(self, format, *args):
+        pass
+
+    # --- responses -----------------------------------------------------------
+
+    def _send_json(self, status: int, body: Dict[str, Any]):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, content_type: str, parts: Iterator[bytes], cut: bool):
+        """Chunked response; with `cut`, drop the connection after one chunk"""
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i, part in enumerate(parts):
+            if i and self.mock.chunk_interval:
+                time.sleep(self.mock.chunk_interval)
+            self.wfile.write(f"{len(part):x}\r\n".encode() + part + b"\r\n")
+            self.wfile.flush()
+            if cut:
+                self.close_connection = True
+                return
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _cut_json(self, body: Dict[str, Any]):
+        """Announce the full body, send half of it and drop the connection"""
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data[: len(data) // 2])
+        self.wfile.flush()
+        self.close_connection = True
+
+    # --- routing -------------------------------------------------------------
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self._send_json(200, self.mock.snapshot())
+        elif self.path == "/api/tags":
+            self._send_json(200, {"models": [{"name": "mock", "model": "mock"}]})
+        elif self.path.rstrip("/") in ("/v1/models", "/models"):
+            self._send_json(
+                200, {"object": "list", "data": [{"id": "mock", "object": "model"}]}
+            )
+        else:
+            self._send_json(404, {"error": {"message": f"No route {self.path}"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "Invalid JSON body"}})
+            return
+
+        path = self.path.rstrip("/")
+        if path.endswith("/chat/completions"):
+            protocol = "openai"
+        elif path == "/api/chat":
+            protocol = "ollama"
+        else:
+            self._send_json(404, {"error": {"message": f"No route {self.path}"}})
+            return
+
+        messages = request.get("messages") or []
+        prompt = _last_prompt(messages)
+        kind = self.mock.responder.kind(prompt)
+        self.mock.count("requests", kind)
+        draw = self.mock.draw()
+        time.sleep(draw["latency"])
+
+        fault = draw["fault"]
+        if fault:
+            self.mock.count(fault)
+        if fault == "rate_limited":
+            self._send_json(
+                429,
+                {
+                    "error": {
+                        "message": "Rate limit reached for requests",
+                        "type": "rate_limit_error",
+                    }
+                },
+            )
+            return
+        if fault == "timeouts":
+            time.sleep(self.mock.timeout_seconds)
+            self.close_connection = True
+            return
+
+        text = self.mock.responder.respond(messages)
+        # Ollama streams unless told otherwise; OpenAI only when asked
+        stream = request.get("stream", protocol == "ollama")
+        if stream:
+            self.mock.count("streamed")
+        cut = fault == "disconnects"
+        model = request.get("model", "mock")
+        if protocol == "openai":
+            self._openai(request, model, prompt, text, stream, cut)
+        else:
+            self._ollama(model, prompt, text, stream, cut)
+
+    # --- protocols -----------------------------------------------------------
+
+    @staticmethod
+    def _pieces(text: str, words: int = 4) -> List[str]:
+        tokens = re.split(r"(?<=\s)", text)
+        return [
+            "".join(tokens[i : i + words]) for i in range(0, len(tokens), words)
+        ] or [""]
+
+    def _openai(self, request, model, prompt, text, stream: bool, cut: bool):
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        usage = {
+            "prompt_tokens": estimate_token_count(prompt),
+            "completion_tokens": estimate_token_count(text),
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+
+        if not stream:
+            body = {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": usage,
+            }
+            if cut:
+                self._cut_json(body)
+            else:
+                self._send_json(200, body)
+            return
+
+        include_usage = (request.get("stream_options") or {}).get("include_usage")
+
+        def chunk(delta, finish_reason=None, **extra) -> bytes:
+            data = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+                **extra,
+            }
+            return f"data: {json.dumps(data)}\n\n".encode("utf-8")
+
+        def events() -> Iterator[bytes]:
+            yield chunk({"role": "assistant", "content": ""})
+            for piece in self._pieces(text):
+                yield chunk({"content": piece})
+            yield chunk({}, "stop")
+            if include_usage:
+                data = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [],
+                    "usage": usage,
+                }
+                yield f"data: {json.dumps(data)}\n\n".encode("utf-8")
+            yield b"data: [DONE]\n\n"
+
+        self._send_stream("text/event-stream", events(), cut)
+
+    def _ollama(self, model, prompt, text, stream: bool, cut: bool):
+        created_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        final = {
+            "model": model,
+            "created_at": created_at,
+            "done": True,
+            "done_reason": "stop",
+            "prompt_eval_count": estimate_token_count(prompt),
+            "eval_count": estimate_token_count(text),
+        }
+        if not stream:
+            body = {**final, "message": {"role": "assistant", "content": text}}
+            if cut:
+                self._cut_json(body)
+            else:
+                self._send_json(200, body)
+            return
+
+        def lines() -> Iterator[bytes]:
+            for piece in self._pieces(text):
+                data = {
+                    "model": model,
+                    "created_at": created_at,
+                    "message": {"role": "assistant", "content": piece},
+                    "done": False,
+                }
+                yield (json.dumps(data) + "\n").encode("utf-8")
+            final_line = {**final, "message": {"role": "assistant", "content": ""}}
+            yield (json.dumps(final_line) + "\n").encode("utf-8")
+
+        self._send_stream("application/x-ndjson", lines(), cut)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local OpenAI/Ollama compatible model server for load tests"
+    )
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--latency",
+        type=str,
+        default="lognormal:0.8,0.5",
+        help="Time to first byte, e.g. fixed:0.5, uniform:0.2,1.5, normal:0.8,0.3, "
+        "lognormal:0.8,0.5 (median,sigma), exponential:0.8 (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--chunk-interval",
+        type=float,
+        default=0.02,
+        help="Seconds between streamed chunks (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--disconnect-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of responses cut off mid-body",
+    )
+    parser.add_argument(
+        "--timeout-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests that hang for --timeout-seconds",
+    )
+    parser.add_argument("--timeout-seconds", type=float, default=30.0)
+    parser.add_argument(
+        "--rate-limit-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests rejected with HTTP 429",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockModelServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        chunk_interval=args.chunk_interval,
+        disconnect_rate=args.disconnect_rate,
+        timeout_rate=args.timeout_rate,
+        timeout_seconds=args.timeout_seconds,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    print(f"Mock model server listening on {server.url}")
+    print(f"  OpenAI base_url: {server.url}/v1   Ollama host: {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nStats: {json.dumps(server.snapshot())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Process-wide model client pool
+
+Every agent used to build its own AgentScope model (and with it its own HTTP
+client and connection pool). Models are now created once per
+`config_name` and shared by all agents and games in the process.
+
+HTTP clients used by the async models are bound to the event loop they first
+run on, so the pool keeps one model per config *per event loop*. Synchronous
+callers all go through a single background loop (see `get_background_loop`),
+which means they share a single client per config as well.
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any, Dict, Optional
+
+
+def _model_class(class_name: str):
+    """AgentScope model class by name, or None without AgentScope
+
+    Imported on first use: loading AgentScope (and the provider SDKs it
+    pulls in) takes far longer than the rest of the package, and processes
+    that never build a model should not pay for it.
+    """
+    try:
+        from agentscope import model as agentscope_model  # type: ignore
+    except Exception:  # pragma: no cover
+        return None
+    return getattr(agentscope_model, class_name, None)
+
+
+def _null_model(msg):
+    """Stub model used when no usable configuration is available"""
+    return type("obj", (object,), {"content": ""})()
+
+
+def find_model_config(config_name: str) -> Optional[Dict[str, Any]]:
+    """Look up a model configuration by name in `werewolf.config.MODEL_CONFIGS`"""
+    from werewolf.config import MODEL_CONFIGS
+
+    return next((c for c in MODEL_CONFIGS if c["config_name"] == config_name), None)
+
+
+def build_model(config_name: str):
+    """Create a new model instance for `config_name` (not pooled)"""
+    model_config = find_model_config(config_name)
+    if not model_config:
+        # No config found - create stub
+        return _null_model
+
+    model_type = model_config.get("model_type", "openai_chat")
+
+    # Prepare parameters for different model types
+    if model_type == "openai_chat":
+        # OpenAI-compatible models (OpenAI, DeepSeek, ModelScope)
+        class_name, label = "OpenAIChatModel", "OpenAI"
+        params = {
+            "model_name": model_config["model_name"],
+            "api_key": model_config.get("api_key"),
+            "organization": model_config.get("organization"),
+            "generate_kwargs": model_config.get("generate_args", {}),
+        }
+        # base_url goes into client_args for OpenAI models
+        if "base_url" in model_config:
+            params["client_args"] = {"base_url": model_config["base_url"]}
+    elif model_type == "dashscope_chat":
+        class_name, label = "DashScopeChatModel", "DashScope"
+        params = {
+            "model_name": model_config["model_name"],
+            "api_key": model_config.get("api_key"),
+            "generate_kwargs": model_config.get("generate_args", {}),
+        }
+    elif model_type == "ollama_chat":
+        class_name, label = "OllamaChatModel", "Ollama"
+        params = {
+            "model_name": model_config["model_name"],
+            "host": model_config.get("host", "http://localhost:11434"),
+            "generate_kwargs": model_config.get("generate_args", {}),
+        }
+    elif model_type == "canned":
+        # In-process scripted answers for offline runs and benchmarks
+        from .mock_server import CannedModel
+
+        return CannedModel(
+            seed=model_config.get("seed", 0),
+            latency=model_config.get("latency", "fixed:0"),
+        )
+    else:
+        # Fallback
+        return _null_model
+
+    try:
+        model_class = _model_class(class_name)
+        if model_class is None:
+            raise ImportError(f"agentscope.model.{class_name} is not available")
+        return model_class(**{k: v for k, v in params.items() if v is not None})
+    except Exception as e:
+        print(f"Warning: Failed to initialize {label} model: {e}")
+        return _null_model
+
+
+# Background event loop shared by all synchronous model calls
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_pid: Optional[int] = None
+_background_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop used for synchronous model calls
+
+    The loop runs forever in a daemon thread. It is recreated after a fork,
+    since the thread driving it does not survive into the child process.
+    """
+    global _background_loop, _background_pid
+    with _background_lock:
+        if _background_loop is None or _background_pid != os.getpid():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="werewolf-model-loop", daemon=True
+            )
+            thread.start()
+            _background_loop = loop
+            _background_pid = os.getpid()
+        return _background_loop
+
+
+# config_name -> {event loop -> model}
+_pool: Dict[str, "weakref.WeakKeyDictionary"] = {}
+_pool_lock = threading.Lock()
+
+
+def get_model(config_name: str, loop: Optional[asyncio.AbstractEventLoop] = None):
+    """Return the pooled model for `config_name` on `loop`
+
+    A model that could not be built (`_null_model`) is returned but not
+    pooled, so the next call tries again.
+
+    Args:
+        config_name: Model configuration name from `MODEL_CONFIGS`
+        loop: Event loop the model will run on. Defaults to the running loop,
+            or the background loop when called outside of one.
+    """
+    if loop is None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = get_background_loop()
+
+    with _pool_lock:
+        per_loop = _pool.setdefault(config_name, weakref.WeakKeyDictionary())
+        model = per_loop.get(loop)
+        if model is None:
+            model = build_model(config_name)
+            # The stub stands in for a failed or missing config; keep trying
+            # to build the real model on later calls instead of pinning it
+            if model is not _null_model:
+                per_loop[loop] = model
+        return model
+
+
+def clear_model_pool():
+    """Drop all pooled models (e.g. after changing MODEL_CONFIGS)"""
+    with _pool_lock:
+        _pool.clear()
+
+
+class SharedModel:
+    """Callable handle to the pooled model for a config
+
+    Agents hold one of these instead of a model instance; each call is routed
+    to the pooled model for the event loop it runs on.
+    """
+
+    def __init__(self, config_name: str):
+        self.config_name = config_name
+
+    def __call__(self, *args, **kwargs):
+        return get_model(self.config_name)(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        if name == "config_name":
+            raise AttributeError(name)
+        return getattr(get_model(self.config_name), name)
+
+    def __repr__(self) -> str:
+        return f"SharedModel({self.config_name!r})"
@@ -3,15 +3,62 @@ Multi-Agent Werewolf Game Orchestrator
 Integrates WerewolfGame logic with AgentScope intelligent agents
 """
 
+import asyncio
+import datetime
+import json
 import logging
-from typing import Dict, List, Any, Optional
-
-from agentscope.message import Msg
-
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Dict, List, Any, Optional, Union
+
+from .config import TRANSCRIPT_CONFIG
+from .events import EventLog
+from .metrics import ModelCallMetrics
+from .model_pool import get_background_loop
+from .profiling import PhaseProfiler
+from .transcript import TranscriptWriter
 from .werewolf_game import WerewolfGame, Role, GamePhase
-from .agents import create_agent, WerewolfAgentBase, WerewolfAgent
+from .agents import create_agent, Msg, WerewolfAgentBase, WerewolfAgent
 from .learning_engine import StrategyManager, run_learning_pipeline
 
+# Bumped whenever the checkpoint layout changes
+CHECKPOINT_VERSION = 1
+
+# Threads reviewing finished games. The learning pipeline blocks on model
+# calls for many seconds, so it gets its own pool instead of the loop's
+# default executor, which serves the short file I/O hops of every game.
+LEARNING_WORKERS = int(os.getenv("WEREWOLF_LEARNING_WORKERS", "4"))
+
+_learning_executor: Optional[ThreadPoolExecutor] = None
+_learning_pid: Optional[int] = None
+_learning_lock = threading.Lock()
+
+
+def get_learning_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor for end-of-game learning
+
+    Recreated after a fork, since its threads do not survive into the child.
+    """
+    global _learning_executor, _learning_pid
+    with _learning_lock:
+        if _learning_executor is None or _learning_pid != os.getpid():
+            _learning_executor = ThreadPoolExecutor(
+                max_workers=max(1, LEARNING_WORKERS),
+                thread_name_prefix="werewolf-learning",
+            )
+            _learning_pid = os.getpid()
+        return _learning_executor
+
+
+def _truncate(path: str, size: int):
+    """Cut `path` back to `size` bytes (no-op if it is missing)"""
+    if os.path.exists(path):
+        with open(path, "r+b") as f:
+            f.truncate(size)
+
 
 class WerewolfGameOrchestrator:
     """
@@ -28,6 +75,13 @@ class WerewolfGameOrchestrator:
         discussion_rounds: int = 1,  # Fixed to 1 discussion round
         verbose: bool = True,
         log_file: str = None,
+        max_concurrency: int = 8,
+        concurrent_voting: bool = True,
+        transcript_config: Optional[Dict[str, Any]] = None,
+        write_events: bool = True,
+        checkpoint: bool = True,
+        write_metrics: bool = True,
+        flame_summary: bool = False,
     ):
         """
         Initialize the game orchestrator
@@ -40,27 +94,39 @@ class WerewolfGameOrchestrator:
             discussion_rounds: Number of discussion rounds per day (FIXED to 1)
             verbose: Whether to print game progress
             log_file: Path to log file for real-time writing
+            max_concurrency: Maximum number of agent calls in flight at once
+                (1 = fully sequential)
+            concurrent_voting: Whether to issue all day votes at once
+            transcript_config: Overrides for `TRANSCRIPT_CONFIG` (flush_lines,
+                flush_interval, flush_on_phase, fsync)
+            write_events: Whether to also write a JSONL event stream next to
+                the transcript (see `werewolf.events`)
+            checkpoint: Whether to save a resumable checkpoint after every
+                phase (see `resume_from`)
+            write_metrics: Whether to write per-call model metrics to a JSONL
+                file next to the transcript (see `werewolf.metrics`); the
+                aggregates are in `get_game_summary()` either way
+            flame_summary: Whether to print a text flame chart of the phase
+                timing profile and write `<transcript name>.profile.folded`
+                (flamegraph.pl input) when the game ends; the profile itself
+                is always in `get_game_summary()["profile"]`
         """
+        self._configure(
+            model_config_name,
+            game_type,
+            max_rounds,
+            verbose,
+            max_concurrency,
+            concurrent_voting,
+            checkpoint,
+            flame_summary,
+        )
         self.game = WerewolfGame(player_names, game_type)
-        self.model_config_name = model_config_name
-        self.max_rounds = max_rounds
-        self.discussion_rounds = 1  # Always 1, ignore parameter
-        self.verbose = verbose
-
-        # Setup logging (must be before _create_agents which uses _log)
-        self.logger = logging.getLogger(__name__)
-        if verbose:
-            self.logger.setLevel(logging.INFO)
 
         # Game state
         self.current_round = 0
         self.discussion_history: List[Msg] = []
 
-        # Real-time log file
-        import datetime
-        import os
-        import uuid
-
         # Determine log file path
         if log_file is None:
             # Create logs directory if using default path
@@ -73,7 +139,7 @@ class WerewolfGameOrchestrator:
             log_file = os.path.join(
                 log_dir, f"werewolf_game_{timestamp}_{unique_id}.txt"
             )
-        self.log_file = log_file
+        self._open_logs(log_file, transcript_config, write_events, write_metrics)
 
         # Game record for saving complete transcript (must be before _create_agents)
         self.game_record: List[str] = []
@@ -92,6 +158,173 @@ class WerewolfGameOrchestrator:
         self.agents: Dict[str, WerewolfAgentBase] = {}
         self._create_agents()
 
+    def _configure(
+        self,
+        model_config_name: str,
+        game_type: str,
+        max_rounds: int,
+        verbose: bool,
+        max_concurrency: int,
+        concurrent_voting: bool,
+        checkpoint: bool,
+        flame_summary: bool = False,
+    ):
+        """Set run options shared by `__init__` and `resume_from`"""
+        self.game_type = game_type
+        self.model_config_name = model_config_name
+        self.max_rounds = max_rounds
+        self.discussion_rounds = 1  # Always 1, ignore parameter
+        self.verbose = verbose
+        self.max_concurrency = max(1, max_concurrency)
+        self.concurrent_voting = concurrent_voting
+        self.checkpoint = checkpoint
+        self.flame_summary = flame_summary
+        # Phase already played in the current round when resuming
+        self._resume_after: Optional[str] = None
+        # Claimed checkpoint file the game was resumed from, if it is not
+        # `checkpoint_file`; removed once a newer checkpoint supersedes it
+        self._resumed_from: Optional[str] = None
+
+        # Setup logging (must be before _create_agents which uses _log)
+        self.logger = logging.getLogger(__name__)
+        if verbose:
+            self.logger.setLevel(logging.INFO)
+
+    def _open_logs(
+        self,
+        log_file: str,
+        transcript_config: Optional[Dict[str, Any]],
+        write_events: bool,
+        write_metrics: bool,
+        append: bool = False,
+        events_seq: int = 0,
+    ):
+        """Create the transcript writer, event log, metrics and checkpoint path"""
+        self.log_file = log_file
+        flush_policy = {**TRANSCRIPT_CONFIG, **(transcript_config or {})}
+        self.transcript = TranscriptWriter(log_file, **flush_policy)
+
+        # Machine-readable event stream: <transcript name>.events.jsonl
+        self.events_file: Optional[str] = None
+        self.events: Optional[EventLog] = None
+        self._phase = "setup"
+        if write_events:
+            self.events_file = os.path.splitext(log_file)[0] + ".events.jsonl"
+            self.events = EventLog(
+                self.events_file, seq=events_seq, append=append, **flush_policy
+            )
+
+        # Model call metrics: <transcript name>.metrics.jsonl
+        self.metrics_file: Optional[str] = None
+        if write_metrics:
+            self.metrics_file = os.path.splitext(log_file)[0] + ".metrics.jsonl"
+        self.metrics = ModelCallMetrics(
+            self.metrics_file, append=append, **flush_policy
+        )
+        # Timing of phases and sub-phases (covers this process only on resume)
+        self.profiler = PhaseProfiler(self.metrics)
+
+        # Resumable state after each phase: <transcript name>.checkpoint.json
+        self.checkpoint_file = os.path.splitext(log_file)[0] + ".checkpoint.json"
+
+    @classmethod
+    def resume_from(
+        cls,
+        checkpoint: Union[str, Dict[str, Any]],
+        verbose: bool = True,
+        max_concurrency: int = 8,
+        concurrent_voting: bool = True,
+        transcript_config: Optional[Dict[str, Any]] = None,
+        flame_summary: bool = False,
+    ) -> "WerewolfGameOrchestrator":
+        """Rebuild an interrupted game from its last phase checkpoint
+
+        The transcript and event log are cut back to where they stood when
+        the checkpoint was written, dropping the partial output of the
+        interrupted phase, and appended to from there. Call `run_game` or
+        `arun_game` to continue with the next phase.
+
+        Args:
+            checkpoint: Checkpoint file path or loaded checkpoint dict
+            verbose: Whether to print game progress
+            max_concurrency: Maximum number of agent calls in flight at once
+            concurrent_voting: Whether to issue all day votes at once
+            transcript_config: Overrides for `TRANSCRIPT_CONFIG`
+            flame_summary: Print and save the phase profile at game end
+        """
+        checkpoint_path = None
+        if isinstance(checkpoint, str):
+            checkpoint_path = checkpoint
+            with open(checkpoint, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported checkpoint version: {checkpoint.get('version')}"
+            )
+
+        self = cls.__new__(cls)
+        self._configure(
+            checkpoint["model_config_name"],
+            checkpoint["game_type"],
+            checkpoint["max_rounds"],
+            verbose,
+            max_concurrency,
+            concurrent_voting,
+            True,
+            flame_summary,
+        )
+        self.game = WerewolfGame.from_checkpoint(checkpoint["game"])
+        self.current_round = checkpoint["current_round"]
+        self._resume_after = checkpoint["completed_phase"]
+        self.discussion_history = [
+            Msg(name=m["name"], content=m["content"], role=m["role"])
+            for m in checkpoint["discussion_history"]
+        ]
+
+        # Drop whatever the interrupted phase wrote after the checkpoint
+        log_file = checkpoint["log_file"]
+        _truncate(log_file, checkpoint["log_bytes"])
+        events_file = checkpoint.get("events_file")
+        if events_file:
+            _truncate(events_file, checkpoint["events_bytes"])
+        metrics_file = checkpoint.get("metrics_file")
+        if metrics_file:
+            _truncate(metrics_file, checkpoint["metrics_bytes"])
+        self._open_logs(
+            log_file,
+            transcript_config,
+            bool(events_file),
+            bool(metrics_file),
+            append=True,
+            events_seq=checkpoint.get("events_seq", 0),
+        )
+        if checkpoint_path and os.path.abspath(checkpoint_path) != os.path.abspath(
+            self.checkpoint_file
+        ):
+            self._resumed_from = checkpoint_path
+        self._phase = self._resume_after
+        self.metrics.set_position(self.current_round, self._phase)
+        with open(log_file, "r", encoding="utf-8") as f:
+            self.game_record = f.read().splitlines()
+
+        self.agents: Dict[str, WerewolfAgentBase] = {}
+        for name, state in checkpoint["agents"].items():
+            agent = create_agent(
+                name,
+                self.game.state.roles[name],
+                self.model_config_name,
+                strategy_rules=state.get("strategy_rules"),
+            )
+            agent.load_state(state)
+            agent.metrics = self.metrics
+            self.agents[name] = agent
+
+        self._log(
+            f"\n[RESUMED] Continuing round {self.current_round} "
+            f"after the {self._resume_after} phase"
+        )
+        return self
+
     def _create_agents(self):
         """Create AI agents for each player"""
         strategy_manager = StrategyManager()
@@ -102,6 +335,7 @@ class WerewolfGameOrchestrator:
             agent = create_agent(
                 player_name, role, self.model_config_name, strategy_rules=rules
             )
+            agent.metrics = self.metrics
             self.agents[player_name] = agent
 
         # Share werewolf team information
@@ -115,6 +349,13 @@ class WerewolfGameOrchestrator:
                 {w: Role.WEREWOLF for w in werewolves}
             )
 
+        self._emit(
+            "game_start",
+            game_type=self.game_type,
+            players=list(self.game.player_names),
+            roles={p: r.value for p, r in self.game.state.roles.items()},
+        )
+
         self._log(f"Created {len(self.agents)} agents")
         self._log(f"Werewolf team: {', '.join(werewolves)}")
 
@@ -128,117 +369,319 @@ class WerewolfGameOrchestrator:
         """
         Run the complete game until win condition
         Returns: Winner ('werewolves' or 'villagers')
+
+        Blocking entry point: `arun_game` runs on the process-wide background
+        event loop, so synchronous callers share its pooled model clients.
         """
-        self._log("=" * 60)
-        self._log("WEREWOLF GAME STARTING")
-        self._log("=" * 60)
+        future = asyncio.run_coroutine_threadsafe(
+            self.arun_game(), get_background_loop()
+        )
+        try:
+            return future.result()
+        except BaseException:
+            # e.g. Ctrl-C: do not leave the game running on the loop
+            future.cancel()
+            raise
 
-        while self.current_round < self.max_rounds:
-            self.current_round += 1
-            self._log(f"\n{'='*60}")
-            self._log(f"ROUND {self.current_round}")
-            self._log(f"{'='*60}")
+    async def arun_game(self) -> str:
+        """
+        Run the complete game on the running event loop
 
-            # Night phase
-            self._log("\n[NIGHT PHASE]")
-            self._run_night_phase()
+        All agent calls are awaited, so many games can share one loop.
+        Returns: Winner ('werewolves' or 'villagers')
+        """
+        try:
+            if self._resume_after is None:
+                self._log("=" * 60)
+                self._log("WEREWOLF GAME STARTING")
+                self._log("=" * 60)
+
+            while self.current_round < self.max_rounds:
+                # A game resumed after its night phase continues with the day
+                resuming_day = self._resume_after == "night"
+                self._resume_after = None
+                if not resuming_day:
+                    self.current_round += 1
+                    self._log(f"\n{'='*60}")
+                    self._log(f"ROUND {self.current_round}")
+                    self._log(f"{'='*60}")
+
+                    # Night phase
+                    self._begin_phase("night")
+                    await self._arun_night_phase()
+                    # Flushing the logs and writing the checkpoint is file
+                    # I/O; keep it off the loop like the learning pipeline
+                    winner = await asyncio.to_thread(self._end_phase, "night")
+                    if winner:
+                        await self._alog_game_end(winner)
+                        return winner
+
+                # Day phase
+                self._begin_phase("day")
+                await self._arun_day_phase()
+                winner = await asyncio.to_thread(self._end_phase, "day")
+                if winner:
+                    await self._alog_game_end(winner)
+                    return winner
+
+            self._log("\n[TIME UP] Maximum rounds reached - Game ended in draw")
+            self._emit_game_end("draw")
+            return "draw"
+        finally:
+            # Buffered transcript lines reach the file even if the game fails
+            self.transcript.close()
+            if self.events:
+                self.events.close()
+            self.metrics.close()
+            if self.flame_summary:
+                self._write_profile()
+
+    async def _agather(self, coros: List[Awaitable[Any]]) -> List[Any]:
+        """Await agent coroutines with at most `max_concurrency` in flight
+
+        Results are returned in input order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-            # Check game end
-            ended, winner = self.game.check_game_end()
-            if ended:
-                self._log_game_end(winner)
-                return winner
+        async def limited(coro):
+            async with semaphore:
+                return await coro
 
-            # Day phase
-            self._log("\n[DAY PHASE]")
-            self._run_day_phase()
+        return list(await asyncio.gather(*(limited(c) for c in coros)))
 
-            # Check game end
+    def _emit(self, event_type: str, **data: Any):
+        """Append an event to the JSONL stream (if enabled)"""
+        if self.events:
+            started = time.perf_counter()
+            self.events.emit(event_type, self.current_round, self._phase, **data)
+            self.profiler.add("io", time.perf_counter() - started)
+
+    def _begin_phase(self, phase: str):
+        self._phase = phase
+        self.metrics.set_position(self.current_round, phase)
+        self.profiler.set_round(self.current_round)
+        self.profiler.begin(phase)
+        self._log(f"\n[{phase.upper()} PHASE]")
+        self._emit("phase_start", alive=list(self.game.state.alive_players))
+
+    def _end_phase(self, phase: str) -> str:
+        """Close a phase and return the winner
+
+        Returns "" if the game goes on, after saving a checkpoint.
+        """
+        try:
+            self.transcript.phase_boundary()
+            if self.events:
+                self.events.phase_boundary()
+            self.metrics.phase_boundary()
             ended, winner = self.game.check_game_end()
             if ended:
-                self._log_game_end(winner)
                 return winner
+            if self.checkpoint:
+                self._save_checkpoint(phase)
+            return ""
+        finally:
+            self.profiler.end()
+
+    def _save_checkpoint(self, completed_phase: str):
+        """Atomically write everything `resume_from` needs to continue the game"""
+        # Offsets must cover everything logged so far
+        self.transcript.flush()
+        if self.events:
+            self.events.flush()
+        self.metrics.flush()
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "pid": os.getpid(),
+            "game_type": self.game_type,
+            "model_config_name": self.model_config_name,
+            "max_rounds": self.max_rounds,
+            "current_round": self.current_round,
+            "completed_phase": completed_phase,
+            "log_file": self.log_file,
+            "log_bytes": os.path.getsize(self.log_file),
+            "events_file": self.events_file,
+            "events_bytes": (
+                os.path.getsize(self.events_file) if self.events_file else 0
+            ),
+            "events_seq": self.events.seq if self.events else 0,
+            "metrics_file": self.metrics_file,
+            "metrics_bytes": (
+                os.path.getsize(self.metrics_file) if self.metrics_file else 0
+            ),
+            "game": self.game.to_checkpoint(),
+            "agents": {name: a.get_state() for name, a in self.agents.items()},
+            "discussion_history": [
+                {"name": m.name, "content": m.content, "role": m.role}
+                for m in self.discussion_history
+            ],
+        }
+        started = time.perf_counter()
+        tmp_file = self.checkpoint_file + ".tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, default=str)
+            os.replace(tmp_file, self.checkpoint_file)
+            self._drop_resumed_checkpoint()
+        except Exception as e:
+            if self.verbose:
+                print(f"Warning: Failed to write checkpoint: {e}")
+        self.profiler.add("io", time.perf_counter() - started)
+
+    def _clear_checkpoint(self):
+        if os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+        self._drop_resumed_checkpoint()
+
+    def _drop_resumed_checkpoint(self):
+        if self._resumed_from and os.path.exists(self._resumed_from):
+            os.remove(self._resumed_from)
+        self._resumed_from = None
+
+    def _emit_game_end(self, winner: str):
+        # A finished game has nothing left to resume
+        self._clear_checkpoint()
+        self._phase = "end"
+        # Review and critic calls are attributed to the end of the game
+        self.metrics.set_position(self.current_round, "end")
+        self._emit(
+            "game_end",
+            winner=winner,
+            rounds=self.current_round,
+            survivors=list(self.game.state.alive_players),
+        )
+
+    def _emit_action(self, agent: WerewolfAgentBase, action: str, target=None):
+        self._emit(
+            "action",
+            actor=agent.name,
+            role=agent.role.value,
+            action=action,
+            target=target,
+        )
+
+    async def _arun_night_phase(self):
+        """Execute night phase with all night actions in order: Guardian -> Werewolf -> Seer -> Witch
+
+        Guardian, werewolf and seer choices do not depend on each other, so they
+        are collected concurrently. Only the witch waits for the werewolf tally.
+        """
+        context = self._get_game_context()
+
+        # Stage 1: independent actions (guardian, werewolves, seer)
+        with self.profiler.section("guardian+werewolves+seer"):
+            scheduled = self._schedule_night_actions()
+            results = await self._agather(
+                [agent.anight_action(context, *args) for _, agent, args in scheduled]
+            )
+            agent_actions = self._record_night_choices(scheduled, results)
 
-        self._log("\n[TIME UP] Maximum rounds reached - Game ended in draw")
-        return "draw"
+        # Stage 2: witch actions, gated on the werewolf tally
+        with self.profiler.section("witch"):
+            self._log("\n[WITCH] Deciding...")
+            werewolf_target = self._werewolf_consensus(agent_actions)
 
-    def _run_night_phase(self):
-        """Execute night phase with all night actions in order: Guardian -> Werewolf -> Seer -> Witch"""
-        agent_actions: Dict[str, str] = {}
+            for witch in self._alive_agents_with_role(Role.WITCH):
+                victim = werewolf_target
 
-        # 1. Guardian actions (first)
-        self._log("\n[GUARDIAN] Protecting...")
-        guardian_agents = [
-            agent
-            for agent in self.agents.values()
-            if agent.role == Role.GUARDIAN and agent.is_alive
-        ]
+                # Decide on antidote first
+                if victim and not witch.antidote_used:
+                    should_save = await witch.anight_action_save(victim, context)
+                    self._record_witch_save(witch, victim, should_save, agent_actions)
+                else:
+                    self._log_witch_save_skipped(witch, victim)
+
+                # Decide on poison second. One potion per night: the engine
+                # takes a single action per witch, so a save must stand
+                if agent_actions.get(witch.name) == "save":
+                    self._log(f"  {witch.name} already used the antidote tonight")
+                elif not witch.poison_used:
+                    poison_target = await witch.anight_action_poison(
+                        context, self._witch_poison_targets(witch)
+                    )
+                    self._record_witch_poison(witch, poison_target, agent_actions)
+                else:
+                    self._log(f"  {witch.name} poison already used")
 
-        for guardian in guardian_agents:
-            targets = self.game.state.alive_players.copy()
-            context = self._get_game_context()
-            target = guardian.night_action(context, targets)
-            agent_actions[guardian.name] = target
-            self._log(f"  {guardian.name} protects: {target}")
+        with self.profiler.section("resolve"):
+            night_result = self._resolve_night(agent_actions)
 
-        # 2. Werewolf actions (second)
-        self._log("\n[WEREWOLVES] Choosing target...")
-        werewolf_agents = [
+        # Announce results
+        with self.profiler.section("morning"):
+            await self._aannounce_night_results(night_result)
+
+    def _alive_agents_with_role(self, role: Role) -> List[WerewolfAgentBase]:
+        return [
             agent
             for agent in self.agents.values()
-            if agent.role == Role.WEREWOLF and agent.is_alive
+            if agent.role == role and agent.is_alive
         ]
 
-        if werewolf_agents:
-            # Get werewolf targets
-            targets = [
-                p
-                for p in self.game.state.alive_players
-                if self.game.state.roles[p] != Role.WEREWOLF
-            ]
-
-            if targets:
-                context = self._get_game_context()
-                werewolf_names = [w.name for w in werewolf_agents]
+    def _schedule_night_actions(self) -> List[tuple]:
+        """Plan the independent night actions
 
-                # Each werewolf votes
-                for wolf in werewolf_agents:
-                    target = wolf.night_action(context, targets, werewolf_names)
-                    agent_actions[wolf.name] = target
-                    self._log(f"  {wolf.name} targets: {target}")
+        Returns:
+            List of (kind, agent, args) where args follow the context argument
+            of the agent's night action
+        """
+        scheduled: List[tuple] = []
+        for guardian in self._alive_agents_with_role(Role.GUARDIAN):
+            targets = self.game.state.alive_players.copy()
+            scheduled.append(("guardian", guardian, (targets,)))
 
-        # 3. Seer actions (third)
-        self._log("\n[SEER] Checking...")
-        seer_agents = [
-            agent
-            for agent in self.agents.values()
-            if agent.role == Role.SEER and agent.is_alive
+        werewolf_agents = self._alive_agents_with_role(Role.WEREWOLF)
+        wolf_targets = [
+            p
+            for p in self.game.state.alive_players
+            if self.game.state.roles[p] != Role.WEREWOLF
         ]
+        if werewolf_agents and wolf_targets:
+            werewolf_names = [w.name for w in werewolf_agents]
+            for wolf in werewolf_agents:
+                scheduled.append(("werewolf", wolf, (wolf_targets, werewolf_names)))
 
-        seer_checks_to_process = []  # Store for later processing
-        for seer in seer_agents:
+        for seer in self._alive_agents_with_role(Role.SEER):
             targets = [p for p in self.game.state.alive_players if p != seer.name]
             if targets:
-                context = self._get_game_context()
-                target = seer.night_action(context, targets)
-                agent_actions[seer.name] = target
-                seer_checks_to_process.append((seer.name, target))
-                self._log(f"  {seer.name} checks: {target}")
-
-        # 4. Witch actions (collect first, before executing night phase)
-        self._log("\n[WITCH] Deciding...")
-        witch_agents = [
-            agent
-            for agent in self.agents.values()
-            if agent.role == Role.WITCH and agent.is_alive
+                scheduled.append(("seer", seer, (targets,)))
+
+        return scheduled
+
+    def _record_night_choices(
+        self, scheduled: List[tuple], results: List[str]
+    ) -> Dict[str, str]:
+        """Log independent night choices in the canonical order and collect them"""
+        agent_actions: Dict[str, str] = {}
+        chosen = [
+            (kind, agent, target)
+            for (kind, agent, _), target in zip(scheduled, results)
         ]
 
-        # First, temporarily execute to know the werewolf target (but don't commit)
-        # We need to know who the wolves targeted to let witch decide
-        temp_result = {}
-        werewolf_target = None
+        self._log("\n[GUARDIAN] Protecting...")
+        for kind, agent, target in chosen:
+            if kind == "guardian":
+                agent_actions[agent.name] = target
+                self._log(f"  {agent.name} protects: {target}")
+                self._emit_action(agent, "protect", target)
+
+        self._log("\n[WEREWOLVES] Choosing target...")
+        for kind, agent, target in chosen:
+            if kind == "werewolf":
+                agent_actions[agent.name] = target
+                self._log(f"  {agent.name} targets: {target}")
+                self._emit_action(agent, "kill", target)
 
-        # Determine werewolf target from collected actions
+        self._log("\n[SEER] Checking...")
+        for kind, agent, target in chosen:
+            if kind == "seer":
+                agent_actions[agent.name] = target
+                self._log(f"  {agent.name} checks: {target}")
+                self._emit_action(agent, "check", target)
+
+        return agent_actions
+
+    def _werewolf_consensus(self, agent_actions: Dict[str, str]) -> Optional[str]:
+        """Determine werewolf target from collected actions (None on a tie)"""
         werewolf_votes = {}
         for name, target in agent_actions.items():
             if name in self.agents and self.agents[name].role == Role.WEREWOLF:
@@ -248,37 +691,49 @@ class WerewolfGameOrchestrator:
             max_votes = max(werewolf_votes.values())
             candidates = [t for t, c in werewolf_votes.items() if c == max_votes]
             if len(candidates) == 1:
-                werewolf_target = candidates[0]
+                return candidates[0]
+        return None
 
-        for witch in witch_agents:
-            victim = werewolf_target
-            context = self._get_game_context()
+    def _witch_poison_targets(self, witch: WerewolfAgentBase) -> List[str]:
+        return [p for p in self.game.state.alive_players if p != witch.name]
 
-            # Decide on antidote first
-            if victim and not witch.antidote_used:
-                should_save = witch.night_action_save(victim, context)
-                if should_save:
-                    agent_actions[witch.name] = "save"
-                    self._log(f"  {witch.name} saves {victim}")
-                else:
-                    self._log(f"  {witch.name} does not save {victim}")
-            elif witch.antidote_used:
-                self._log(f"  {witch.name} antidote already used")
-            elif not victim:
-                self._log(f"  {witch.name} no one to save")
-
-            # Decide on poison second
-            if not witch.poison_used:
-                targets = [p for p in self.game.state.alive_players if p != witch.name]
-                poison_target = witch.night_action_poison(context, targets)
-                if poison_target:
-                    agent_actions[witch.name] = f"poison:{poison_target}"
-                    self._log(f"  {witch.name} poisons {poison_target}")
-                else:
-                    self._log(f"  {witch.name} does not use poison")
-            else:
-                self._log(f"  {witch.name} poison already used")
+    def _record_witch_save(
+        self,
+        witch: WerewolfAgentBase,
+        victim: str,
+        should_save: bool,
+        agent_actions: Dict[str, str],
+    ):
+        if should_save:
+            agent_actions[witch.name] = "save"
+            self._log(f"  {witch.name} saves {victim}")
+            self._emit_action(witch, "save", victim)
+        else:
+            self._log(f"  {witch.name} does not save {victim}")
+            self._emit_action(witch, "no_save", victim)
+
+    def _log_witch_save_skipped(self, witch: WerewolfAgentBase, victim: Optional[str]):
+        if witch.antidote_used:
+            self._log(f"  {witch.name} antidote already used")
+        elif not victim:
+            self._log(f"  {witch.name} no one to save")
+
+    def _record_witch_poison(
+        self,
+        witch: WerewolfAgentBase,
+        poison_target: Optional[str],
+        agent_actions: Dict[str, str],
+    ):
+        if poison_target:
+            agent_actions[witch.name] = f"poison:{poison_target}"
+            self._log(f"  {witch.name} poisons {poison_target}")
+            self._emit_action(witch, "poison", poison_target)
+        else:
+            self._log(f"  {witch.name} does not use poison")
+            self._emit_action(witch, "no_poison")
 
+    def _resolve_night(self, agent_actions: Dict[str, str]) -> Dict[str, Any]:
+        """Execute the night in the rules engine and update agent knowledge"""
         # NOW execute night phase ONCE with all collected actions
         night_result = self.game.execute_night_phase(agent_actions)
 
@@ -293,6 +748,9 @@ class WerewolfGameOrchestrator:
                     # But only announce team (good/bad) in logs for learning
                     team = checked_role.get_team()
                     self._log(f"  {seer_name} learned: {target} is {team}")
+                    self._emit(
+                        "seer_result", actor=seer_name, target=target, team=team
+                    )
 
         # Record kill result for werewolves
         victim = night_result.get("werewolf_target")
@@ -317,62 +775,65 @@ class WerewolfGameOrchestrator:
                 if agent.role == Role.WEREWOLF and hasattr(agent, "record_kill_result"):
                     agent.record_kill_result(victim, result)
 
+        for dead in self._night_deaths(night_result):
+            self._emit_death(dead)
+
         # Update agent states
         self._update_agents_after_night(night_result)
+        return night_result
 
-        # Announce results
-        self._announce_night_results(night_result)
-
-    def _run_day_phase(self):
+    async def _arun_day_phase(self):
         """Execute day phase with discussion and voting"""
         self._log(f"\n[DISCUSSION] Day {self.game.state.day_count + 1}")
         self._log(f"Alive players: {', '.join(self.game.state.alive_players)}")
 
-        # Discussion rounds
-        for round_num in range(self.discussion_rounds):
-            self._log(f"\n--- Discussion Round {round_num + 1} ---")
+        # Discussion rounds (sequential: each speaker hears the previous ones)
+        with self.profiler.section("discussion"):
+            for round_num in range(self.discussion_rounds):
+                self._log(f"\n--- Discussion Round {round_num + 1} ---")
 
-            alive_agents = [agent for agent in self.agents.values() if agent.is_alive]
-
-            for agent in alive_agents:
-                context = self._get_game_context()
-                statement = agent.discuss(context, self.discussion_history[-20:])
-
-                msg = Msg(name=agent.name, content=statement, role="assistant")
-                self.discussion_history.append(msg)
+                alive_agents = [
+                    agent for agent in self.agents.values() if agent.is_alive
+                ]
 
-                # Log complete statement without truncation
-                self._log(f"{agent.name}: {statement}")
+                for agent in alive_agents:
+                    context = self._get_game_context()
+                    statement = await agent.adiscuss(
+                        context, self.discussion_history[-20:]
+                    )
+                    self._record_statement(agent, statement)
 
         # Voting
-        self._log("\n[VOTING] Voting Phase")
-        agent_votes: Dict[str, str] = {}
+        with self.profiler.section("voting"):
+            self._log("\n[VOTING] Voting Phase")
+            agent_votes: Dict[str, str] = {}
 
-        alive_agents = [agent for agent in self.agents.values() if agent.is_alive]
-        for agent in alive_agents:
+            alive_agents = [agent for agent in self.agents.values() if agent.is_alive]
             context = self._get_game_context()
-            vote = agent.vote(context, self.game.state.alive_players)
-            agent_votes[agent.name] = vote
-            self._log(f"  {agent.name} votes for: {vote}")
+            alive_players = self.game.state.alive_players.copy()
+            if self.concurrent_voting:
+                votes = await self._agather(
+                    [agent.avote(context, alive_players) for agent in alive_agents]
+                )
+            else:
+                votes = [
+                    await agent.avote(context, alive_players) for agent in alive_agents
+                ]
+            for agent, vote in zip(alive_agents, votes):
+                self._record_vote(agent, vote, agent_votes)
 
-        # Execute day phase
-        day_result = self.game.execute_day_phase(agent_votes)
+            eliminated = self._resolve_day(agent_votes)
 
-        # Update agent states
-        self._update_agents_after_day(day_result)
-
-        # Announce results
-        eliminated = day_result.get("eliminated")
         if eliminated:
-            self._log(f"\n[ELIMINATED] {eliminated} was eliminated by vote!")
-            self._log(f"   Role: {self.game.state.roles[eliminated].value}")
-
             # Last words for voted out player
             if eliminated in self.agents:
-                self._log(f"\n[LAST WORDS] {eliminated}'s final statement:")
-                context = self._get_game_context()
-                last_words = self.agents[eliminated].last_words(context, "voted_out")
-                self._log(f"  {eliminated}: {last_words}")
+                with self.profiler.section("last_words"):
+                    self._log(f"\n[LAST WORDS] {eliminated}'s final statement:")
+                    context = self._get_game_context()
+                    last_words = await self.agents[eliminated].alast_words(
+                        context, "voted_out"
+                    )
+                    self._record_last_words(eliminated, last_words)
 
             # Hunter shoots if killed by vote (not by witch poison)
             if (
@@ -380,24 +841,86 @@ class WerewolfGameOrchestrator:
                 and self.game.state.death_records.get(eliminated) == "voted_out"
             ):
                 self._log(f"\n[HUNTER SKILL] {eliminated} activates hunter ability!")
-                if eliminated in self.agents and self.game.state.alive_players:
-                    from .agents import HunterAgent
-
-                    if isinstance(self.agents[eliminated], HunterAgent):
+                if self._hunter_can_shoot(eliminated):
+                    with self.profiler.section("hunter"):
                         context = self._get_game_context()
-                        target = self.agents[eliminated].shoot_target(
+                        target = await self.agents[eliminated].ashoot_target(
                             context, self.game.state.alive_players.copy(), "voted_out"
                         )
-                        if target and target in self.game.state.alive_players:
-                            self._log(f"  {eliminated} shoots {target}!")
-                            self.game.state.alive_players.remove(target)
-                            self.game.state.death_records[target] = "hunter_shot"
-                            self.agents[target].mark_dead()
-                            self._log(
-                                f"  {target} ({self.game.state.roles[target].value}) is killed!"
-                            )
+                        self._apply_hunter_shot(eliminated, target)
+
+    def _record_statement(self, agent: WerewolfAgentBase, statement: str):
+        msg = Msg(name=agent.name, content=statement, role="assistant")
+        self.discussion_history.append(msg)
+
+        # Log complete statement without truncation
+        self._log(f"{agent.name}: {statement}")
+        self._emit("statement", speaker=agent.name, kind="discussion", text=statement)
+
+    def _record_last_words(self, name: str, last_words: str):
+        self._log(f"  {name}: {last_words}")
+        self._emit("statement", speaker=name, kind="last_words", text=last_words)
+
+    def _record_vote(
+        self, agent: WerewolfAgentBase, vote: str, agent_votes: Dict[str, str]
+    ):
+        agent_votes[agent.name] = vote
+        self._log(f"  {agent.name} votes for: {vote}")
+        self._emit("vote", voter=agent.name, target=vote)
+
+    def _emit_death(self, player: str):
+        role = self.game.state.roles.get(player)
+        self._emit(
+            "death",
+            player=player,
+            role=role.value if role else None,
+            cause=self.game.state.death_records.get(player, "unknown"),
+        )
+
+    def _resolve_day(self, agent_votes: Dict[str, str]) -> str:
+        """Execute the vote in the rules engine and announce the outcome
+
+        Returns:
+            Name of the eliminated player, or empty string on a tie
+        """
+        # Execute day phase
+        day_result = self.game.execute_day_phase(agent_votes)
+
+        # Update agent states
+        self._update_agents_after_day(day_result)
+
+        # Announce results
+        eliminated = day_result.get("eliminated")
+        self._emit(
+            "vote_result",
+            eliminated=eliminated or None,
+            votes=day_result.get("votes", {}),
+        )
+        if eliminated:
+            self._emit_death(eliminated)
+            self._log(f"\n[ELIMINATED] {eliminated} was eliminated by vote!")
+            self._log(f"   Role: {self.game.state.roles[eliminated].value}")
         else:
             self._log("\n[TIE] No one was eliminated (tie vote)")
+        return eliminated
+
+    def _hunter_can_shoot(self, hunter_name: str) -> bool:
+        from .agents import HunterAgent
+
+        return (
+            hunter_name in self.agents
+            and bool(self.game.state.alive_players)
+            and isinstance(self.agents[hunter_name], HunterAgent)
+        )
+
+    def _apply_hunter_shot(self, hunter_name: str, target: str):
+        if target and target in self.game.state.alive_players:
+            self._log(f"  {hunter_name} shoots {target}!")
+            self.game.execute_hunter_shot(hunter_name, target)
+            self._emit_action(self.agents[hunter_name], "shoot", target)
+            self._emit_death(target)
+            self.agents[target].mark_dead()
+            self._log(f"  {target} ({self.game.state.roles[target].value}) is killed!")
 
     def _update_agents_after_night(self, night_result: Dict[str, Any]):
         """Update agent states after night phase"""
@@ -412,15 +935,8 @@ class WerewolfGameOrchestrator:
         if eliminated and eliminated in self.agents:
             self.agents[eliminated].mark_dead()
 
-    def _announce_night_results(self, night_result: Dict[str, Any]):
-        """Announce what happened during the night, including last words and hunter shots"""
-        victim = night_result.get("werewolf_target")
-        saved = night_result.get("saved")
-        poisoned = night_result.get("poisoned")
-
-        self._log("\n[MORNING] Announcement:")
-
-        # Collect deaths from night_result instead of comparing agent states
+    def _night_deaths(self, night_result: Dict[str, Any]) -> List[str]:
+        """Collect deaths from night_result instead of comparing agent states"""
         deaths = []
         if night_result.get("night_death"):
             deaths.append(night_result["night_death"])
@@ -428,7 +944,13 @@ class WerewolfGameOrchestrator:
             poisoned_player = night_result["poisoned_player"]
             if poisoned_player not in deaths:
                 deaths.append(poisoned_player)
+        return deaths
+
+    async def _aannounce_night_results(self, night_result: Dict[str, Any]):
+        """Announce what happened during the night, including last words and hunter shots"""
+        self._log("\n[MORNING] Announcement:")
 
+        deaths = self._night_deaths(night_result)
         if deaths:
             for dead in deaths:
                 cause = self.game.state.death_records.get(dead, "unknown")
@@ -436,10 +958,11 @@ class WerewolfGameOrchestrator:
 
                 # Last words for night deaths
                 if dead in self.agents:
-                    self._log(f"\n[LAST WORDS] {dead}'s final statement:")
-                    context = self._get_game_context()
-                    last_words = self.agents[dead].last_words(context, cause)
-                    self._log(f"  {dead}: {last_words}")
+                    with self.profiler.section("last_words"):
+                        self._log(f"\n[LAST WORDS] {dead}'s final statement:")
+                        context = self._get_game_context()
+                        last_words = await self.agents[dead].alast_words(context, cause)
+                        self._record_last_words(dead, last_words)
 
                 # Hunter shoots if killed by werewolves (not by witch poison)
                 if (
@@ -447,50 +970,45 @@ class WerewolfGameOrchestrator:
                     and cause == "werewolf_kill"
                 ):
                     self._log(f"\n[HUNTER SKILL] {dead} activates hunter ability!")
-                    if dead in self.agents and self.game.state.alive_players:
-                        from .agents import HunterAgent
-
-                        if isinstance(self.agents[dead], HunterAgent):
+                    if self._hunter_can_shoot(dead):
+                        with self.profiler.section("hunter"):
                             context = self._get_game_context()
-                            target = self.agents[dead].shoot_target(
+                            target = await self.agents[dead].ashoot_target(
                                 context, self.game.state.alive_players.copy(), cause
                             )
-                            if target and target in self.game.state.alive_players:
-                                self._log(f"  {dead} shoots {target}!")
-                                self.game.state.alive_players.remove(target)
-                                self.game.state.death_records[target] = "hunter_shot"
-                                self.agents[target].mark_dead()
-                                self._log(
-                                    f"  {target} ({self.game.state.roles[target].value}) is killed!"
-                                )
+                            self._apply_hunter_shot(dead, target)
         else:
             self._log("  [SAFE] Everyone survived the night!")
 
     def _get_game_context(self) -> str:
         """Generate context string for agents"""
+        started = time.perf_counter()
         context = f"""Round: {self.current_round}
 Phase: {self.game.state.phase.value}
 Day: {self.game.state.day_count}
 
 Alive Players ({len(self.game.state.alive_players)}):
 {', '.join(self.game.state.alive_players)}"""
+        self.profiler.add("context", time.perf_counter() - started)
         return context
 
     def _log(self, message: str):
-        """Log message if verbose, save to game record, and write to file in real-time"""
+        """Log message if verbose, save to game record, and write to the transcript"""
+        started = time.perf_counter()
         # Save to game record
         self.game_record.append(message)
 
-        # Write to file immediately
+        # Write to file (buffered)
         self._write_to_log_file(message)
 
         # Print if verbose
         if self.verbose:
             print(message)
             self.logger.info(message)
+        self.profiler.add("io", time.perf_counter() - started)
 
     def _write_to_log_file(self, message: str = None):
-        """Write message to log file immediately
+        """Write message to the transcript (buffered, see `TranscriptWriter`)
 
         Args:
             message: Single message to append. If None, write entire game_record
@@ -498,18 +1016,25 @@ Alive Players ({len(self.game.state.alive_players)}):
         try:
             if message is None:
                 # Write entire game record (used for initialization)
-                with open(self.log_file, "w", encoding="utf-8") as f:
-                    f.write("\n".join(self.game_record))
+                self.transcript.write_header(self.game_record)
             else:
-                # Append single message
-                with open(self.log_file, "a", encoding="utf-8") as f:
-                    f.write(message + "\n")
+                self.transcript.write(message)
         except Exception as e:
             if self.verbose:
                 print(f"Warning: Failed to write to log file: {e}")
 
+    async def _alog_game_end(self, winner: str):
+        """Run `_log_game_end` on the learning executor
+
+        The learning pipeline is synchronous and slow; keep it off the loop
+        and out of the default executor.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(get_learning_executor(), self._log_game_end, winner)
+
     def _log_game_end(self, winner: str):
         """Log game end information"""
+        self._emit_game_end(winner)
         self._log("\n" + "=" * 60)
         self._log("GAME OVER")
         self._log("=" * 60)
@@ -522,7 +1047,16 @@ Alive Players ({len(self.game.state.alive_players)}):
             )
             self._log(f"  {status} {player}: {role.value}")
 
+        # The learning pipeline reads the transcript file
+        self.transcript.flush()
+
         # After logging, run learning engine to analyze the game and update strategies
+        self.profiler.set_round(None)
+        with self.profiler.section("learning"):
+            self._run_learning()
+
+    def _run_learning(self):
+        """Review the finished game and update the persisted strategies"""
         try:
             # Pick any agent's model for analysis
             model_for_learning = None
@@ -534,6 +1068,7 @@ Alive Players ({len(self.game.state.alive_players)}):
                     self.agents,
                     self.game.state.roles,
                     model_for_learning,
+                    metrics=self.metrics,
                 )
                 self._log(f"\n[LEARNING] Reviews and lessons saved to: {review_dir}")
             else:
@@ -549,16 +1084,28 @@ Alive Players ({len(self.game.state.alive_players)}):
             "final_state": self.game.to_dict(),
             "roles": {p: r.value for p, r in self.game.state.roles.items()},
             "survivors": self.game.state.alive_players,
-            "game_log": self.game.state.game_log,
+            "game_log": list(self.game.state.game_log),
+            "model_calls": self.metrics.summary(),
+            "profile": self.profiler.summary(),
         }
 
+    def _write_profile(self):
+        """Print the flame-style profile and save it in folded-stack format"""
+        profile_file = os.path.splitext(self.log_file)[0] + ".profile.folded"
+        try:
+            with open(profile_file, "w", encoding="utf-8") as f:
+                f.write("\n".join(self.profiler.folded()) + "\n")
+        except OSError as e:
+            if self.verbose:
+                print(f"Warning: Failed to write profile: {e}")
+        print(self.profiler.format_flame())
+
     def save_game_record(self, filename: str = None):
         """Save complete game record to file
 
         Args:
             filename: Output filename. If None, auto-generate based on timestamp
         """
-        import datetime
 
         if filename is None:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
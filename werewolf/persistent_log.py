@@ -0,0 +1,89 @@
+"""
+Append-only log with O(1) fork
+
+`GameState.history` and `GameState.game_log` only ever grow, and lookahead
+search copies the state many times per decision. Storing them as a chain of
+immutable `(parent, item)` nodes lets a fork share the whole prefix: forking
+and appending are O(1), and each copy only pays for what it appends.
+
+Reads materialize the chain into a per-instance list once (O(n)), which is
+then kept in sync by `append`, so the live game reads at list speed. It is
+not a `list` subclass (a list would have to hold every entry on fork), so
+`json.dumps` needs `list(log)`.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+_Node = Optional[Tuple[Any, Any]]  # (parent node, item)
+
+
+class PersistentLog(Sequence):
+    """Append-only sequence whose `fork()` shares storage with the original"""
+
+    __slots__ = ("_node", "_len", "_items")
+
+    def __init__(self, items: Iterable[Any] = ()):
+        self._node: _Node = None
+        self._len = 0
+        self._items: Optional[List[Any]] = None
+        for item in items:
+            self.append(item)
+
+    def append(self, item: Any):
+        self._node = (self._node, item)
+        self._len += 1
+        if self._items is not None:
+            self._items.append(item)
+
+    def extend(self, items: Iterable[Any]):
+        for item in items:
+            self.append(item)
+
+    def fork(self) -> "PersistentLog":
+        """Independent log sharing this log's entries (O(1))"""
+        clone = PersistentLog.__new__(PersistentLog)
+        clone._node = self._node
+        clone._len = self._len
+        # Materialized lists are private to each instance
+        clone._items = None
+        return clone
+
+    def _materialize(self) -> List[Any]:
+        if self._items is None:
+            items = []
+            node = self._node
+            while node is not None:
+                node, item = node
+                items.append(item)
+            items.reverse()
+            self._items = items
+        return self._items
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._materialize())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._materialize()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PersistentLog):
+            return self._node is other._node or self._materialize() == list(other)
+        if isinstance(other, list):
+            return self._materialize() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # Pickle as a flat list; the node chain is too deep for recursion
+        return PersistentLog, (list(self._materialize()),)
+
+    def __repr__(self) -> str:
+        return f"PersistentLog({self._materialize()!r})"
@@ -0,0 +1,214 @@
+"""
+Phase-level timing profile of a game
+
+The orchestrator opens a named section for every phase and sub-phase
+(`round_1/night/witch`, `round_1/day/voting`, `game_end/learning`, ...).
+Each section's wall time is split into:
+- llm:     time with at least one model call in flight (union of the call
+           intervals recorded by `ModelCallMetrics`, so concurrent calls are
+           not double counted)
+- io:      transcript, event log and checkpoint writes (`add("io", ...)`)
+- context: building agent context strings (`add("context", ...)`)
+- engine:  the rest, i.e. rules engine and orchestration
+
+Sections nest and all figures are inclusive of child sections. `summary()`
+returns the numbers; `folded()` and `format_flame()` render them as
+flamegraph.pl input and as an indented text chart.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .metrics import ModelCallMetrics
+
+CATEGORIES = ("llm", "io", "context", "engine")
+
+
+def _union_length(intervals: List[Tuple[float, float]], start: float) -> float:
+    """Total length covered by `intervals`, clipped to begin at `start`"""
+    total = 0.0
+    cur_start = cur_end = None
+    for a, b in sorted((max(a, start), b) for a, b in intervals if b > start):
+        if cur_end is None or a > cur_end:
+            if cur_end is not None:
+                total += cur_end - cur_start
+            cur_start, cur_end = a, b
+        else:
+            cur_end = max(cur_end, b)
+    if cur_end is not None:
+        total += cur_end - cur_start
+    return total
+
+
+class _Frame:
+    __slots__ = ("path", "start", "interval_index", "io", "context")
+
+    def __init__(self, path: Tuple[str, ...], start: float, interval_index: int):
+        self.path = path
+        self.start = start
+        self.interval_index = interval_index
+        self.io = 0.0
+        self.context = 0.0
+
+
+class PhaseProfiler:
+    """Nested wall-clock sections with an LLM / io / context / engine split
+
+    Args:
+        metrics: Model call collector whose call intervals give LLM time
+            (None = no LLM attribution)
+    """
+
+    def __init__(self, metrics: Optional[ModelCallMetrics] = None):
+        self.metrics = metrics
+        self.round_label: Optional[str] = None
+        # path -> count, wall, llm, io, context
+        self.sections: Dict[Tuple[str, ...], Dict[str, float]] = {}
+        self._stack: List[_Frame] = []
+        # First-start order of every path (and round prefix), for reports
+        self._order: Dict[Tuple[str, ...], int] = {}
+
+    def set_round(self, round_num: Optional[int]):
+        """Prefix top-level sections with `round_<n>` (None = no prefix)"""
+        self.round_label = None if round_num is None else f"round_{round_num}"
+
+    def begin(self, name: str):
+        if self._stack:
+            path = self._stack[-1].path + (name,)
+        elif self.round_label:
+            path = (self.round_label, name)
+        else:
+            path = (name,)
+        for i in range(1, len(path) + 1):
+            self._order.setdefault(path[:i], len(self._order))
+        intervals = self.metrics.intervals if self.metrics else ()
+        self._stack.append(_Frame(path, time.perf_counter(), len(intervals)))
+
+    def end(self):
+        frame = self._stack.pop()
+        now = time.perf_counter()
+        llm = 0.0
+        if self.metrics:
+            llm = _union_length(
+                self.metrics.intervals[frame.interval_index :], frame.start
+            )
+        stats = self.sections.setdefault(
+            frame.path,
+            {"count": 0, "wall": 0.0, "llm": 0.0, "io": 0.0, "context": 0.0},
+        )
+        stats["count"] += 1
+        stats["wall"] += now - frame.start
+        stats["llm"] += llm
+        stats["io"] += frame.io
+        stats["context"] += frame.context
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end()
+
+    def add(self, category: str, seconds: float):
+        """Charge `seconds` of io or context time to every open section"""
+        for frame in self._stack:
+            setattr(frame, category, getattr(frame, category) + seconds)
+
+    # --- reporting -----------------------------------------------------------
+
+    @staticmethod
+    def _split(stats: Dict[str, float]) -> Dict[str, float]:
+        wall = stats["wall"]
+        split = {
+            "count": int(stats["count"]),
+            "wall": round(wall, 6),
+            "llm": round(stats["llm"], 6),
+            "io": round(stats["io"], 6),
+            "context": round(stats["context"], 6),
+        }
+        engine = wall - stats["llm"] - stats["io"] - stats["context"]
+        split["engine"] = round(max(0.0, engine), 6)
+        return split
+
+    def _totals(self, paths) -> Dict[str, float]:
+        totals = {"count": 0, "wall": 0.0, "llm": 0.0, "io": 0.0, "context": 0.0}
+        for path in paths:
+            for key, value in self.sections[path].items():
+                totals[key] += value
+        return totals
+
+    def _top_level(self) -> List[Tuple[str, ...]]:
+        """Paths of sections not nested in another section"""
+        return [
+            path
+            for path in self.sections
+            if len(path) == 1 or (len(path) == 2 and path[0].startswith("round_"))
+        ]
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals, per round, per sub-phase (over all rounds) and per section"""
+        top = self._top_level()
+        rounds: Dict[str, List[Tuple[str, ...]]] = {}
+        for path in top:
+            if len(path) == 2:
+                rounds.setdefault(path[0], []).append(path)
+
+        by_subphase: Dict[str, List[Tuple[str, ...]]] = {}
+        for path in self.sections:
+            key = path[1:] if path[0].startswith("round_") else path
+            by_subphase.setdefault("/".join(key), []).append(path)
+
+        return {
+            **self._split(self._totals(top)),
+            "rounds": {r: self._split(self._totals(p)) for r, p in rounds.items()},
+            "by_subphase": {
+                k: self._split(self._totals(p)) for k, p in by_subphase.items()
+            },
+            "sections": {
+                "/".join(path): self._split(stats)
+                for path, stats in self.sections.items()
+            },
+        }
+
+    def _tree(self) -> List[Tuple[Tuple[str, ...], float]]:
+        """(path, wall) in depth-first game order; round prefixes become nodes"""
+        walls = {path: stats["wall"] for path, stats in self.sections.items()}
+        for path in self._top_level():
+            if len(path) == 2:
+                walls[path[:1]] = walls.get(path[:1], 0.0) + walls[path]
+        order = sorted(
+            walls, key=lambda p: [self._order[p[: i + 1]] for i in range(len(p))]
+        )
+        return [(path, walls[path]) for path in order]
+
+    def folded(self) -> List[str]:
+        """Folded stacks (`a;b;c <self microseconds>`) for flamegraph.pl"""
+        tree = self._tree()
+        child_wall: Dict[Tuple[str, ...], float] = {}
+        for path, wall in tree:
+            if len(path) > 1:
+                child_wall[path[:-1]] = child_wall.get(path[:-1], 0.0) + wall
+        lines = []
+        for path, wall in tree:
+            self_us = int(round(max(0.0, wall - child_wall.get(path, 0.0)) * 1e6))
+            lines.append(f"{';'.join(path)} {self_us}")
+        return lines
+
+    def format_flame(self, width: int = 40) -> str:
+        """Indented text chart of all sections with their time split"""
+        tree = self._tree()
+        total = self._totals(self._top_level())["wall"] or 1e-9
+        lines = ["PHASE PROFILE (seconds, inclusive)"]
+        for path, wall in tree:
+            bar = "#" * max(1, int(round(width * wall / total)))
+            label = "  " * (len(path) - 1) + path[-1]
+            line = f"{label:<36} {wall:9.3f} {bar}"
+            if path in self.sections:
+                split = self._split(self.sections[path])
+                line += "  " + " ".join(
+                    f"{c}={split[c]:.3f}" for c in CATEGORIES if split[c]
+                )
+            lines.append(line)
+        return "\n".join(lines)
@@ -0,0 +1,225 @@
+"""
+Cross-process rate limiter for model calls
+
+Self-play can run many worker processes against the same provider key. Each
+model config may declare provider limits in `MODEL_CONFIGS`:
+
+    "rate_limit": {"requests_per_minute": 500, "tokens_per_minute": 200000}
+
+All processes share one token bucket per config and resource, stored in a
+small SQLite file; SQLite's file locking serializes updates across processes
+(the same approach as the response cache).
+
+Buckets may go into debt: a caller always reserves its cost immediately and
+is told how long to wait until the reservation is covered by the refill. So
+waiting callers are spaced exactly `cost / rate` apart instead of polling and
+retrying together, and throughput settles at `headroom` x the provider limit
+instead of oscillating around it.
+
+Token cost is not known before a call, so `estimate_tokens` reserves the
+prompt size plus the configured `max_tokens`, and `settle` corrects the
+bucket with the usage the provider actually reported.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# Completion size reserved when a config sets no max_tokens
+DEFAULT_COMPLETION_TOKENS = 512
+
+
+def estimate_tokens(messages: List[Dict[str, Any]], max_tokens: Optional[int]) -> int:
+    """Rough upper estimate of a call's tokens (about 4 characters per token)"""
+    chars = sum(len(str(m.get("content", ""))) for m in messages)
+    return chars // 4 + 1 + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+class RateLimiter:
+    """Token buckets per model config shared by all processes using `path`
+
+    Args:
+        path: SQLite file holding the bucket levels
+        headroom: Fraction of the provider limits actually used (0-1]
+        burst_seconds: Bucket capacity in seconds of refill, i.e. how much an
+            idle config may send at once
+    """
+
+    def __init__(self, path: str, headroom: float = 0.9, burst_seconds: float = 1.0):
+        if not 0 < headroom <= 1:
+            raise ValueError(f"headroom must be in (0, 1], got {headroom}")
+        self.path = path
+        self.headroom = headroom
+        self.burst_seconds = burst_seconds
+        self.waits = 0
+        self.wait_time = 0.0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not cross a fork; reopen in child processes
+        if self._conn is None or self._pid != os.getpid():
+            # Created on first use, so unlimited configs never touch the disk
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            self._pid = os.getpid()
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS buckets (
+                    key TEXT PRIMARY KEY,
+                    level REAL NOT NULL,
+                    updated REAL NOT NULL
+                )"""
+            )
+        return self._conn
+
+    def _rates(self, limits: Dict[str, Any]) -> Dict[str, float]:
+        """Per-second refill rate of each limited resource"""
+        rates = {}
+        for resource, key in (
+            ("requests", "requests_per_minute"),
+            ("tokens", "tokens_per_minute"),
+        ):
+            if limits.get(key):
+                rates[resource] = limits[key] * self.headroom / 60.0
+        return rates
+
+    def _update(self, config_name: str, costs: Dict[str, float], rates) -> float:
+        """Apply costs to the buckets; returns seconds until all are covered"""
+        now = time.time()
+        wait = 0.0
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for resource, cost in costs.items():
+                    rate = rates[resource]
+                    capacity = max(rate * self.burst_seconds, 1.0)
+                    key = f"{config_name}:{resource}"
+                    row = conn.execute(
+                        "SELECT level, updated FROM buckets WHERE key = ?", (key,)
+                    ).fetchone()
+                    level = capacity if row is None else row[0]
+                    if row is not None:
+                        level = min(capacity, level + max(0.0, now - row[1]) * rate)
+                    level -= cost
+                    conn.execute(
+                        "INSERT OR REPLACE INTO buckets (key, level, updated) "
+                        "VALUES (?, ?, ?)",
+                        (key, level, now),
+                    )
+                    if level < 0:
+                        wait = max(wait, -level / rate)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return wait
+
+    def reserve(self, config_name: str, limits: Dict[str, Any], tokens: int) -> float:
+        """Reserve one request of `tokens`; returns seconds to wait before sending"""
+        rates = self._rates(limits)
+        costs = {r: 1.0 if r == "requests" else float(tokens) for r in rates}
+        wait = self._update(config_name, costs, rates) if costs else 0.0
+        if wait > 0:
+            self.waits += 1
+            self.wait_time += wait
+        return wait
+
+    def settle(self, config_name: str, limits: Dict[str, Any], extra_tokens: int):
+        """Charge (or with a negative value, refund) tokens after a call"""
+        rates = self._rates(limits)
+        if "tokens" in rates and extra_tokens:
+            self._update(config_name, {"tokens": float(extra_tokens)}, rates)
+
+    def acquire(self, config_name: str, limits: Dict[str, Any], tokens: int = 0):
+        """Blocking `reserve` + sleep"""
+        wait = self.reserve(config_name, limits, tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, config_name: str, limits: Dict[str, Any], tokens: int = 0):
+        """Async `reserve` + sleep
+
+        The bucket update runs in a worker thread: it may wait on SQLite's
+        file lock while other processes hold it, which must not stall every
+        game on the event loop.
+        """
+        wait = await asyncio.to_thread(self.reserve, config_name, limits, tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def asettle(
+        self, config_name: str, limits: Dict[str, Any], extra_tokens: int
+    ):
+        """Async `settle`, off the event loop like `aacquire`"""
+        await asyncio.to_thread(self.settle, config_name, limits, extra_tokens)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+_active_limiter: Optional[RateLimiter] = None
+_active_lock = threading.Lock()
+_configured_from_env = False
+
+
+def configure_rate_limiter(
+    path: Optional[str], headroom: float = 0.9, burst_seconds: float = 1.0
+) -> Optional[RateLimiter]:
+    """Enable (or with path=None, disable) the process-wide rate limiter"""
+    global _active_limiter, _configured_from_env
+    with _active_lock:
+        if _active_limiter is not None:
+            _active_limiter.close()
+        _active_limiter = RateLimiter(path, headroom, burst_seconds) if path else None
+        _configured_from_env = True
+        return _active_limiter
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Return the active rate limiter, if any
+
+    On first use the limiter is configured from `RATE_LIMIT_CONFIG` in
+    `werewolf.config`, so worker processes pick it up without extra wiring.
+    """
+    global _configured_from_env
+    if not _configured_from_env:
+        from werewolf.config import RATE_LIMIT_CONFIG
+
+        if RATE_LIMIT_CONFIG.get("enabled"):
+            configure_rate_limiter(
+                RATE_LIMIT_CONFIG["path"],
+                RATE_LIMIT_CONFIG.get("headroom", 0.9),
+                RATE_LIMIT_CONFIG.get("burst_seconds", 1.0),
+            )
+        _configured_from_env = True
+    return _active_limiter
+
+
+def model_rate_limits(model) -> Optional[Dict[str, Any]]:
+    """Rate limit settings of a pooled model's config (None if unlimited)"""
+    config_name = getattr(model, "config_name", None)
+    if not isinstance(config_name, str):
+        return None
+    from .model_pool import find_model_config
+
+    config = find_model_config(config_name) or {}
+    limits = config.get("rate_limit")
+    if not limits:
+        return None
+    return {
+        "config_name": config_name,
+        "limits": limits,
+        "max_tokens": config.get("generate_args", {}).get("max_tokens"),
+    }
@@ -0,0 +1,311 @@
+"""
+Persistent LLM response cache
+
+Regression runs and replays re-send byte-identical prompts. When enabled, the
+cache stores model responses on disk (SQLite) keyed by a hash of the model
+configuration, its generate args and the message list, with size-bounded LRU
+eviction. Entry and byte totals are kept up to date by triggers, so a store
+only evicts (a batch of the oldest entries) once a cap is exceeded.
+
+Modes:
+- readwrite: serve hits, call the model and store on misses (default)
+- readonly:  serve hits, call the model on misses but never write
+- record:    always call the model and store the fresh response
+- replay:    serve hits only; a miss raises `ResponseCacheMiss`
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+CACHE_MODES = ("readwrite", "readonly", "record", "replay")
+
+# A full cache evicts this fraction of its caps at once, instead of one
+# entry on every store
+EVICT_BATCH = 0.01
+
+_DISABLED_VALUES = ("", "0", "off", "false", "no")
+_ENABLED_VALUES = ("1", "on", "true", "yes")
+
+
+def parse_cache_mode(value: Optional[str]) -> Optional[str]:
+    """Cache mode from a setting like WEREWOLF_RESPONSE_CACHE
+
+    Returns None (disabled) for unset, 0, off, false or no, and "readwrite"
+    for 1, on, true or yes.
+
+    Raises:
+        ValueError: For anything else that is not one of `CACHE_MODES`
+    """
+    value = (value or "").strip().lower()
+    if value in _DISABLED_VALUES:
+        return None
+    if value in _ENABLED_VALUES:
+        return "readwrite"
+    if value not in CACHE_MODES:
+        raise ValueError(
+            f"Invalid response cache setting {value!r}: expected off, on or "
+            f"one of {', '.join(CACHE_MODES)}"
+        )
+    return value
+
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS responses (
+        key TEXT PRIMARY KEY,
+        response TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        last_access REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_last_access ON responses (last_access)",
+    # Running totals (one row), maintained by the triggers below
+    """CREATE TABLE IF NOT EXISTS totals (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        entries INTEGER NOT NULL,
+        bytes INTEGER NOT NULL
+    )""",
+    # Counted once for caches created before the totals existed
+    """INSERT OR IGNORE INTO totals
+        SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM responses""",
+    """CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses
+    BEGIN
+        UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS responses_update
+    AFTER UPDATE OF size ON responses
+    BEGIN
+        UPDATE totals SET bytes = bytes + NEW.size - OLD.size;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses
+    BEGIN
+        UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size;
+    END""",
+)
+
+
+class ResponseCacheMiss(LookupError):
+    """Raised in replay mode when a prompt has no recorded response"""
+
+
+class CachedResponse:
+    """Minimal stand-in for an AgentScope ChatResponse replayed from cache"""
+
+    def __init__(self, text: str):
+        self.content = [{"type": "text", "text": text}]
+
+
+def _model_fingerprint(model) -> Dict[str, Any]:
+    """Describe the model configuration without secrets"""
+    config_name = getattr(model, "config_name", None)
+    if isinstance(config_name, str):
+        from .model_pool import find_model_config
+
+        config = find_model_config(config_name) or {}
+        return {
+            "config_name": config_name,
+            "model_type": config.get("model_type"),
+            "model_name": config.get("model_name"),
+            "base_url": config.get("base_url"),
+            "host": config.get("host"),
+            "generate_args": config.get("generate_args", {}),
+        }
+
+    # Raw model instances: fall back to what they expose
+    return {
+        "model_class": type(model).__name__,
+        "model_name": str(getattr(model, "model_name", "")),
+        "generate_args": str(getattr(model, "generate_kwargs", "")),
+    }
+
+
+class ResponseCache:
+    """SQLite-backed response cache with LRU eviction
+
+    Args:
+        path: Database file path
+        mode: One of `CACHE_MODES`
+        max_entries: Maximum number of cached responses (None = unbounded)
+        max_bytes: Maximum total size of cached response text (None = unbounded)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "readwrite",
+        max_entries: Optional[int] = 50000,
+        max_bytes: Optional[int] = None,
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Shared by threads (guarded by _lock); other processes go through
+        # SQLite's own file locking. Connections must not cross a fork
+        # (ProcessPoolExecutor workers), so children reopen their own.
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False
+            )
+            self._pid = os.getpid()
+            with self._conn:
+                # Immediate, so no other process writes before the totals
+                # of an existing cache are counted
+                self._conn.execute("BEGIN IMMEDIATE")
+                for statement in _SCHEMA:
+                    self._conn.execute(statement)
+        return self._conn
+
+    @staticmethod
+    def make_key(model, messages: List[Dict[str, Any]]) -> str:
+        """Hash model configuration and messages into a cache key"""
+        payload = json.dumps(
+            {"model": _model_fingerprint(model), "messages": messages},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for `key`, or None"""
+        if self.mode == "record":
+            return None
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if self.mode != "readonly":
+                with conn:
+                    conn.execute(
+                        "UPDATE responses SET last_access = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+        return CachedResponse(row[0])
+
+    async def aget(self, key: str) -> Optional[CachedResponse]:
+        """Async `get`; the SQLite call runs off the event loop"""
+        return await asyncio.to_thread(self.get, key)
+
+    def put(self, key: str, text: str):
+        """Store response text under `key` and evict least recently used entries"""
+        if self.mode in ("readonly", "replay"):
+            return
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                # An upsert (not REPLACE) so the triggers see the old size
+                conn.execute(
+                    "INSERT INTO responses (key, response, size, last_access) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                    "response = excluded.response, size = excluded.size, "
+                    "last_access = excluded.last_access",
+                    (key, text, len(text.encode("utf-8")), time.time()),
+                )
+                self._evict(conn)
+
+    async def aput(self, key: str, text: str):
+        """Async `put`; the SQLite calls run off the event loop"""
+        await asyncio.to_thread(self.put, key, text)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop the oldest entries once a cap is exceeded
+
+        Evicts down to `EVICT_BATCH` below the caps, walking the
+        last_access index, so most stores evict nothing.
+        """
+        entries, total = conn.execute("SELECT entries, bytes FROM totals").fetchone()
+        max_entries = entries if self.max_entries is None else self.max_entries
+        max_bytes = total if self.max_bytes is None else self.max_bytes
+        if entries <= max_entries and total <= max_bytes:
+            return
+        max_entries -= int(max_entries * EVICT_BATCH)
+        max_bytes -= int(max_bytes * EVICT_BATCH)
+
+        stale = []
+        cursor = conn.execute("SELECT key, size FROM responses ORDER BY last_access")
+        for key, size in cursor:
+            if entries <= max_entries and total <= max_bytes:
+                break
+            stale.append((key,))
+            entries -= 1
+            total -= size
+        cursor.close()
+        conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def __len__(self) -> int:
+        with self._lock:
+            conn = self._connection()
+            return conn.execute("SELECT entries FROM totals").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+_active_cache: Optional[ResponseCache] = None
+_active_lock = threading.Lock()
+_configured_from_env = False
+
+
+def configure_response_cache(
+    path: Optional[str],
+    mode: str = "readwrite",
+    max_entries: Optional[int] = 50000,
+    max_bytes: Optional[int] = None,
+) -> Optional[ResponseCache]:
+    """Enable (or with path=None, disable) the process-wide response cache"""
+    global _active_cache, _configured_from_env
+    with _active_lock:
+        if _active_cache is not None:
+            _active_cache.close()
+        _active_cache = (
+            ResponseCache(path, mode, max_entries, max_bytes) if path else None
+        )
+        _configured_from_env = True
+        return _active_cache
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the active response cache, if any
+
+    On first use the cache is configured from `RESPONSE_CACHE_CONFIG` in
+    `werewolf.config`, so worker processes pick it up without extra wiring.
+    """
+    global _configured_from_env
+    if not _configured_from_env:
+        from werewolf.config import RESPONSE_CACHE_CONFIG
+
+        if RESPONSE_CACHE_CONFIG.get("enabled"):
+            configure_response_cache(
+                RESPONSE_CACHE_CONFIG["path"],
+                RESPONSE_CACHE_CONFIG.get("mode", "readwrite"),
+                RESPONSE_CACHE_CONFIG.get("max_entries"),
+                RESPONSE_CACHE_CONFIG.get("max_bytes"),
+            )
+        _configured_from_env = True
+    return _active_cache
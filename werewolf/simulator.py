@@ -0,0 +1,310 @@
+"""
+Headless Werewolf simulator with scripted (non-LLM) policies
+
+Drives `WerewolfGame.execute_night_phase`, `execute_day_phase` and
+`check_game_end` directly, mirroring the orchestrator's flow (witch sees the
+werewolf consensus, hunter shoots on werewolf kill or vote-out), so rule
+balance can be measured over many thousands of games per second.
+
+Policies:
+- random:         every choice is uniformly random among legal targets
+- heuristic:      werewolves coordinate and never vote teammates, the seer
+                  votes known werewolves, the witch saves the first victim
+- seer_trusting:  heuristic, plus the seer publishes checks and the good
+                  side votes/poisons revealed werewolves and spares cleared players
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .werewolf_game import WerewolfGame, Role
+
+PLAYER_COUNTS = {"six": 6, "nine": 9, "twelve": 12}
+
+
+class Policy:
+    """Uniformly random policy; subclasses override individual decisions"""
+
+    name = "random"
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def start_game(self, game: WerewolfGame):
+        # Seer check results: target -> role
+        self.seer_knowledge: Dict[str, Role] = {}
+
+    def _pick(self, candidates: List[str]) -> Optional[str]:
+        return self.rng.choice(candidates) if candidates else None
+
+    def guardian_target(
+        self, game: WerewolfGame, guardian: str, last: Optional[str]
+    ) -> Optional[str]:
+        return self._pick([p for p in game.state.alive_players if p != last])
+
+    def werewolf_targets(
+        self, game: WerewolfGame, wolves: List[str], targets: List[str]
+    ) -> Dict[str, str]:
+        return {w: self.rng.choice(targets) for w in wolves}
+
+    def seer_target(self, game: WerewolfGame, seer: str) -> Optional[str]:
+        return self._pick([p for p in game.state.alive_players if p != seer])
+
+    def witch_saves(self, game: WerewolfGame, witch: str, victim: str) -> bool:
+        return self.rng.random() < 0.5
+
+    def witch_poison(self, game: WerewolfGame, witch: str) -> Optional[str]:
+        if self.rng.random() < 0.2:
+            return self._pick([p for p in game.state.alive_players if p != witch])
+        return None
+
+    def vote(self, game: WerewolfGame, voter: str) -> Optional[str]:
+        return self._pick([p for p in game.state.alive_players if p != voter])
+
+    def hunter_shot(self, game: WerewolfGame, hunter: str) -> Optional[str]:
+        return self._pick(game.state.alive_players)
+
+
+class HeuristicPolicy(Policy):
+    """Simple competent play without public information sharing"""
+
+    name = "heuristic"
+
+    def _is_wolf(self, game: WerewolfGame, player: str) -> bool:
+        return game.state.roles[player] == Role.WEREWOLF
+
+    def werewolf_targets(
+        self, game: WerewolfGame, wolves: List[str], targets: List[str]
+    ) -> Dict[str, str]:
+        # Wolves coordinate on a single target
+        target = self.rng.choice(targets)
+        return {w: target for w in wolves}
+
+    def seer_target(self, game: WerewolfGame, seer: str) -> Optional[str]:
+        unchecked = [
+            p
+            for p in game.state.alive_players
+            if p != seer and p not in self.seer_knowledge
+        ]
+        return self._pick(unchecked) or super().seer_target(game, seer)
+
+    def witch_saves(self, game: WerewolfGame, witch: str, victim: str) -> bool:
+        return True
+
+    def witch_poison(self, game: WerewolfGame, witch: str) -> Optional[str]:
+        return None
+
+    def _known_wolves(self) -> List[str]:
+        return [p for p, r in self.seer_knowledge.items() if r == Role.WEREWOLF]
+
+    def vote(self, game: WerewolfGame, voter: str) -> Optional[str]:
+        alive = game.state.alive_players
+        if self._is_wolf(game, voter):
+            return self._pick([p for p in alive if not self._is_wolf(game, p)])
+        if game.state.roles[voter] == Role.SEER:
+            known = [p for p in self._known_wolves() if p in alive]
+            if known:
+                return known[0]
+        return super().vote(game, voter)
+
+
+class SeerTrustingPolicy(HeuristicPolicy):
+    """Heuristic play where the seer's checks are public and trusted"""
+
+    name = "seer_trusting"
+
+    def _good_vote(self, game: WerewolfGame, voter: str) -> Optional[str]:
+        alive = game.state.alive_players
+        known = [p for p in self._known_wolves() if p in alive]
+        if known:
+            return known[0]
+        cleared = {p for p, r in self.seer_knowledge.items() if r != Role.WEREWOLF}
+        return self._pick([p for p in alive if p != voter and p not in cleared])
+
+    def witch_poison(self, game: WerewolfGame, witch: str) -> Optional[str]:
+        known = [p for p in self._known_wolves() if p in game.state.alive_players]
+        return known[0] if known else None
+
+    def vote(self, game: WerewolfGame, voter: str) -> Optional[str]:
+        if self._is_wolf(game, voter):
+            return super().vote(game, voter)
+        return self._good_vote(game, voter) or super().vote(game, voter)
+
+    def hunter_shot(self, game: WerewolfGame, hunter: str) -> Optional[str]:
+        known = [p for p in self._known_wolves() if p in game.state.alive_players]
+        return known[0] if known else super().hunter_shot(game, hunter)
+
+
+POLICIES = {
+    Policy.name: Policy,
+    HeuristicPolicy.name: HeuristicPolicy,
+    SeerTrustingPolicy.name: SeerTrustingPolicy,
+}
+
+
+@dataclass
+class SimulationResult:
+    game_type: str
+    policy: str
+    games: int = 0
+    werewolf_wins: int = 0
+    villager_wins: int = 0
+    draws: int = 0
+    total_rounds: int = 0
+    elapsed: float = 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        games = max(1, self.games)
+        return {
+            "game_type": self.game_type,
+            "policy": self.policy,
+            "games": self.games,
+            "werewolf_win_rate": self.werewolf_wins / games,
+            "villager_win_rate": self.villager_wins / games,
+            "draw_rate": self.draws / games,
+            "avg_rounds": self.total_rounds / games,
+            "games_per_second": self.games / self.elapsed if self.elapsed else 0.0,
+        }
+
+
+class HeadlessSimulator:
+    """Play complete games with a scripted policy and no LLM calls"""
+
+    def __init__(self, policy: Policy, max_rounds: int = 20):
+        self.policy = policy
+        self.max_rounds = max_rounds
+
+    def _players_with_role(self, game: WerewolfGame, role: Role) -> List[str]:
+        return game.state.alive_with_role(role)
+
+    def _hunter_shoots(self, game: WerewolfGame, hunter: str):
+        if game.state.roles.get(hunter) != Role.HUNTER or not game.state.alive_players:
+            return
+        game.execute_hunter_shot(hunter, self.policy.hunter_shot(game, hunter))
+
+    def _night(self, game: WerewolfGame, witch_potions: Dict[str, bool]):
+        policy = self.policy
+        state = game.state
+        actions: Dict[str, str] = {}
+
+        for guardian in self._players_with_role(game, Role.GUARDIAN):
+            last = (state.guardian_last_guarded or {}).get(guardian)
+            target = policy.guardian_target(game, guardian, last)
+            if target:
+                actions[guardian] = target
+
+        wolves = self._players_with_role(game, Role.WEREWOLF)
+        wolf_targets = [
+            p for p in state.alive_players if state.roles[p] != Role.WEREWOLF
+        ]
+        if wolves and wolf_targets:
+            actions.update(policy.werewolf_targets(game, wolves, wolf_targets))
+
+        for seer in self._players_with_role(game, Role.SEER):
+            target = policy.seer_target(game, seer)
+            if target:
+                actions[seer] = target
+
+        # The witch only learns a victim when the wolves agree (as in the orchestrator)
+        tally: Dict[str, int] = {}
+        for wolf in wolves:
+            if wolf in actions:
+                tally[actions[wolf]] = tally.get(actions[wolf], 0) + 1
+        victim = None
+        if tally:
+            top = max(tally.values())
+            leaders = [t for t, c in tally.items() if c == top]
+            if len(leaders) == 1:
+                victim = leaders[0]
+
+        for witch in self._players_with_role(game, Role.WITCH):
+            if victim and not witch_potions["antidote_used"]:
+                if policy.witch_saves(game, witch, victim):
+                    actions[witch] = "save"
+                    witch_potions["antidote_used"] = True
+                    # One potion per night, as in the orchestrator
+                    continue
+            if not witch_potions["poison_used"]:
+                target = policy.witch_poison(game, witch)
+                if target:
+                    actions[witch] = f"poison:{target}"
+                    witch_potions["poison_used"] = True
+
+        night_result = game.execute_night_phase(actions)
+
+        for seer, role in night_result.get("seer_checks", {}).items():
+            policy.seer_knowledge[actions[seer]] = role
+
+        death = night_result.get("night_death")
+        if death and state.death_records.get(death) == "werewolf_kill":
+            self._hunter_shoots(game, death)
+
+    def _day(self, game: WerewolfGame):
+        votes: Dict[str, str] = {}
+        for voter in list(game.state.alive_players):
+            target = self.policy.vote(game, voter)
+            if target:
+                votes[voter] = target
+
+        eliminated = game.execute_day_phase(votes).get("eliminated")
+        if eliminated:
+            self._hunter_shoots(game, eliminated)
+
+    def play(self, game: WerewolfGame) -> tuple[str, int]:
+        """Play one game to completion. Returns (winner, rounds played)"""
+        self.policy.start_game(game)
+        witch_potions = {"antidote_used": False, "poison_used": False}
+
+        for round_num in range(1, self.max_rounds + 1):
+            self._night(game, witch_potions)
+            ended, winner = game.check_game_end()
+            if ended:
+                return winner, round_num
+
+            self._day(game)
+            ended, winner = game.check_game_end()
+            if ended:
+                return winner, round_num
+
+        return "draw", self.max_rounds
+
+
+def simulate(
+    game_type: str = "six",
+    n_games: int = 1000,
+    policy: str = "random",
+    seed: Optional[int] = None,
+    max_rounds: int = 20,
+) -> SimulationResult:
+    """Run `n_games` headless games and aggregate win rates
+
+    Args:
+        game_type: Game type (six, nine, twelve)
+        n_games: Number of games to play
+        policy: Policy name from `POLICIES`
+        seed: Seed for role assignment and policy choices
+        max_rounds: Maximum number of day/night cycles per game
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+
+    rng = random.Random(seed)
+    simulator = HeadlessSimulator(POLICIES[policy](rng), max_rounds)
+    players = [f"P{i + 1}" for i in range(PLAYER_COUNTS.get(game_type, 12))]
+    result = SimulationResult(game_type=game_type, policy=policy)
+
+    start = time.perf_counter()
+    for _ in range(n_games):
+        winner, rounds = simulator.play(WerewolfGame(players, game_type, rng))
+        result.games += 1
+        result.total_rounds += rounds
+        if winner == "werewolves":
+            result.werewolf_wins += 1
+        elif winner == "villagers":
+            result.villager_wins += 1
+        else:
+            result.draws += 1
+    result.elapsed = time.perf_counter() - start
+    return result
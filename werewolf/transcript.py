@@ -0,0 +1,125 @@
+"""
+Buffered game transcript writer
+
+The orchestrator logs every line of a game to its transcript file. Opening
+the file, appending one line and closing it again per message costs a few
+syscalls per line, which adds up with many parallel games on a shared disk.
+`TranscriptWriter` collects lines in memory and appends them in batches.
+
+Flush policy (any trigger flushes):
+- flush_lines:    buffered line count reaches this (<= 1 writes every line)
+- flush_interval: seconds since the last flush, checked when a line arrives
+- flush_on_phase: `phase_boundary()` is called (after each night/day phase)
+
+Buffered lines are always written by `close()`, which the orchestrator calls
+when a game ends (or fails). A writer that is dropped or still open at
+interpreter exit writes its remaining lines from a `weakref.finalize` hook.
+"""
+
+import os
+import threading
+import time
+import weakref
+from typing import Iterable, List, Optional
+
+
+def _write_remaining(path: str, buffer: List[str]):
+    """Last-resort flush for writers that were never closed"""
+    if not buffer:
+        return
+    try:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(buffer))
+    except OSError:
+        pass
+    buffer.clear()
+
+
+class TranscriptWriter:
+    """Append-only transcript file with batched writes
+
+    Args:
+        path: Transcript file path
+        flush_lines: Flush once this many lines are buffered
+        flush_interval: Flush when a line arrives this many seconds after the
+            last flush (None = no time trigger)
+        flush_on_phase: Flush at every `phase_boundary()`
+        fsync: Also fsync the file on every flush (survives power loss, slower)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_lines: int = 50,
+        flush_interval: Optional[float] = 2.0,
+        flush_on_phase: bool = True,
+        fsync: bool = False,
+    ):
+        self.path = path
+        self.flush_lines = max(1, flush_lines)
+        self.flush_interval = flush_interval
+        self.flush_on_phase = flush_on_phase
+        self.fsync = fsync
+        self.bytes_written = 0
+        self.flushes = 0
+
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._closed = False
+        # Holds the buffer list, not self, so the writer can still be collected
+        weakref.finalize(self, _write_remaining, path, self._buffer)
+
+    def write_header(self, lines: Iterable[str]):
+        """Truncate the file and write `lines` immediately"""
+        text = "\n".join(lines)
+        with self._lock:
+            self._buffer.clear()
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(text)
+            self.bytes_written = len(text.encode("utf-8"))
+            self._last_flush = time.monotonic()
+
+    def write(self, line: str):
+        """Buffer one line, flushing if the policy says so"""
+        with self._lock:
+            self._buffer.append(line + "\n")
+            if (
+                self._closed
+                or len(self._buffer) >= self.flush_lines
+                or (
+                    self.flush_interval is not None
+                    and time.monotonic() - self._last_flush >= self.flush_interval
+                )
+            ):
+                self._flush_locked()
+
+    def phase_boundary(self):
+        """Mark the end of a game phase"""
+        if self.flush_on_phase:
+            self.flush()
+
+    def flush(self):
+        """Append all buffered lines to the file"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(text)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        self.bytes_written += len(text.encode("utf-8"))
+        self.flushes += 1
+
+    def close(self):
+        """Flush remaining lines; later writes go straight to the file"""
+        with self._lock:
+            self._flush_locked()
+            self._closed = True
@@ -1,8 +1,9 @@
 import random
 from enum import Enum
-from dataclasses import dataclass
 from typing import List, Dict, Any
 
+from .persistent_log import PersistentLog
+
 
 class Role(Enum):
     WEREWOLF = "werewolf"
@@ -27,23 +28,387 @@ class GamePhase(Enum):
     VOTING = "voting"
 
 
-@dataclass
+# Role distribution per game type; unknown types default to twelve-like
+ROLE_PRESETS: Dict[str, List[Role]] = {
+    "six": [
+        Role.WEREWOLF,
+        Role.WEREWOLF,
+        Role.VILLAGER,
+        Role.VILLAGER,
+        Role.SEER,
+        Role.WITCH,
+    ],
+    "nine": [
+        Role.WEREWOLF,
+        Role.WEREWOLF,
+        Role.WEREWOLF,
+        Role.VILLAGER,
+        Role.VILLAGER,
+        Role.VILLAGER,
+        Role.SEER,
+        Role.WITCH,
+        Role.HUNTER,
+    ],
+    "twelve": [
+        Role.WEREWOLF,
+        Role.WEREWOLF,
+        Role.WEREWOLF,
+        Role.WEREWOLF,
+        Role.VILLAGER,
+        Role.VILLAGER,
+        Role.VILLAGER,
+        Role.VILLAGER,
+        Role.SEER,
+        Role.WITCH,
+        Role.HUNTER,
+        Role.GUARDIAN,
+    ],
+}
+
+# God roles: Seer, Witch, Guardian, Hunter
+GOD_ROLES = (Role.SEER, Role.WITCH, Role.GUARDIAN, Role.HUNTER)
+
+_ALL_ROLES = tuple(Role)
+
+
+class _AlivePlayers(list):
+    """Alive players in seating order, kept in sync with `GameState.alive_mask`
+
+    Behaves like a plain list, so callers may `.remove()` a player or
+    serialize it. For O(1) membership use `GameState.is_alive`.
+    """
+
+    __slots__ = ("_state",)
+
+    def __init__(self, state: "GameState", players=()):
+        super().__init__(players)
+        self._state = state
+
+    def remove(self, player):
+        super().remove(player)
+        self._state._clear_alive(player)
+
+    def __reduce__(self):
+        # Copies/pickles of the list alone are detached plain lists
+        return list, (list(self),)
+
+
+class _Roles(dict):
+    """Player roles, kept in sync with the role masks of `GameState`
+
+    Behaves like a plain dict; in-place writes rebuild the masks and the
+    live team counts of the owning state.
+    """
+
+    __slots__ = ("_state",)
+
+    def __init__(self, state: "GameState", roles=()):
+        super().__init__(roles)
+        self._state = state
+
+    def __reduce__(self):
+        # Copies/pickles of the dict alone are detached plain dicts
+        return dict, (dict(self),)
+
+
+def _resyncing(base: type, name: str, sync: str):
+    method = getattr(base, name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        getattr(self._state, sync)()
+        return result
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "clear",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+):
+    setattr(_AlivePlayers, _name, _resyncing(list, _name, "_sync_alive_mask"))
+
+for _name in (
+    "update",
+    "pop",
+    "popitem",
+    "clear",
+    "setdefault",
+    "__setitem__",
+    "__delitem__",
+    "__ior__",
+):
+    setattr(_Roles, _name, _resyncing(dict, _name, "_sync_roles"))
+
+
 class GameState:
-    players: List[str]
-    roles: Dict[str, Role]
-    alive_players: List[str]
-    phase: GamePhase
-    day_count: int
-    history: List[Dict[str, Any]]
-    game_log: List[str]
-    witch_poison_used: bool = False
-    witch_antidote_used: bool = False
-    guardian_last_guarded: Dict[str, str] | None = None
-    death_records: Dict[str, str] = None  # Track how each player died
-
-    def __post_init__(self):
-        if self.death_records is None:
-            self.death_records = {}
+    """Game state backed by player indices and bitmasks
+
+    Bit `i` of `alive_mask` is set while `players[i]` is alive, and
+    `role_masks[role]` has the bits of every seat holding `role`, so
+    membership tests are single `&` operations. Live team counts
+    (`werewolves_alive`, `gods_alive`, `civilians_alive`) are updated at
+    each removal, so win checks never rescan the players. `history` and
+    `game_log` are `PersistentLog`s, so `copy()` never copies log entries;
+    they are sequences but not lists, so convert them with `list()` before
+    serializing (`to_dict`, `to_checkpoint` and pickling already do).
+    `alive_players` and `roles` keep their list/dict shapes for callers and
+    resync the masks and counts on in-place writes as well as assignment.
+    """
+
+    __slots__ = (
+        "_players",
+        "_index",
+        "_roles",
+        "_role_of",
+        "role_masks",
+        "werewolf_mask",
+        "god_mask",
+        "civilian_mask",
+        "werewolves_alive",
+        "gods_alive",
+        "civilians_alive",
+        "alive_mask",
+        "_alive_players",
+        "phase",
+        "day_count",
+        "_history",
+        "_game_log",
+        "witch_poison_used",
+        "witch_antidote_used",
+        "guardian_last_guarded",
+        "death_records",
+    )
+
+    def __init__(
+        self,
+        players: List[str],
+        roles: Dict[str, Role],
+        alive_players: List[str],
+        phase: GamePhase,
+        day_count: int,
+        history: List[Dict[str, Any]],
+        game_log: List[str],
+        witch_poison_used: bool = False,
+        witch_antidote_used: bool = False,
+        guardian_last_guarded: Dict[str, str] | None = None,
+        death_records: Dict[str, str] = None,  # Track how each player died
+    ):
+        self.players = players
+        self.alive_mask = 0
+        self.roles = roles
+        self.alive_players = alive_players
+        self.phase = phase
+        self.day_count = day_count
+        self.history = history
+        self.game_log = game_log
+        self.witch_poison_used = witch_poison_used
+        self.witch_antidote_used = witch_antidote_used
+        self.guardian_last_guarded = guardian_last_guarded
+        self.death_records = {} if death_records is None else death_records
+
+    # --- players / roles / alive -------------------------------------------
+
+    @property
+    def players(self) -> List[str]:
+        return self._players
+
+    @players.setter
+    def players(self, players: List[str]):
+        self._players = players
+        self._index = {p: i for i, p in enumerate(players)}
+
+    @property
+    def roles(self) -> Dict[str, Role]:
+        return self._roles
+
+    @roles.setter
+    def roles(self, roles: Dict[str, Role]):
+        self._roles = _Roles(self, roles)
+        self._sync_roles()
+
+    def _sync_roles(self):
+        roles = self._roles
+        self._role_of = [roles.get(p) for p in self._players]
+        self.role_masks = dict.fromkeys(_ALL_ROLES, 0)
+        for i, role in enumerate(self._role_of):
+            if role is not None:
+                self.role_masks[role] |= 1 << i
+        # Team masks, precomputed so win checks do no Role hashing
+        self.werewolf_mask = self.role_masks[Role.WEREWOLF]
+        self.civilian_mask = self.role_masks[Role.VILLAGER]
+        self.god_mask = 0
+        for role in GOD_ROLES:
+            self.god_mask |= self.role_masks[role]
+        self._recount()
+
+    @property
+    def history(self) -> PersistentLog:
+        return self._history
+
+    @history.setter
+    def history(self, entries: List[Dict[str, Any]]):
+        self._history = (
+            entries if isinstance(entries, PersistentLog) else PersistentLog(entries)
+        )
+
+    @property
+    def game_log(self) -> PersistentLog:
+        return self._game_log
+
+    @game_log.setter
+    def game_log(self, entries: List[str]):
+        self._game_log = (
+            entries if isinstance(entries, PersistentLog) else PersistentLog(entries)
+        )
+
+    @property
+    def alive_players(self) -> List[str]:
+        return self._alive_players
+
+    @alive_players.setter
+    def alive_players(self, players: List[str]):
+        self._alive_players = _AlivePlayers(self, players)
+        self._sync_alive_mask()
+
+    def _sync_alive_mask(self):
+        mask = 0
+        for p in self._alive_players:
+            i = self._index.get(p)
+            if i is not None:
+                mask |= 1 << i
+        self.alive_mask = mask
+        self._recount()
+
+    def _recount(self):
+        alive = self.alive_mask
+        self.werewolves_alive = (alive & self.werewolf_mask).bit_count()
+        self.gods_alive = (alive & self.god_mask).bit_count()
+        self.civilians_alive = (alive & self.civilian_mask).bit_count()
+
+    def _clear_alive(self, player: str):
+        i = self._index.get(player)
+        if i is None or not self.alive_mask >> i & 1:
+            return
+        bit = 1 << i
+        self.alive_mask &= ~bit
+        if bit & self.werewolf_mask:
+            self.werewolves_alive -= 1
+        elif bit & self.god_mask:
+            self.gods_alive -= 1
+        elif bit & self.civilian_mask:
+            self.civilians_alive -= 1
+
+    def index_of(self, player: str) -> int:
+        """Seat index of `player` (-1 if unknown)"""
+        return self._index.get(player, -1)
+
+    def role_of(self, player: str) -> Role | None:
+        i = self._index.get(player)
+        return self._role_of[i] if i is not None else None
+
+    def is_alive(self, player: str) -> bool:
+        i = self._index.get(player)
+        return i is not None and bool(self.alive_mask >> i & 1)
+
+    def kill(self, player: str) -> bool:
+        """Remove `player` from the alive set. Returns False if already dead"""
+        if not self.is_alive(player):
+            return False
+        self._alive_players.remove(player)
+        return True
+
+    def alive_mask_with_role(self, *roles: Role) -> int:
+        mask = 0
+        for role in roles:
+            mask |= self.role_masks[role]
+        return self.alive_mask & mask
+
+    def count_alive(self, *roles: Role) -> int:
+        """Number of alive players holding any of `roles` (all if none given)"""
+        if not roles:
+            return self.alive_mask.bit_count()
+        return self.alive_mask_with_role(*roles).bit_count()
+
+    def alive_with_role(self, *roles: Role) -> List[str]:
+        """Alive players holding any of `roles`, in seating order"""
+        mask = self.alive_mask_with_role(*roles)
+        return [p for i, p in enumerate(self._players) if mask >> i & 1]
+
+    # --- copying -----------------------------------------------------------
+
+    def copy(self) -> "GameState":
+        """Independent copy for search/rollouts, in O(players)
+
+        Players and role masks are shared (role changes rebuild rather than
+        mutate them), logs are forked in O(1), and roles, alive state and
+        records are copied.
+        """
+        clone = GameState.__new__(GameState)
+        clone._players = self._players
+        clone._index = self._index
+        clone._roles = _Roles(clone, self._roles)
+        clone._role_of = self._role_of
+        clone.role_masks = self.role_masks
+        clone.werewolf_mask = self.werewolf_mask
+        clone.god_mask = self.god_mask
+        clone.civilian_mask = self.civilian_mask
+        clone.werewolves_alive = self.werewolves_alive
+        clone.gods_alive = self.gods_alive
+        clone.civilians_alive = self.civilians_alive
+        clone.alive_mask = self.alive_mask
+        clone._alive_players = _AlivePlayers(clone, self._alive_players)
+        clone.phase = self.phase
+        clone.day_count = self.day_count
+        clone._history = self._history.fork()
+        clone._game_log = self._game_log.fork()
+        clone.witch_poison_used = self.witch_poison_used
+        clone.witch_antidote_used = self.witch_antidote_used
+        clone.guardian_last_guarded = (
+            dict(self.guardian_last_guarded)
+            if self.guardian_last_guarded is not None
+            else None
+        )
+        clone.death_records = dict(self.death_records)
+        return clone
+
+    __copy__ = copy
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "players": self._players,
+            "roles": dict(self._roles),
+            "alive_players": list(self._alive_players),
+            "phase": self.phase,
+            "day_count": self.day_count,
+            "history": list(self.history),
+            "game_log": list(self.game_log),
+            "witch_poison_used": self.witch_poison_used,
+            "witch_antidote_used": self.witch_antidote_used,
+            "guardian_last_guarded": self.guardian_last_guarded,
+            "death_records": self.death_records,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(**state)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return self.__getstate__() == other.__getstate__()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.__getstate__().items())
+        return f"GameState({fields})"
 
 
 class WerewolfGame:
@@ -56,7 +421,19 @@ class WerewolfGame:
     - determine game end conditions
     """
 
-    def __init__(self, player_names: List[str], game_type: str = "six"):
+    def __init__(
+        self,
+        player_names: List[str],
+        game_type: str = "six",
+        rng: random.Random | None = None,
+    ):
+        """
+        Args:
+            player_names: Seat names
+            game_type: Role preset (six, nine, twelve)
+            rng: Random source for role assignment (default: the `random`
+                module's global generator)
+        """
         if len(player_names) < 4:
             raise ValueError("Need at least 4 players to play")
 
@@ -74,48 +451,13 @@ class WerewolfGame:
             witch_antidote_used=False,
         )
 
-        self._assign_roles()
+        self._assign_roles(rng or random)
 
-    def _assign_roles(self):
+    def _assign_roles(self, rng=random):
         """Assign roles based on `game_type` presets."""
-        if self.game_type == "six":
-            roles = [
-                Role.WEREWOLF,
-                Role.WEREWOLF,
-                Role.VILLAGER,
-                Role.VILLAGER,
-                Role.SEER,
-                Role.WITCH,
-            ]
-        elif self.game_type == "nine":
-            roles = [
-                Role.WEREWOLF,
-                Role.WEREWOLF,
-                Role.WEREWOLF,
-                Role.VILLAGER,
-                Role.VILLAGER,
-                Role.VILLAGER,
-                Role.SEER,
-                Role.WITCH,
-                Role.HUNTER,
-            ]
-        else:  # default to twelve-like
-            roles = [
-                Role.WEREWOLF,
-                Role.WEREWOLF,
-                Role.WEREWOLF,
-                Role.WEREWOLF,
-                Role.VILLAGER,
-                Role.VILLAGER,
-                Role.VILLAGER,
-                Role.VILLAGER,
-                Role.SEER,
-                Role.WITCH,
-                Role.HUNTER,
-                Role.GUARDIAN,
-            ]
-
-        random.shuffle(roles)
+        roles = list(ROLE_PRESETS.get(self.game_type, ROLE_PRESETS["twelve"]))
+
+        rng.shuffle(roles)
         # If there are more players than roles in the selected preset, fill extras with villagers
         if len(self.player_names) > len(roles):
             roles.extend([Role.VILLAGER] * (len(self.player_names) - len(roles)))
@@ -124,19 +466,15 @@ class WerewolfGame:
         self.state.game_log.append(f"Roles assigned: {[r.value for r in roles]}")
 
     def _get_players_with_role(self, role: Role) -> List[str]:
-        return [p for p in self.state.alive_players if self.state.roles.get(p) == role]
+        return self.state.alive_with_role(role)
 
     def _process_werewolf_action(self, agent_actions: Dict[str, str]) -> str:
         """Werewolves choose a target by majority among their picks. Returns target or empty string."""
-        werewolves = [
-            p
-            for p in self.state.alive_players
-            if self.state.roles.get(p) == Role.WEREWOLF
-        ]
+        werewolves = self.state.alive_with_role(Role.WEREWOLF)
         votes: Dict[str, int] = {}
         for w in werewolves:
             target = agent_actions.get(w)
-            if target and target in self.state.alive_players and target != w:
+            if target and self.state.is_alive(target) and target != w:
                 votes[target] = votes.get(target, 0) + 1
 
         if not votes:
@@ -148,12 +486,10 @@ class WerewolfGame:
 
     def _process_seer_action(self, agent_actions: Dict[str, str]) -> Dict[str, Role]:
         results: Dict[str, Role] = {}
-        seers = [
-            p for p in self.state.alive_players if self.state.roles.get(p) == Role.SEER
-        ]
+        seers = self.state.alive_with_role(Role.SEER)
         for s in seers:
             target = agent_actions.get(s)
-            if target and target in self.state.alive_players:
+            if target and self.state.is_alive(target):
                 results[s] = self.state.roles.get(target)
                 self.state.game_log.append(
                     f"Seer {s} checked {target}: {self.state.roles.get(target).value}"
@@ -163,11 +499,12 @@ class WerewolfGame:
     def _process_witch_action(
         self, agent_actions: Dict[str, str], night_victim: str | None
     ) -> Dict[str, Any]:
-        """Witch can save the night victim (antidote) or poison someone (once each)."""
+        """Witch can save the night victim (antidote) or poison someone (once each).
+
+        At most one potion per night: each witch has a single action.
+        """
         res: Dict[str, Any] = {}
-        witches = [
-            p for p in self.state.alive_players if self.state.roles.get(p) == Role.WITCH
-        ]
+        witches = self.state.alive_with_role(Role.WITCH)
         for w in witches:
             action = agent_actions.get(w)
             if not action:
@@ -181,7 +518,7 @@ class WerewolfGame:
                 )
             elif action.startswith("poison:") and not self.state.witch_poison_used:
                 _, _, target = action.partition(":")
-                if target in self.state.alive_players:
+                if self.state.is_alive(target):
                     res["poisoned"] = target
                     self.state.witch_poison_used = True
                     self.state.game_log.append(f"Witch {w} poisoned {target}")
@@ -194,17 +531,13 @@ class WerewolfGame:
     def _process_guardian_action(self, agent_actions: Dict[str, str]) -> Dict[str, Any]:
         """Guardian can protect one player per night. Cannot protect the same player two nights in a row."""
         res: Dict[str, Any] = {}
-        guardians = [
-            p
-            for p in self.state.alive_players
-            if self.state.roles.get(p) == Role.GUARDIAN
-        ]
+        guardians = self.state.alive_with_role(Role.GUARDIAN)
         if self.state.guardian_last_guarded is None:
             self.state.guardian_last_guarded = {}
 
         for g in guardians:
             target = agent_actions.get(g)
-            if not target or target not in self.state.alive_players:
+            if not target or not self.state.is_alive(target):
                 self.state.game_log.append(
                     f"Guardian {g} did not choose a valid target"
                 )
@@ -227,12 +560,9 @@ class WerewolfGame:
 
     def _collect_votes(self, agent_actions: Dict[str, str]) -> Dict[str, str]:
         votes: Dict[str, str] = {}
+        is_alive = self.state.is_alive
         for p, action in agent_actions.items():
-            if (
-                p in self.state.alive_players
-                and action in self.state.alive_players
-                and action != p
-            ):
+            if is_alive(p) and is_alive(action) and action != p:
                 votes[p] = action
         return votes
 
@@ -278,8 +608,7 @@ class WerewolfGame:
         # Handle poison first (poison always kills)
         if "poisoned" in witch_result:
             poisoned = witch_result["poisoned"]
-            if poisoned in self.state.alive_players:
-                self.state.alive_players.remove(poisoned)
+            if self.state.kill(poisoned):
                 self.state.death_records[poisoned] = "witch_poison"
                 self.state.game_log.append(f"{poisoned} died by witch poison")
                 night_result["poisoned_player"] = poisoned
@@ -306,8 +635,7 @@ class WerewolfGame:
                 self.state.game_log.append(f"{victim} was saved by witch")
 
         # Apply final victim removal (if any)
-        if final_victim and final_victim in self.state.alive_players:
-            self.state.alive_players.remove(final_victim)
+        if final_victim and self.state.kill(final_victim):
             self.state.death_records[final_victim] = "werewolf_kill"
             self.state.game_log.append(f"{final_victim} was killed at night")
             night_result["night_death"] = final_victim
@@ -322,8 +650,7 @@ class WerewolfGame:
         day_result: Dict[str, Any] = {"votes": votes, "eliminated": eliminated}
 
         if eliminated:
-            if eliminated in self.state.alive_players:
-                self.state.alive_players.remove(eliminated)
+            if self.state.kill(eliminated):
                 self.state.death_records[eliminated] = "voted_out"
                 self.state.game_log.append(f"{eliminated} was voted out during the day")
 
@@ -331,6 +658,14 @@ class WerewolfGame:
         self.state.phase = GamePhase.NIGHT
         return day_result
 
+    def execute_hunter_shot(self, hunter: str, target: str) -> bool:
+        """Hunter takes `target` down with them. Returns True if target died."""
+        if not target or not self.state.kill(target):
+            return False
+        self.state.death_records[target] = "hunter_shot"
+        self.state.game_log.append(f"Hunter {hunter} shot {target}")
+        return True
+
     def check_game_end(self) -> tuple[bool, str]:
         """Return (ended: bool, winner: 'werewolves'|'villagers'|'').
 
@@ -339,29 +674,12 @@ class WerewolfGame:
         - 9 and 12-player games: Werewolves win if all civilians OR all gods are eliminated
         - Villagers win if all werewolves are eliminated
         """
-        werewolves_alive = [
-            p
-            for p in self.state.alive_players
-            if self.state.roles.get(p) == Role.WEREWOLF
-        ]
-
-        # God roles: Seer, Witch, Guardian, Hunter
-        gods_alive = [
-            p
-            for p in self.state.alive_players
-            if self.state.roles.get(p)
-            in [Role.SEER, Role.WITCH, Role.GUARDIAN, Role.HUNTER]
-        ]
-
-        # Regular villagers
-        civilians_alive = [
-            p
-            for p in self.state.alive_players
-            if self.state.roles.get(p) == Role.VILLAGER
-        ]
+        werewolves_alive = self.state.werewolves_alive
+        gods_alive = self.state.gods_alive
+        civilians_alive = self.state.civilians_alive
 
         # Villagers win if all werewolves are eliminated
-        if len(werewolves_alive) == 0:
+        if werewolves_alive == 0:
             return True, "villagers"
 
         # Werewolf victory conditions based on game type
@@ -369,25 +687,88 @@ class WerewolfGame:
 
         if total_players == 6:
             # 6-player: Must eliminate ALL civilians AND gods
-            if len(civilians_alive) == 0 and len(gods_alive) == 0:
+            if civilians_alive == 0 and gods_alive == 0:
                 return True, "werewolves"
         else:
             # 9 and 12-player: Eliminate all civilians OR all gods
-            if len(civilians_alive) == 0 or len(gods_alive) == 0:
+            if civilians_alive == 0 or gods_alive == 0:
                 return True, "werewolves"
 
         # Traditional fallback: werewolves >= good players
-        if len(werewolves_alive) >= len(civilians_alive) + len(gods_alive):
+        if werewolves_alive >= civilians_alive + gods_alive:
             return True, "werewolves"
 
         return False, ""
 
+    def snapshot(self) -> GameState:
+        """Capture the current state for a later `restore()`, in O(players)"""
+        return self.state.copy()
+
+    def restore(self, snapshot: GameState):
+        """Return to a state captured by `snapshot()`
+
+        The snapshot itself is left untouched, so it can be restored again.
+        """
+        self.state = snapshot.copy()
+
+    def fork(self) -> "WerewolfGame":
+        """Independent game continuing from the current state
+
+        Unlike constructing a new game, no roles are reassigned and the global
+        RNG is not consumed.
+        """
+        clone = WerewolfGame.__new__(WerewolfGame)
+        clone.player_names = self.player_names
+        clone.game_type = self.game_type
+        clone.state = self.state.copy()
+        return clone
+
+    def to_checkpoint(self) -> Dict[str, Any]:
+        """JSON-serializable full game state (see `from_checkpoint`)"""
+        state = self.state
+        return {
+            "player_names": list(self.player_names),
+            "game_type": self.game_type,
+            "players": list(state.players),
+            "roles": {p: r.value for p, r in state.roles.items()},
+            "alive_players": list(state.alive_players),
+            "phase": state.phase.value,
+            "day_count": state.day_count,
+            "history": list(state.history),
+            "game_log": list(state.game_log),
+            "witch_poison_used": state.witch_poison_used,
+            "witch_antidote_used": state.witch_antidote_used,
+            "guardian_last_guarded": state.guardian_last_guarded,
+            "death_records": dict(state.death_records),
+        }
+
+    @classmethod
+    def from_checkpoint(cls, data: Dict[str, Any]) -> "WerewolfGame":
+        """Rebuild a game from `to_checkpoint` output without reassigning roles"""
+        game = cls.__new__(cls)
+        game.player_names = list(data["player_names"])
+        game.game_type = data["game_type"]
+        game.state = GameState(
+            players=list(data["players"]),
+            roles={p: Role(r) for p, r in data["roles"].items()},
+            alive_players=list(data["alive_players"]),
+            phase=GamePhase(data["phase"]),
+            day_count=data["day_count"],
+            history=data["history"],
+            game_log=data["game_log"],
+            witch_poison_used=data["witch_poison_used"],
+            witch_antidote_used=data["witch_antidote_used"],
+            guardian_last_guarded=data["guardian_last_guarded"],
+            death_records=dict(data["death_records"]),
+        )
+        return game
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "players": self.state.players,
             "roles": {p: r.value for p, r in self.state.roles.items()},
-            "alive": self.state.alive_players,
+            "alive": list(self.state.alive_players),
             "phase": self.state.phase.value,
             "day_count": self.state.day_count,
-            "game_log": self.state.game_log,
+            "game_log": list(self.state.game_log),
         }